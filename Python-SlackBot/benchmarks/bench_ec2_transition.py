@@ -0,0 +1,65 @@
+"""EC2 시작/중지를 인스턴스마다 호출하는 방식과 EC2StateTransition의 묶음 호출 방식을 moto로 비교합니다.
+
+실행: python benchmarks/bench_ec2_transition.py [인스턴스 수]
+moto가 필요합니다. (pip install "moto[ec2]")
+"""
+import os
+import sys
+import time
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boto3
+from moto import mock_aws
+from utils.aws_mutation import EC2StateTransition
+
+def per_instance_transition(ec2, action: str, instances: list[dict]):
+    """변경 전 방식: 예약(reservation)마다 인스턴스 하나씩 API를 호출합니다."""
+    for instance in instances:
+        if action == 'stop' and instance['State']['Name'] == 'running':
+            ec2.stop_instances(InstanceIds=[instance['InstanceId']])
+        elif action == 'start' and instance['State']['Name'] == 'stopped':
+            ec2.start_instances(InstanceIds=[instance['InstanceId']])
+
+def describe_all(ec2) -> list[dict]:
+    paginator = ec2.get_paginator('describe_instances')
+    return [
+        instance
+        for page in paginator.paginate()
+        for reservation in page['Reservations']
+        for instance in reservation['Instances']
+    ]
+
+def measure(ec2, calls: list, func, action: str) -> tuple[int, float]:
+    instances = describe_all(ec2)
+    calls.clear()
+    started = time.perf_counter()
+    func(ec2, action, instances)
+    return len(calls), time.perf_counter() - started
+
+def main(count: int):
+    for key in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN'):
+        os.environ.setdefault(key, 'testing')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'ap-northeast-2')
+
+    with mock_aws():
+        ec2 = boto3.client('ec2')
+        # 실제 API 호출 수를 셉니다.
+        calls = []
+        ec2.meta.events.register('before-call.ec2.StartInstances', lambda **kwargs: calls.append(1))
+        ec2.meta.events.register('before-call.ec2.StopInstances', lambda **kwargs: calls.append(1))
+
+        image_id = ec2.describe_images(Owners=['amazon'])['Images'][0]['ImageId']
+        for offset in range(0, count, 100):
+            ec2.run_instances(ImageId=image_id, MinCount=min(100, count - offset), MaxCount=min(100, count - offset), InstanceType='t3.micro')
+
+        transition = EC2StateTransition(logging.getLogger(__name__))
+        print(f'인스턴스 {count}개')
+        for name, func in (('인스턴스별 호출', per_instance_transition), ('묶음 호출', transition.transition)):
+            for action in ('stop', 'start'):
+                call_count, elapsed = measure(ec2, calls, func, action)
+                print(f'{name:10} {action:5}: API 호출 {call_count:4}회, {elapsed:.3f}s, 호출당 {elapsed / max(call_count, 1) * 1000:.2f}ms')
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,63 @@
+"""대시보드의 경고 라벨과 네트워크 트래픽 표시 문자열을 행마다 apply로 만드는 방식과 벡터화한 방식을 비교합니다.
+
+실행: python benchmarks/bench_format_traffic.py [행 수]
+add_warning_labels와 format_traffic 각각에 대해 두 방식의 결과가 같은지 확인한 뒤 시간을 표시합니다.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from utils.dashboard_format import add_warning_labels, format_traffic
+
+def format_traffic_value(value: float) -> str:
+    """변경 전 방식: 값 하나를 단위 목록과 차례로 비교하여 문자열로 바꿉니다."""
+    units = [('PB', 1e15), ('T', 1e12), ('G', 1e9), ('M', 1e6), ('K', 1e3)]
+    for unit, threshold in units:
+        if value >= threshold:
+            return f'{value / threshold:.2f} {unit}'
+    return f'{value:.2f} B'
+
+def add_warning_labels_apply(df: pd.DataFrame) -> pd.DataFrame:
+    """변경 전 방식: 행마다 lambda로 경고 단계를 정합니다."""
+    df['CPU 경고'] = df['CPU 사용량'].apply(lambda x: '위험' if x >= 90 else ('경고' if x >= 75 else '정상'))
+    df['RAM 경고'] = df['RAM 사용량'].apply(lambda x: '위험' if x >= 90 else ('경고' if x >= 75 else '정상'))
+    return df
+
+def measure(func, *args) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def count_mismatches(before: pd.Series, after: pd.Series) -> int:
+    # 범주형 결과는 문자열로 바꿔 비교합니다.
+    return int((before != after.astype(str)).sum())
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    rng = np.random.default_rng(0)
+    usage = pd.DataFrame({'CPU 사용량': rng.uniform(0, 100, count), 'RAM 사용량': rng.uniform(0, 100, count)})
+    # 바이트부터 테라바이트까지 고르게 분포하는 값
+    traffic = pd.Series(10 ** rng.uniform(0, 13, count))
+
+    labels_before, labels_apply_time = measure(add_warning_labels_apply, usage.copy())
+    labels_after, labels_vectorized_time = measure(add_warning_labels, usage.copy())
+    label_mismatches = sum(count_mismatches(labels_before[column], labels_after[column]) for column in ('CPU 경고', 'RAM 경고'))
+
+    traffic_before, traffic_apply_time = measure(lambda series: series.apply(format_traffic_value), traffic)
+    traffic_after, traffic_vectorized_time = measure(format_traffic, traffic)
+    traffic_mismatches = count_mismatches(traffic_before, traffic_after)
+
+    print(f'{count:,}행')
+    print(f'add_warning_labels - Series.apply: {labels_apply_time:.3f}초, np.select: {labels_vectorized_time:.3f}초 '
+          f'({labels_apply_time / labels_vectorized_time:.1f}배), 결과가 다른 행: {label_mismatches}')
+    print(f'format_traffic - Series.apply: {traffic_apply_time:.3f}초, 벡터화: {traffic_vectorized_time:.3f}초 '
+          f'({traffic_apply_time / traffic_vectorized_time:.1f}배), 결과가 다른 행: {traffic_mismatches}')
+    print(f'format_traffic 범주 수: {len(traffic_after.cat.categories):,}')
+
+if __name__ == '__main__':
+    main()
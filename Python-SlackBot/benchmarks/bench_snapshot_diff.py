@@ -0,0 +1,91 @@
+"""monitor_instances_status의 EC2 비교를 이전의 필드별 반복문 방식과 SnapshotDiffer로 비교합니다.
+
+실행: python benchmarks/bench_snapshot_diff.py [리소스 수] [반복 횟수]
+두 스냅샷 사이에 상태, IP, 지표가 일부 바뀌고 인스턴스가 일부 추가/제거된 경우를 측정합니다.
+"""
+import os
+import sys
+import time
+import random
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.aws_status import EC2Status
+from utils.snapshot_diff import SnapshotDiffer
+
+ALERT_VALUE = 80
+
+def make_snapshot(count: int, seed: int, offset: int = 0) -> list[EC2Status]:
+    rng = random.Random(seed)
+    return [
+        EC2Status(
+            ec2_id=f'i-{index:017x}',
+            state='running' if rng.random() > 0.05 else 'stopped',
+            launch_time='2024-01-01 00:00:00',
+            instance_type='t3.micro',
+            private_ip=f'10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}',
+            public_ip=None if rng.random() > 0.01 else '3.3.3.3',
+            cpu=None if rng.random() < 0.01 else rng.random() * 100,
+            ram=rng.random() * 100,
+            network_in=rng.random() * 1e6,
+            network_out=rng.random() * 1e6,
+            name=f'node-{index}'
+        )
+        for index in range(offset, offset + count)
+    ]
+
+def field_loop_diff(old_records: list[EC2Status], new_records: list[EC2Status]) -> int:
+    """변경 전 방식: 공통 인스턴스의 모든 필드를 반복하며 알림 조건을 확인합니다. 알림 수를 반환합니다."""
+    old_by_id = {ec2.ec2_id: ec2 for ec2 in old_records}
+    new_by_id = {ec2.ec2_id: ec2 for ec2 in new_records}
+    count = 0
+
+    for ec2_id, ec2 in new_by_id.items():
+        if ec2_id not in old_by_id:
+            count += 1
+            continue
+
+        old_ec2 = old_by_id[ec2_id]
+        for field in fields(ec2):
+            value = getattr(ec2, field.name)
+            old_value = getattr(old_ec2, field.name)
+            if old_value == value:
+                continue
+
+            if field.name in ('cpu', 'ram'):
+                if not value or ALERT_VALUE <= value:
+                    count += 1
+            elif field.name not in ('network_in', 'network_out'):
+                count += 1
+
+    count += sum(1 for ec2_id in old_by_id if ec2_id not in new_by_id)
+    return count
+
+def measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    # 1%는 제거되고 1%는 새로 추가된 스냅샷
+    old_records = make_snapshot(count, seed=1)
+    new_records = make_snapshot(count, seed=2, offset=count // 100)
+
+    differ = SnapshotDiffer('EC2', EC2Status.METRIC_FIELDS, EC2Status.ALERT_FIELDS, {'cpu': ALERT_VALUE, 'ram': ALERT_VALUE}, hysteresis=5)
+    differ.diff([], old_records)
+
+    loop_time = measure(lambda: field_loop_diff(old_records, new_records), repeat)
+    differ_time = measure(lambda: differ.diff(old_records, new_records), repeat)
+    events = differ.diff(old_records, new_records)
+
+    print(f'리소스 {count}개, {repeat}회 평균')
+    print(f'필드별 반복문: {loop_time * 1000:.1f}ms')
+    print(f'SnapshotDiffer: {differ_time * 1000:.1f}ms (이벤트 {len(events)}개)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""상태 레코드를 행마다 execute하는 방식과 StatusStore의 executemany 방식을 비교합니다.
+
+실행: python benchmarks/bench_status_store.py [EC2 레코드 수] [반복 횟수]
+결과는 1,000행당 저장 시간으로 표시합니다.
+
+MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, MYSQL_USER, MYSQL_PASSWORD가 있으면 그 MySQL의 bench_ec2_status 테이블에,
+없으면 임시 디렉터리의 SQLite 파일에 저장합니다. SQLite는 왕복 지연과 연결 비용이 없어 MySQL보다 차이가 작게 나옵니다.
+"""
+import os
+import sys
+import time
+import logging
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.aws_status import EC2Status, to_sql_rows
+from utils.status_store import StatusStore, mysql_pool_factory
+
+def make_records(count: int) -> list[EC2Status]:
+    return [
+        EC2Status(
+            ec2_id=f'i-{index:017x}',
+            state='running',
+            launch_time='2024-01-01 00:00:00',
+            instance_type='t3.micro',
+            private_ip=f'10.0.{index // 256 % 256}.{index % 256}',
+            public_ip=None,
+            cpu=12.5,
+            ram=40.0,
+            network_in=1024.0,
+            network_out=2048.0,
+            name=f'node-{index}'
+        )
+        for index in range(count)
+    ]
+
+class BenchStatusStore(StatusStore):
+    """운영 테이블을 건드리지 않도록 bench_ 테이블에 저장합니다."""
+    TABLES = {'ec2': ('bench_ec2_status', StatusStore.TABLES['ec2'][1])}
+
+def create_table(connect):
+    table, columns = BenchStatusStore.TABLES['ec2']
+    connection = connect()
+    cursor = connection.cursor()
+    cursor.execute(f'DROP TABLE IF EXISTS {table}')
+    cursor.execute(f"CREATE TABLE {table} ({', '.join(f'{column} VARCHAR(64)' for column in columns)}, timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+    connection.commit()
+    cursor.close()
+    connection.close()
+
+def per_row_insert(connect, placeholder: str, records: list[EC2Status]) -> int:
+    """변경 전 방식: 주기마다 새로 연결하고 행마다 execute합니다."""
+    table, columns = BenchStatusStore.TABLES['ec2']
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})"
+
+    connection = connect()
+    cursor = connection.cursor()
+    rows = to_sql_rows(records)
+    for row in rows:
+        cursor.execute(query, row)
+    connection.commit()
+    cursor.close()
+    connection.close()
+    return len(rows)
+
+def measure(func, repeat: int) -> tuple[int, float]:
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows += func()
+    return rows, time.perf_counter() - started
+
+def run(connect, pooled_connect, placeholder: str, records: list[EC2Status], repeat: int) -> dict:
+    create_table(connect)
+    store = BenchStatusStore(logging.getLogger(__name__), pooled_connect, placeholder=placeholder)
+    return {
+        '행마다 execute': measure(lambda: per_row_insert(connect, placeholder, records), repeat),
+        'StatusStore.write': measure(lambda: store.write({'ec2': records}), repeat)
+    }
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    records = make_records(count)
+
+    if 'MYSQL_HOST' in os.environ:
+        import mysql.connector
+
+        mysql_config = {
+            'host': os.environ['MYSQL_HOST'],
+            'port': int(os.environ.get('MYSQL_PORT', 3306)),
+            'database': os.environ['MYSQL_DATABASE'],
+            'user': os.environ['MYSQL_USER'],
+            'password': os.environ['MYSQL_PASSWORD']
+        }
+        backend = 'MySQL'
+        results = run(lambda: mysql.connector.connect(**mysql_config), mysql_pool_factory(mysql_config, 'bench'), '%s', records, repeat)
+    else:
+        backend = 'SQLite'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'status.db')
+            connect = lambda: sqlite3.connect(path)
+            results = run(connect, connect, '?', records, repeat)
+
+    print(f'{backend}, EC2 레코드 {count}개, {repeat}회')
+    for name, (rows, elapsed) in results.items():
+        print(f'{name}: 1,000행당 {elapsed / rows * 1000 * 1000:.2f}ms ({rows}행, {elapsed:.3f}초)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""gunicorn으로 실행한 봇에 Slack 요청을 동시에 보내 응답 시간, 시작 시간, 종료 시간을 측정합니다.
+
+실행: python benchmarks/load_test_gunicorn.py [요청 수] [동시 요청 수] [Slack 응답 지연(초)]
+
+gunicorn.conf.py와 wsgi:app을 그대로 실행하고, Slack API와 response_url은 이 스크립트의 가짜 Slack 서버로 보냅니다.
+SCHEDULED_JOBS=false로 실행하므로 MySQL에는 연결하지 않습니다. 조회 명령은 AWS를 호출하므로
+moto 서버(moto_server -p 5000)를 띄우고 AWS_ENDPOINT_URL=http://127.0.0.1:5000 을 지정하거나 테스트 계정의 자격 증명을 사용합니다.
+
+측정 항목:
+- 시작: gunicorn 실행부터 첫 HTTP 응답까지의 시간 (작업 프로세스 초기화가 AWS 조회를 기다리지 않는지)
+- 응답: 슬래시 명령과 조회 버튼 요청의 응답 시간 분포, Slack의 3초 제한을 넘은 요청 수
+- 종료: SIGTERM부터 프로세스 종료까지의 시간과 그때까지 가짜 Slack 서버가 받은 메시지 수
+"""
+import os
+import sys
+import json
+import time
+import signal
+import threading
+import subprocess
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = int(os.environ.get('LOAD_TEST_PORT', 18765))
+SLACK_TIMEOUT = 3
+
+class FakeSlack(BaseHTTPRequestHandler):
+    """chat.postMessage, 파일 업로드, response_url 요청에 성공으로 응답하고 경로별 요청 수를 셉니다."""
+    protocol_version = 'HTTP/1.1'
+    delay = 0.3
+    counts = collections.Counter()
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.delay)
+
+        path = self.path.rsplit('/', 1)[-1] if self.path.startswith('/api/') else self.path.split('/')[1]
+        with self.lock:
+            self.counts[path] += 1
+
+        body = {'ok': True}
+        if path == 'files.getUploadURLExternal':
+            body.update(upload_url=f'http://127.0.0.1:{self.server.server_port}/upload/F1', file_id='F1')
+        elif path == 'files.completeUploadExternal':
+            body['files'] = [{'id': 'F1'}]
+        data = json.dumps(body).encode()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+def start_fake_slack(delay: float) -> ThreadingHTTPServer:
+    FakeSlack.delay = delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSlack)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def start_gunicorn(slack_url: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        PORT=str(PORT),
+        SLACK_API_URL=f'{slack_url}/api/',
+        SCHEDULED_JOBS='false',
+        SCHEDULER_LOCK_FILE=os.path.join(ROOT, '.load-test-scheduler.lock'),
+        GRACEFUL_TIMEOUT=os.environ.get('GRACEFUL_TIMEOUT', '30')
+    )
+    for name, value in {
+        'CHANNEL_ID': 'C-LOADTEST', 'OAUTH_TOKEN': 'xoxb-load-test', 'LOG_LEVEL': 'INFO',
+        'MYSQL_HOST': '127.0.0.1', 'MYSQL_PORT': '3306', 'MYSQL_DATABASE': 'load_test', 'MYSQL_USER': 'load_test', 'MYSQL_PASSWORD': 'load_test'
+    }.items():
+        env.setdefault(name, value)
+
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+def wait_until_ready(server: subprocess.Popen, base_url: str, timeout: float = 60) -> float:
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f'gunicorn이 시작하지 못하고 종료되었습니다.\n{server.stdout.read()[-2000:]}')
+        try:
+            requests.get(base_url, timeout=0.5)
+            return time.perf_counter() - started
+        except requests.RequestException:
+            time.sleep(0.1)
+    raise TimeoutError(f'{timeout}초 안에 gunicorn이 응답하지 않았습니다.')
+
+def send_request(base_url: str, slack_url: str, index: int) -> tuple[int, float]:
+    """홀수 번째는 슬래시 명령, 짝수 번째는 조회 버튼 요청을 보냅니다."""
+    response_url = f'{slack_url}/response/{index}'
+    started = time.perf_counter()
+    if index % 2:
+        response = requests.post(f'{base_url}/team1-slack/commands', data={'command': '/all-instance', 'text': '', 'response_url': response_url})
+    else:
+        payload = {'response_url': response_url, 'channel': {'id': f'C-LOADTEST-{index % 8}'}, 'actions': [{'value': '/all-instance,status'}]}
+        response = requests.post(f'{base_url}/team1-slack/interactive-endpoint', data={'payload': json.dumps(payload)})
+    return response.status_code, time.perf_counter() - started
+
+def percentile(values: list[float], ratio: float) -> float:
+    return values[min(int(len(values) * ratio), len(values) - 1)]
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.3
+
+    slack = start_fake_slack(delay)
+    slack_url = f'http://127.0.0.1:{slack.server_port}'
+    base_url = f'http://127.0.0.1:{PORT}'
+
+    started = time.perf_counter()
+    server = start_gunicorn(slack_url)
+    try:
+        boot_time = wait_until_ready(server, base_url)
+
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = list(executor.map(lambda index: send_request(base_url, slack_url, index), range(count)))
+        latencies = sorted(elapsed for _, elapsed in results)
+
+        # 대기열에 들어간 명령이 끝날 시간을 조금 준 뒤 종료합니다.
+        time.sleep(1)
+        stop_started = time.perf_counter()
+        server.send_signal(signal.SIGTERM)
+        output, _ = server.communicate(timeout=120)
+        stop_time = time.perf_counter() - stop_started
+    finally:
+        if server.poll() is None:
+            server.kill()
+        slack.shutdown()
+
+    print(f'시작: {boot_time:.2f}초 (실행부터 {time.perf_counter() - started:.1f}초 동안 측정)')
+    print(f'응답: {count}건, 동시 {concurrency}건, 상태 코드 {dict(collections.Counter(code for code, _ in results))}')
+    print(f'  p50 {percentile(latencies, 0.5) * 1000:.0f}ms, p99 {percentile(latencies, 0.99) * 1000:.0f}ms, 최대 {latencies[-1] * 1000:.0f}ms, {SLACK_TIMEOUT}초 초과 {sum(1 for latency in latencies if latency > SLACK_TIMEOUT)}건')
+    print(f'종료: SIGTERM 후 {stop_time:.2f}초, 종료 코드 {server.returncode}')
+    print(f'가짜 Slack이 받은 요청: {dict(FakeSlack.counts)}')
+
+    errors = [line for line in output.splitlines() if 'ERROR' in line or 'Traceback' in line]
+    if errors:
+        print('gunicorn 오류 로그:')
+        print('\n'.join(errors[-20:]))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+import os
+
+# 실행: gunicorn -c gunicorn.conf.py wsgi:app
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# 핸들러는 명령을 대기열에 넣고 바로 응답하므로, 프로세스 하나에서 여러 스레드로 요청을 받습니다.
+# 리소스 잠금, 중복 명령 확인, 조회 캐시, 예약 작업은 프로세스 안에서만 공유되므로 작업 프로세스는 항상 하나입니다.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# 명령 작업 스레드, 이벤트 루프, HTTP 연결은 fork 뒤에 만들어야 하므로 앱을 프로세스마다 불러옵니다.
+preload_app = False
+
+timeout = 30
+# 종료 신호를 받은 뒤 진행 중인 명령을 마칠 때까지 기다리는 시간(초), 지나면 강제 종료됩니다.
+graceful_timeout = int(os.environ.get('GRACEFUL_TIMEOUT', 60))
+# 명령을 기다리는 시간은 강제 종료 전에 스케줄러와 Slack 전송을 정리할 수 있도록 graceful_timeout보다 짧게 둡니다.
+command_drain_timeout = int(os.environ.get('COMMAND_DRAIN_TIMEOUT', graceful_timeout - 10))
+
+def on_starting(server):
+    if int(os.environ.get('WEB_CONCURRENCY', 1)) > 1:
+        server.log.warning('WEB_CONCURRENCY는 무시하고 작업 프로세스 하나로 실행합니다. 처리량은 GUNICORN_THREADS로 조정합니다.')
+
+def post_worker_init(worker):
+    from wsgi import bot
+    bot.start_services()
+
+def worker_exit(server, worker):
+    # 작업 프로세스가 요청 처리를 멈춘 뒤 해당 프로세스에서 호출됩니다.
+    from wsgi import bot
+    bot.stop_services(command_drain_timeout)
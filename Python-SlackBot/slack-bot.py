@@ -1,11 +1,11 @@
 import os
-import requests
 import json
-import asyncio
+import time
+import threading
 import re
 import logging
 from datetime import datetime
-from threading import Thread
+from functools import partial
 from flask import Flask, request
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -13,12 +13,17 @@ from utils.logger import LoggerManager
 from utils.aws_manager import AWSInstanceController, IAMPolicyManager
 from utils.aws_instance_scheduler import BotoScheduler
 from utils.slack_button_generator import CommandButtonGenerator
-from utils.timer import Timer
+from utils.resource_lock import ResourceLockManager
+from utils.command_dispatcher import CommandDispatcher
+from utils.slack_delivery import SlackDelivery
+from utils.service_lifecycle import LeaderLock, EventLoopThread
+from utils.slack_output import SlackOutput
 
 app = Flask(__name__)
 port = int(os.environ['PORT'])
 channel_id = os.environ['CHANNEL_ID']
-client = WebClient(token=os.environ['OAUTH_TOKEN'])
+client = WebClient(token=os.environ['OAUTH_TOKEN'], base_url=os.environ.get('SLACK_API_URL', WebClient.BASE_URL))
+wait_for_target_state = os.environ.get('WAIT_FOR_TARGET_STATE', 'false').lower() == 'true'
 
 logger_manager = LoggerManager(
     name='instance_monitor',
@@ -33,16 +38,148 @@ policy_manager = IAMPolicyManager(
     logger=logger
 )
 
-def process_commands(response_url: str, command: str, action_type: str, channel: str):
-    if aws_instance_controller.is_working:
-        requests.post(response_url, json={'text': '현재 작업 중인 프로세스가 있습니다.'})
+resource_locks = ResourceLockManager(logger)
+
+# 긴 결과는 Slack 메시지 제한에 맞게 나누고, 아주 길면 파일로 올립니다.
+slack_output = SlackOutput(
+    client,
+    logger,
+    file_threshold=int(os.environ.get('SLACK_FILE_THRESHOLD', 12000)),
+    use_blocks=os.environ.get('SLACK_USE_BLOCKS', 'false').lower() == 'true'
+)
+
+# response_url 전송은 연결을 재사용하고, 핸들러에서는 기다리지 않도록 작업 스레드에서 보냅니다.
+slack_delivery = SlackDelivery(logger)
+
+# 버튼 클릭마다 스레드를 만들지 않고 정해진 수의 작업 스레드에서 명령을 실행합니다.
+command_dispatcher = CommandDispatcher(
+    logger=logger,
+    workers=int(os.environ.get('COMMAND_WORKERS', 4)),
+    max_queue_size=int(os.environ.get('COMMAND_QUEUE_SIZE', 50)),
+    status_workers=int(os.environ.get('COMMAND_STATUS_WORKERS', 1))
+)
+
+# 재시작 중에 이전 프로세스가 아직 종료되지 않았어도 스케줄러는 잠금을 얻은 프로세스 하나에서만 실행합니다.
+# 잠금을 얻지 못하면 이전 프로세스가 끝날 때까지 scheduler_lock_retry초마다 다시 시도합니다.
+leader_lock = LeaderLock(os.environ.get('SCHEDULER_LOCK_FILE', '/tmp/slack-bot-scheduler.lock'), logger)
+scheduler_lock_retry = float(os.environ.get('SCHEDULER_LOCK_RETRY', 10))
+leader_retry = None
+scheduler_loop = None
+boto_scheduler = None
+
+def create_boto_scheduler(event_loop) -> BotoScheduler:
+    return BotoScheduler(
+        host=os.environ['MYSQL_HOST'],
+        port=int(os.environ['MYSQL_PORT']),
+        database=os.environ['MYSQL_DATABASE'],
+        user=os.environ['MYSQL_USER'],
+        password=os.environ['MYSQL_PASSWORD'],
+        logger=logger,
+        scheduled_jobs=os.environ.get('SCHEDULED_JOBS', 'true').lower() == 'true',
+        policy_manager=policy_manager,
+        client=client,
+        channel_id=channel_id,
+        aws_instance_controller=aws_instance_controller,
+        quiet_hours_start=os.environ.get('QUIET_HOURS_START'),
+        quiet_hours_end=os.environ.get('QUIET_HOURS_END'),
+        storage_mode=os.environ.get('STORAGE_MODE', 'full'),
+        event_loop=event_loop,
+        slack_output=slack_output
+    )
+
+def start_services():
+    """
+    작업 프로세스가 요청을 받기 전에 한 번 호출되며, 리더 프로세스에서만 스케줄러를 시작합니다.
+    AWS, IAM 조회는 스케줄러가 시작 직후 실행하므로 바로 반환되어 작업 프로세스의 시작 제한 시간을 넘지 않습니다.
+    """
+    global scheduler_loop, boto_scheduler, leader_retry
+
+    if not leader_lock.acquire():
+        logger.info(f'PID {os.getpid()} 프로세스는 스케줄러 잠금을 얻지 못해 {scheduler_lock_retry:.0f}초 후 다시 시도합니다.')
+        leader_retry = threading.Timer(scheduler_lock_retry, start_services)
+        leader_retry.daemon = True
+        leader_retry.start()
         return
-    
-    aws_instance_controller.is_working = True
-    requests.post(response_url, json={'text': f"'{command} {action_type}' 명령어가 시작되었습니다. 작업이 완료되면 결과를 안내해 드리겠습니다."})
-    
-    # 타이머를 시작합니다.
-    timer.start()
+
+    scheduler_loop = EventLoopThread(name='scheduler-loop')
+    scheduler_loop.start()
+    try:
+        boto_scheduler = create_boto_scheduler(scheduler_loop.loop)
+    except Exception:
+        scheduler_loop.stop()
+        leader_lock.release()
+        raise
+
+def stop_services(timeout: float = 30):
+    """
+    새 명령을 받지 않고 대기 중이거나 실행 중인 명령을 마친 뒤, 스케줄러와 Slack 전송을 정리합니다.
+
+    :param timeout: 명령, 스케줄 작업, 완료 추적이 끝나기를 기다리는 전체 최대 시간(초)
+    """
+    if leader_retry is not None:
+        leader_retry.cancel()
+
+    # 명령, 스케줄 작업, 완료 추적이 timeout을 나누어 쓰므로 worker_exit가 timeout을 넘기지 않습니다.
+    deadline = time.monotonic() + timeout
+
+    def remaining() -> float:
+        return max(deadline - time.monotonic(), 0)
+
+    if not command_dispatcher.shutdown(timeout):
+        logger.warning(f'{timeout}초 안에 끝나지 않은 명령이 있습니다: {command_dispatcher.metrics()}')
+
+    if boto_scheduler is not None and not boto_scheduler.shutdown(remaining()):
+        logger.warning('종료 시간 안에 끝나지 않은 스케줄 작업 호출이 있습니다.')
+    if scheduler_loop is not None:
+        scheduler_loop.stop(remaining())
+    leader_lock.release()
+    if not aws_instance_controller.shutdown(remaining()):
+        logger.warning('종료 시간 안에 끝나지 않은 완료 추적이 있습니다.')
+
+    # 결과 메시지까지 보낸 뒤 연결을 닫습니다.
+    slack_delivery.shutdown()
+
+def post_follow_up(channel: str, text: str):
+    """시작/중지 명령이 목표 상태에 도달한 뒤 최종 결과를 한 번 더 알립니다."""
+    try:
+        slack_output.send(channel, text)
+    except SlackApiError as e:
+        logger.error(f'완료 추적 결과 전송 실패: {e}')
+
+# 명령어별로 변경하는 리소스 종류, 조회와 예약 명령은 잠그지 않고 동시에 실행합니다.
+# 전체(/all-instance)와 프로젝트(/all-project-instance) 명령은 같은 인스턴스를 다룰 수 있으므로 같은 리소스 종류를 잡습니다.
+# ASG 용량 변경은 EC2 인스턴스를 시작하거나 종료하므로 EC2도 함께 잡습니다.
+COMMAND_RESOURCES = {
+    '/all-project-instance': {'ec2', 'rds', 'asg'},
+    '/all-instance': {'ec2', 'rds', 'asg'},
+    '/all-ec2': {'ec2'},
+    '/all-rds': {'rds'},
+    '/all-asg': {'asg', 'ec2'}
+}
+
+def command_resources(command: str, action_type: str) -> set[str]:
+    if action_type == 'status':
+        return set()
+    return COMMAND_RESOURCES.get(command, set())
+
+def command_priority(action_type: str) -> int:
+    # 조회 명령은 오래 걸리는 시작/중지 명령보다 먼저 실행합니다.
+    if action_type in ('status', 'list'):
+        return CommandDispatcher.STATUS_PRIORITY
+    return CommandDispatcher.MUTATION_PRIORITY
+
+def run_scheduled(command: str, func, *args):
+    """예약한 시각에 실행되는 작업도 같은 리소스를 변경하는 명령과 겹치지 않도록 잠금을 잡고 실행합니다."""
+    with resource_locks.hold(COMMAND_RESOURCES[command]):
+        return func(*args)
+
+def run_command(command: str, action_type: str, on_complete=None):
+    """
+    명령을 실행하고 Slack에 보낼 결과를 반환합니다. 알 수 없는 action_type이면 False를 반환합니다.
+    전체 리소스 조회는 리소스 종류별 결과를 조회가 끝나는 대로 반환하는 생성기를 반환합니다.
+    """
+    if command.find('/예약') == 0 and boto_scheduler is None:
+        return f"'{command}' 명령어는 스케줄러를 실행 중인 프로세스에서만 처리할 수 있습니다. 잠시 후 다시 시도해 주세요."
 
     if command.find('/예약-목록') == 0:
         if action_type == 'list':
@@ -60,16 +197,16 @@ def process_commands(response_url: str, command: str, action_type: str, channel:
             scheduled_time = datetime.strptime(date_time_str, '%Y-%m-%d %H:%M')
 
             if action_type == 'all_start':
-                boto_scheduler.add_job(aws_instance_controller.start_all_resources, scheduled_time)
+                boto_scheduler.add_job(run_scheduled, scheduled_time, args=['/all-instance', aws_instance_controller.start_all_resources, on_complete])
                 response_text = f"'{command}' 명령어를 {scheduled_time}에 시작합니다."
             elif action_type == 'all_stop':
-                boto_scheduler.add_job(aws_instance_controller.stop_all_resources, scheduled_time)
+                boto_scheduler.add_job(run_scheduled, scheduled_time, args=['/all-instance', aws_instance_controller.stop_all_resources, on_complete])
                 response_text = f"'{command}' 명령어를 {scheduled_time}에 중지합니다."
             elif action_type == 'custom_start':
-                boto_scheduler.add_job(aws_instance_controller.start_custom_all_resources, scheduled_time)
+                boto_scheduler.add_job(run_scheduled, scheduled_time, args=['/all-project-instance', aws_instance_controller.start_custom_all_resources, on_complete])
                 response_text = f"'{command}' 명령어를 {scheduled_time}에 시작합니다."
             elif action_type == 'custom_stop':
-                boto_scheduler.add_job(aws_instance_controller.stop_custom_all_resources, scheduled_time)
+                boto_scheduler.add_job(run_scheduled, scheduled_time, args=['/all-project-instance', aws_instance_controller.stop_custom_all_resources, on_complete])
                 response_text = f"'{command}' 명령어를 {scheduled_time}에 중지합니다."
             else:
                 return False
@@ -77,27 +214,27 @@ def process_commands(response_url: str, command: str, action_type: str, channel:
             response_text = f"'{command}' 명령어는 형식에 맞지 않습니다. 올바른 형식: '/예약 YYYY-MM-DD HH:MM'"
     elif command == '/all-project-instance':
         if action_type == 'start':
-            response_text = aws_instance_controller.start_custom_all_resources()
+            response_text = aws_instance_controller.start_custom_all_resources(on_complete)
         elif action_type == 'stop':
-            response_text = aws_instance_controller.stop_custom_all_resources()
+            response_text = aws_instance_controller.stop_custom_all_resources(on_complete)
         elif action_type == 'status':
-            response_text = aws_instance_controller.status_custom_all_resources()
+            response_text = aws_instance_controller.iter_status_custom_all_resources()
         else:
             return False
     elif command == '/all-instance':
         if action_type == 'start':
-            response_text = aws_instance_controller.start_all_resources()
+            response_text = aws_instance_controller.start_all_resources(on_complete)
         elif action_type == 'stop':
-            response_text = aws_instance_controller.stop_all_resources()
+            response_text = aws_instance_controller.stop_all_resources(on_complete)
         elif action_type == 'status':
-            response_text = aws_instance_controller.status_all_resources()
+            response_text = aws_instance_controller.iter_status_all_resources()
         else:
             return False
     elif command == '/all-ec2':
         if action_type == 'start':
-            response_text = aws_instance_controller.start_all_ec2_instances()
+            response_text = aws_instance_controller.start_all_ec2_instances(on_complete)
         elif action_type == 'stop':
-            response_text = aws_instance_controller.stop_all_ec2_instances()
+            response_text = aws_instance_controller.stop_all_ec2_instances(on_complete)
         elif action_type == 'status':
             response_text = aws_instance_controller.format_output(
                 aws_instance_controller.status_all_ec2_instances()
@@ -106,9 +243,9 @@ def process_commands(response_url: str, command: str, action_type: str, channel:
             return False
     elif command == '/all-rds':
         if action_type == 'start':
-            response_text = aws_instance_controller.start_all_rds_instances()
+            response_text = aws_instance_controller.start_all_rds_instances(on_complete)
         elif action_type == 'stop':
-            response_text = aws_instance_controller.stop_all_rds_instances()
+            response_text = aws_instance_controller.stop_all_rds_instances(on_complete)
         elif action_type == 'status':
             response_text = aws_instance_controller.format_output(
                 aws_instance_controller.status_all_rds_instances()
@@ -122,22 +259,53 @@ def process_commands(response_url: str, command: str, action_type: str, channel:
             )
         elif action_type.find('desired_') == 0:
             desired_capacity = int(action_type.split('_')[1])
-            response_text = aws_instance_controller.all_update_auto_scaling_group_capacity(desired_capacity)
+            response_text = aws_instance_controller.all_update_auto_scaling_group_capacity(desired_capacity, on_complete)
         else:
             return False
     else:
         logger.error(f'Unknown command: {command}')
         response_text = '알 수 없는 명령입니다.'
 
-    # 타이머를 종료하고 경과 시간을 표시합니다.
-    timer.end(f'{command} {action_type}')
+    return response_text
+
+def process_commands(response_url: str, command: str, action_type: str, channel: str):
+    # 작업 스레드에서 실행되므로 안내 메시지는 순서가 바뀌지 않도록 보낼 때까지 기다립니다.
+    def notify_waiting():
+        slack_delivery.send(response_url, {'text': f"다른 작업이 진행 중이므로 '{command} {action_type}' 명령어는 그 작업이 끝난 뒤에 시작합니다."})
 
+    started = time.perf_counter()
     try:
-        aws_instance_controller.is_working = False
-        client.chat_postMessage(channel=channel, text=response_text)
-    except SlackApiError as e:
-        error_message = f"'{command}' 실행 중 오류가 발생했습니다. 오류 원인: {str(e)}"
-        requests.post(response_url, json={'text': error_message})
+        # 같은 리소스를 변경하는 명령은 앞의 명령이 끝날 때까지 기다리며, 오류가 나도 항상 해제됩니다.
+        with resource_locks.hold(command_resources(command, action_type), on_wait=notify_waiting):
+            slack_delivery.send(response_url, {'text': f"'{command} {action_type}' 명령어가 시작되었습니다. 작업이 완료되면 결과를 안내해 드리겠습니다."})
+
+            # 여러 명령이 동시에 실행되므로 경과 시간은 명령마다 따로 재며, 잠금을 기다린 시간은 뺍니다.
+            started = time.perf_counter()
+
+            # WAIT_FOR_TARGET_STATE가 켜져 있으면 시작/중지 후 목표 상태가 될 때까지 추적하여 후속 메시지를 보냅니다.
+            on_complete = partial(post_follow_up, channel) if wait_for_target_state else None
+            response_text = run_command(command, action_type, on_complete)
+    except Exception as e:
+        logger.error(f'{command} {action_type} 실행 실패: {e}')
+        response_text = f"'{command}' 실행 중 오류가 발생했습니다. 오류 원인: {str(e)}"
+
+    if response_text is not False:
+        # 조회 결과는 전송하면서 생성되므로 실행 시간은 전송이 끝난 뒤에 기록합니다.
+        try:
+            if isinstance(response_text, str):
+                slack_output.send(channel, response_text)
+            else:
+                slack_output.stream(channel, response_text)
+        except SlackApiError as e:
+            error_message = f"'{command}' 실행 중 오류가 발생했습니다. 오류 원인: {str(e)}"
+            slack_delivery.send(response_url, {'text': error_message})
+        except Exception as e:
+            # 스트리밍 중 조회가 실패해도 사용자가 결과를 기다리지 않도록 알립니다.
+            logger.error(f'{command} {action_type} 결과 전송 실패: {e}')
+            error_message = f"'{command}' 실행 중 오류가 발생했습니다. 오류 원인: {str(e)}"
+            slack_delivery.send(response_url, {'text': error_message})
+
+    logger.info(f'{command} {action_type} 실행 시간: {time.perf_counter() - started:.2f}초')
 
 @app.after_request
 def log_response_info(response):
@@ -151,7 +319,7 @@ def slack_commands():
     response_url = request.form.get('response_url')
     response_message = command_button_generator.generate_buttons(command, text)
 
-    requests.post(response_url, json=response_message)
+    slack_delivery.post(response_url, response_message)
     return '', 200
 
 @app.route('/team1-slack/interactive-endpoint', methods=['POST'])
@@ -164,14 +332,29 @@ def slack_interactive_endpoint():
     action_type = action_value[1]
 
     if action_type == 'cancel':
-        requests.post(response_url, json={'text': f"'{command}' 명령어가 성공적으로 취소되었습니다."})
+        slack_delivery.post(response_url, {'text': f"'{command}' 명령어가 성공적으로 취소되었습니다."})
         return '', 200
 
-    thread = Thread(target=process_commands, args=(response_url, command, action_type, channel))
-    thread.start()
+    # 결과는 요청한 채널로 보내므로 같은 명령이라도 채널이 다르면 따로 실행합니다.
+    result = command_dispatcher.submit(
+        (command, action_type, channel),
+        command_priority(action_type),
+        process_commands, response_url, command, action_type, channel
+    )
+    logger.debug(f'명령 대기열 상태: {command_dispatcher.metrics()}')
+
+    if result == CommandDispatcher.DUPLICATE:
+        slack_delivery.post(response_url, {'text': f"'{command} {action_type}' 명령어가 이미 진행 중입니다. 작업이 완료되면 결과를 안내해 드리겠습니다."})
+    elif result == CommandDispatcher.CLOSED:
+        slack_delivery.post(response_url, {'text': f"서버가 종료 중이므로 '{command} {action_type}' 명령어를 받을 수 없습니다. 잠시 후 다시 시도해 주세요."})
+    elif result != CommandDispatcher.QUEUED:
+        slack_delivery.post(response_url, {'text': f"요청이 많아 '{command} {action_type}' 명령어를 받을 수 없습니다. 잠시 후 다시 시도해 주세요."})
     return '', 200
 
 if __name__ == '__main__':
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, app.run, '0.0.0.0', port, False)
-    loop.run_forever()
+    # 개발용 서버입니다. 운영에서는 gunicorn -c gunicorn.conf.py wsgi:app 으로 실행합니다.
+    start_services()
+    try:
+        app.run('0.0.0.0', port, False, threaded=True)
+    finally:
+        stop_services()
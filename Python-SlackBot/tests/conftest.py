@@ -0,0 +1,5 @@
+import os
+import sys
+
+# utils 패키지를 slack-bot.py와 같은 방식으로 가져옵니다.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
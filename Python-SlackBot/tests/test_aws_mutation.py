@@ -0,0 +1,37 @@
+import time
+import logging
+import threading
+
+from utils.aws_mutation import MutationExecutor, MutationResult
+
+def test_timeout_separates_in_flight_and_not_attempted_calls():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return MutationResult('EC2', 'i-1', MutationResult.SUCCESS)
+
+    def fast():
+        return MutationResult('EC2', 'i-2', MutationResult.SUCCESS)
+
+    executor = MutationExecutor(logging.getLogger(__name__), max_workers=1, timeout=0.2)
+    started = time.monotonic()
+    try:
+        results = executor.run([('EC2', 'i-1', slow), ('EC2', 'i-2', fast)])
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1
+    # 스레드가 하나이므로 첫 호출은 진행 중이고 두 번째 호출은 시작하지 못했습니다.
+    assert [(result.resource_id, result.status, result.message) for result in results] == [
+        ('i-1', MutationResult.UNKNOWN, 'timeout'),
+        ('i-2', MutationResult.ERROR, 'not attempted')
+    ]
+
+def test_exception_is_reported_as_error():
+    def broken():
+        raise RuntimeError('boom')
+
+    results = MutationExecutor(logging.getLogger(__name__)).run([('RDS', 'db-1', broken)])
+
+    assert [(result.status, result.message) for result in results] == [(MutationResult.ERROR, 'boom')]
@@ -0,0 +1,49 @@
+from utils.aws_status import EC2Status, RDSStatus
+from utils.monitor_interval import AdaptivePollingPolicy
+
+def make_ec2(ec2_id: str, state: str = 'running') -> EC2Status:
+    return EC2Status(
+        ec2_id=ec2_id,
+        state=state,
+        launch_time='2024-01-01 00:00:00',
+        instance_type='t3.micro',
+        private_ip='10.0.0.1',
+        public_ip=None,
+        cpu=10,
+        ram=10,
+        network_in=100,
+        network_out=100,
+        name=ec2_id
+    )
+
+def make_policy() -> AdaptivePollingPolicy:
+    return AdaptivePollingPolicy(fast_interval=30, base_interval=300, idle_interval=1800, backoff_factor=2)
+
+def test_running_fleet_without_events_stays_at_base():
+    policy = make_policy()
+    ec2_status = [make_ec2('i-1'), make_ec2('i-2', state='stopped')]
+    active = policy.is_active(ec2_status, [])
+
+    assert active
+    assert [policy.next_interval(False, active, False) for _ in range(6)] == [300] * 6
+
+def test_available_rds_counts_as_active():
+    policy = make_policy()
+    rds_status = [RDSStatus(rds_identifier='db-1', status='available', instance_class='db.t3.micro', engine_version='8.0')]
+
+    assert policy.is_active([make_ec2('i-1', state='stopped')], rds_status)
+
+def test_stopped_fleet_backs_off_to_idle():
+    policy = make_policy()
+    ec2_status = [make_ec2('i-1', state='stopped')]
+    active = policy.is_active(ec2_status, [])
+
+    assert not active
+    assert [policy.next_interval(False, active, False) for _ in range(5)] == [300, 600, 1200, 1800, 1800]
+    # 변경이 생기면 base_interval로 돌아갑니다.
+    assert policy.next_interval(False, active, True) == 300
+
+def test_transitional_uses_fast_interval():
+    policy = make_policy()
+
+    assert policy.next_interval(True, True, False) == 30
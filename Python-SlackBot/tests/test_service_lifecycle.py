@@ -0,0 +1,28 @@
+import time
+import threading
+
+from utils.service_lifecycle import DrainableExecutor
+
+def test_drain_cancels_queued_work_and_honours_timeout():
+    release = threading.Event()
+    executor = DrainableExecutor(max_workers=1)
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(lambda: None)
+
+    started = time.monotonic()
+    try:
+        assert executor.drain(0.2) is False
+        assert time.monotonic() - started < 1
+        assert queued.cancelled()
+        assert not running.done()
+    finally:
+        release.set()
+
+    assert running.result(1) is True
+
+def test_drain_returns_true_when_work_finishes():
+    executor = DrainableExecutor(max_workers=2)
+    futures = [executor.submit(time.sleep, 0.05) for _ in range(2)]
+
+    assert executor.drain(1) is True
+    assert all(future.done() for future in futures)
@@ -0,0 +1,102 @@
+from dataclasses import replace
+
+from utils.aws_status import EC2Status
+from utils.snapshot_diff import ChangeEvent, SnapshotDiffer
+
+def make_ec2(ec2_id: str, cpu: float | None = 10, **changes) -> EC2Status:
+    ec2 = EC2Status(
+        ec2_id=ec2_id,
+        state='running',
+        launch_time='2024-01-01 00:00:00',
+        instance_type='t3.micro',
+        private_ip='10.0.0.1',
+        public_ip=None,
+        cpu=cpu,
+        ram=10,
+        network_in=100,
+        network_out=100,
+        name=ec2_id
+    )
+    return replace(ec2, **changes)
+
+def make_differ() -> SnapshotDiffer:
+    return SnapshotDiffer('EC2', EC2Status.METRIC_FIELDS, EC2Status.ALERT_FIELDS, {'cpu': 80}, hysteresis=5)
+
+def kinds(events: list[ChangeEvent]) -> list[tuple]:
+    return [(event.kind, event.resource_id, event.field) for event in events]
+
+def test_added_and_removed():
+    differ = make_differ()
+    old = [make_ec2('i-1'), make_ec2('i-2')]
+    new = [make_ec2('i-3'), make_ec2('i-1')]
+
+    assert kinds(differ.diff(old, new)) == [
+        (ChangeEvent.ADDED, 'i-3', None),
+        (ChangeEvent.REMOVED, 'i-2', None)
+    ]
+
+def test_field_changes_in_field_order():
+    differ = make_differ()
+    old = [make_ec2('i-1')]
+    new = [make_ec2('i-1', state='stopped', public_ip='3.3.3.3', name=None)]
+
+    events = differ.diff(old, new)
+    assert kinds(events) == [
+        (ChangeEvent.FIELD_CHANGED, 'i-1', 'state'),
+        (ChangeEvent.FIELD_CHANGED, 'i-1', 'public_ip'),
+        (ChangeEvent.FIELD_CHANGED, 'i-1', 'name')
+    ]
+    assert (events[0].old_value, events[0].new_value) == ('running', 'stopped')
+
+def test_metric_changes_only_report_missing_data():
+    differ = make_differ()
+    old = [make_ec2('i-1', cpu=10, ram=10)]
+
+    assert differ.diff(old, [make_ec2('i-1', cpu=20, ram=30, network_in=5)]) == []
+    assert kinds(differ.diff(old, [make_ec2('i-1', cpu=None)])) == [(ChangeEvent.FIELD_CHANGED, 'i-1', 'cpu')]
+
+def test_missing_network_data_is_not_reported():
+    differ = make_differ()
+    old = [make_ec2('i-1')]
+
+    assert differ.diff(old, [make_ec2('i-1', network_in=None, network_out=None)]) == []
+
+def test_unchanged_record_still_checks_threshold():
+    differ = make_differ()
+    records = [make_ec2('i-1', cpu=90)]
+
+    assert kinds(differ.diff(records, records)) == [(ChangeEvent.THRESHOLD_CROSSED, 'i-1', 'cpu')]
+    assert differ.diff(records, records) == []
+
+def test_threshold_hysteresis():
+    differ = make_differ()
+    snapshots = [make_ec2('i-1', cpu=cpu) for cpu in (10, 85, 78, 90, 74, 81)]
+
+    crossed = []
+    for old, new in zip(snapshots, snapshots[1:]):
+        crossed.append([event.new_value for event in differ.diff([old], [new]) if event.kind == ChangeEvent.THRESHOLD_CROSSED])
+
+    # 78은 해제 기준(75) 이상이므로 90에서 다시 알리지 않고, 74로 내려간 뒤 81에서 다시 알립니다.
+    assert crossed == [[85], [], [], [], [81]]
+
+def test_missing_metric_releases_alert():
+    differ = make_differ()
+    differ.diff([], [make_ec2('i-1', cpu=90)])
+    differ.diff([make_ec2('i-1', cpu=90)], [make_ec2('i-1', cpu=None)])
+
+    events = differ.diff([make_ec2('i-1', cpu=None)], [make_ec2('i-1', cpu=90)])
+    assert (ChangeEvent.THRESHOLD_CROSSED, 'i-1', 'cpu') in kinds(events)
+
+def test_removed_resource_releases_alert():
+    differ = make_differ()
+    differ.diff([], [make_ec2('i-1', cpu=90)])
+    differ.diff([make_ec2('i-1', cpu=90)], [])
+
+    events = differ.diff([], [make_ec2('i-1', cpu=90)])
+    assert kinds(events) == [
+        (ChangeEvent.ADDED, 'i-1', None),
+        (ChangeEvent.THRESHOLD_CROSSED, 'i-1', 'cpu')
+    ]
+
+def test_empty_snapshots():
+    assert make_differ().diff([], []) == []
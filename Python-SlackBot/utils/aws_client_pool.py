@@ -0,0 +1,66 @@
+import threading
+import boto3
+from botocore.config import Config
+
+class AWSClientPool:
+    """프로세스 전체에서 공유하는 boto3 client 저장소입니다.
+
+    client는 서비스와 Region 조합마다 한 번만 생성하고 재사용합니다.
+    boto3 Session은 스레드 간에 공유하면 안전하지 않으므로 client 생성은 Lock 안에서 수행하고,
+    생성된 client는 ThreadPoolExecutor 작업자들이 함께 사용합니다.
+
+    Parameters:
+        max_pool_connections (int): client별 HTTP 연결 풀 크기
+        max_attempts (int): 재시도를 포함한 최대 호출 횟수
+        retry_mode (str): botocore 재시도 모드 ('standard', 'adaptive')
+        connect_timeout (float): 연결을 맺을 때까지 기다리는 최대 시간(초)
+        read_timeout (float): 응답을 기다리는 최대 시간(초)
+    """
+    def __init__(
+            self,
+            max_pool_connections: int = 50,
+            max_attempts: int = 10,
+            retry_mode: str = 'adaptive',
+            connect_timeout: float = 5,
+            read_timeout: float = 20
+        ):
+        # 응답이 없는 호출이 스레드를 계속 잡고 있지 않도록 botocore 기본값(60초)보다 짧게 둡니다.
+        self.config = Config(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries={
+                'max_attempts': max_attempts,
+                'mode': retry_mode
+            }
+        )
+        self._session = boto3.session.Session()
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str, region: str = None):
+        """서비스와 Region에 해당하는 client를 반환합니다. 없으면 새로 생성합니다."""
+        key = (service_name, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._session.client(service_name, region_name=region, config=self.config)
+                    self._clients[key] = client
+
+        return client
+
+_client_pool = None
+_client_pool_lock = threading.Lock()
+
+def get_client_pool() -> AWSClientPool:
+    """프로세스에서 공유하는 AWSClientPool을 반환합니다."""
+    global _client_pool
+
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                _client_pool = AWSClientPool()
+
+    return _client_pool
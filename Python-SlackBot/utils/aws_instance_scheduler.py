@@ -1,14 +1,21 @@
 import os
+import time
+import asyncio
 import concurrent.futures
 import pytz
-import mysql.connector
 import logging
-from mysql.connector import Error
 from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.base import JobLookupError
 from slack_sdk import WebClient
 from utils.aws_manager import AWSInstanceController, IAMPolicyManager
+from utils.aws_status import EC2Status, format_slack_value, render_slack
+from utils.snapshot_diff import ChangeEvent, SnapshotDiffer
+from utils.status_store import StatusStore, DeltaStatusStore, mysql_pool_factory
+from utils.monitor_interval import AdaptivePollingPolicy
+from utils.status_rollup import StatusRollup
+from utils.slack_output import SlackOutput
+from utils.service_lifecycle import DrainableExecutor
 
 class BotoScheduler():
     """
@@ -30,6 +37,17 @@ class BotoScheduler():
         quiet_hours_start (str): QUIET_HOURS 시작하는 시간
         quiet_hours_end (str): QUIET_HOURS 끝나는 시간
         alert_value (int): 알림 수치
+        alert_hysteresis (float): 알림 후 다시 알리려면 alert_value 아래로 내려가야 하는 폭
+        status_store (StatusStore): 상태 저장소, 지정하지 않으면 DB 정보로 MySQL 연결 풀을 만듭니다.
+        storage_mode (str): status_store를 지정하지 않았을 때의 저장 방식,
+            'full'은 매번 모든 행을 저장하고 'delta'는 지표와 변경된 속성만 저장합니다.
+        io_workers (int): 모니터링 중 AWS, Slack, MySQL 호출을 실행할 스레드 수
+        policy_reconcile_hours (float): IAM 정책 드리프트를 확인하는 주기(시간)
+        polling_policy (AdaptivePollingPolicy): 모니터링 간격 정책, 지정하지 않으면 QUIET_HOURS만 반영한 기본값을 사용
+        raw_retention_days (int): 집계가 끝난 원본 지표 행을 보관할 기간(일)
+        rollup_minutes (float): 지표 집계와 원본 행 정리를 실행하는 주기(분)
+        event_loop (asyncio.AbstractEventLoop): 스케줄러를 실행할 이벤트 루프, 지정하지 않으면 실행 중인 루프를 사용
+        slack_output (SlackOutput): 변경 알림을 나누어 보내는 객체, 지정하지 않으면 client로 기본값을 만듭니다.
     """
     def __init__(
             self,
@@ -46,7 +64,17 @@ class BotoScheduler():
             aws_instance_controller: AWSInstanceController,
             quiet_hours_start: str,
             quiet_hours_end: str,
-            alert_value: int = 90
+            alert_value: int = 90,
+            alert_hysteresis: float = 5,
+            status_store: StatusStore = None,
+            storage_mode: str = 'full',
+            io_workers: int = 4,
+            policy_reconcile_hours: float = 6,
+            polling_policy: AdaptivePollingPolicy = None,
+            raw_retention_days: int = 30,
+            rollup_minutes: float = 30,
+            event_loop: asyncio.AbstractEventLoop = None,
+            slack_output: SlackOutput = None
         ):
         self.logger = logger
         self.scheduled_jobs = scheduled_jobs
@@ -54,16 +82,25 @@ class BotoScheduler():
         self.aws_instance_controller = aws_instance_controller
         self.channel_id = channel_id
         self.client = client
+        self.slack_output = slack_output or SlackOutput(client, logger)
         self.quiet_hours_start = quiet_hours_start
         self.quiet_hours_end = quiet_hours_end
         self.alert_value = alert_value
+        self.ec2_differ = SnapshotDiffer(
+            'EC2',
+            metric_fields=EC2Status.METRIC_FIELDS,
+            alert_fields=EC2Status.ALERT_FIELDS,
+            thresholds={'cpu': alert_value, 'ram': alert_value},
+            hysteresis=alert_hysteresis
+        )
+        self.rds_differ = SnapshotDiffer('RDS')
+        self.asg_differ = SnapshotDiffer('ASG')
+        self.io_executor = DrainableExecutor(max_workers=io_workers, thread_name_prefix='monitor')
+        self.polling_policy = polling_policy or AdaptivePollingPolicy(quiet_hours_start, quiet_hours_end)
+        self.monitor_interval = self.polling_policy.base_interval
 
-        ec2_status, rds_status, asg_status = self.instances_status()
-        self.instance_status = {
-            'ec2': ec2_status,
-            'rds': rds_status,
-            'asg': asg_status
-        }
+        # 마지막으로 조회한 상태, 생성자가 AWS를 기다리지 않도록 첫 조회는 스케줄러에서 시작 직후 실행합니다.
+        self.instance_status = None
 
         self.mysql_config = {
             'host': host,
@@ -72,10 +109,64 @@ class BotoScheduler():
             'user': user,
             'password': password
         }
+        if status_store is None:
+            store_class = DeltaStatusStore if storage_mode == 'delta' else StatusStore
+            status_store = store_class(logger, mysql_pool_factory(self.mysql_config))
+        self.status_store = status_store
+        self.status_rollup = StatusRollup(
+            logger,
+            status_store.connection_factory,
+            placeholder=status_store.placeholder,
+            source_table='ec2_metrics' if isinstance(status_store, DeltaStatusStore) else 'ec2_status',
+            raw_retention_days=raw_retention_days
+        )
 
-        self.scheduler = AsyncIOScheduler()
+        # event_loop를 지정하면 다른 스레드에서 생성해도 해당 루프에서 작업이 실행됩니다.
+        self.scheduler = AsyncIOScheduler(event_loop=event_loop)
         self.scheduler.start()
-        self.scheduler.add_job(self.monitor_instances_status, 'cron', minute='*/5', id='monitor_instances_status')
+        # 이전 주기가 끝나지 않았으면 겹쳐 실행하지 않고, 밀린 실행은 한 번으로 합칩니다.
+        # 간격은 매 주기가 끝날 때 polling_policy에 따라 다시 정합니다.
+        # 첫 조회와 IAM 정책 확인은 시작 직후 한 번 실행하고, 이후에는 각자의 주기로 실행합니다.
+        self.scheduler.add_job(
+            self.monitor_instances_status,
+            'interval',
+            seconds=self.monitor_interval,
+            id='monitor_instances_status',
+            next_run_time=datetime.now(pytz.utc),
+            max_instances=1,
+            coalesce=True
+        )
+        # IAM 정책은 자주 바뀌지 않으므로 느린 주기로만 확인합니다.
+        self.scheduler.add_job(
+            self.policy_manager.attach_policies,
+            'interval',
+            hours=policy_reconcile_hours,
+            id='reconcile_iam_policies',
+            next_run_time=datetime.now(pytz.utc),
+            max_instances=1,
+            coalesce=True
+        )
+        # 원본 지표를 1시간/1일 단위로 집계하고 보관 기간이 지난 원본 행을 지웁니다.
+        self.scheduler.add_job(
+            self.status_rollup.run,
+            'interval',
+            minutes=rollup_minutes,
+            id='rollup_status',
+            max_instances=1,
+            coalesce=True
+        )
+        # 리소스를 변경하면 상태 전환을 놓치지 않도록 바로 빠른 간격으로 바꿉니다.
+        self.aws_instance_controller.mutation_listeners.append(self.poll_soon)
+
+    def shutdown(self, timeout: float = None) -> bool:
+        """
+        새 작업을 실행하지 않도록 스케줄러를 멈추고, 진행 중인 AWS, Slack, MySQL 호출을 정리합니다. 모두 끝나면 True를 반환합니다.
+
+        :param timeout: 진행 중인 호출을 기다리는 최대 시간(초), None이면 끝날 때까지 기다립니다.
+        """
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        return self.io_executor.drain(timeout)
 
     def list_jobs(self) -> list:
         jobs = self.scheduler.get_jobs()
@@ -94,16 +185,15 @@ class BotoScheduler():
 
     def instances_status(self):
         """모든 리소스의 상태를 확인하는 함수."""
-        self.policy_manager.attach_policies()
-
         if not self.scheduled_jobs:
             self.logger.debug('instances_status: FALSE')
             return str(), str(), str()
         
+        # 주기적인 조회는 항상 새로 조회하고, 그 결과를 Slack 명령어가 캐시로 재사용합니다.
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            ec2_future = executor.submit(self.aws_instance_controller.status_all_ec2_instances)
-            rds_future = executor.submit(self.aws_instance_controller.status_all_rds_instances)
-            asg_future = executor.submit(self.aws_instance_controller.status_all_auto_scaling_groups)
+            ec2_future = executor.submit(self.aws_instance_controller.status_all_ec2_instances, refresh=True)
+            rds_future = executor.submit(self.aws_instance_controller.status_all_rds_instances, refresh=True)
+            asg_future = executor.submit(self.aws_instance_controller.status_all_auto_scaling_groups, refresh=True)
             
             ec2_status = ec2_future.result()
             rds_status = rds_future.result()
@@ -112,152 +202,101 @@ class BotoScheduler():
             return ec2_status, rds_status, asg_status
 
     async def monitor_instances_status(self):
-        current_ec2_status, current_rds_status, current_asg_status = self.instances_status()
-        result = []
+        """
+        리소스 상태를 조회하고 이전 상태와 비교하여 변경 사항을 알리고 저장하는 함수.
 
-        old_ec2_ids = {ec2['EC2_ID']: ec2 for ec2 in self.instance_status['ec2']}
-        current_ec2_ids = {ec2['EC2_ID']: ec2 for ec2 in current_ec2_status}
+        boto3, Slack, MySQL 호출은 모두 블로킹이므로 io_executor에서 실행하여
+        다른 스케줄 작업(예약 작업 등)이 이벤트 루프에서 멈추지 않도록 합니다.
+        """
+        loop = asyncio.get_running_loop()
 
-        # EC2 인스턴스 확인
-        for ec2_id, ec2 in current_ec2_ids.items():
-            if ec2_id not in old_ec2_ids:
-                result.append(f"EC2 {ec2_id} 추가됨: {ec2}")
-            else:
-                old_ec2 = old_ec2_ids[ec2_id]
+        started = time.perf_counter()
+        current_ec2_status, current_rds_status, current_asg_status = await loop.run_in_executor(self.io_executor, self.instances_status)
+        fetched = time.perf_counter()
 
-                # 태그가 사라졌을 때
-                removed_keys = [key for key in old_ec2 if key not in ec2]
-                for key in removed_keys:
-                    result.append(f"EC2 {ec2_id}의 {key} 태그가 제거됨: 이전 값 -> {old_ec2[key]}")
+        # 조회 중 오류가 발생하면 오류 메시지 문자열이 반환되므로 이번 주기는 건너뜁니다.
+        for status in (current_ec2_status, current_rds_status, current_asg_status):
+            if isinstance(status, str) and status:
+                self.logger.error(f'monitor_instances_status: {status}')
+                return
 
-                # 인스턴스의 변화 확인
-                for key, value in ec2.items():
-                    old_value = old_ec2.get(key)  # 이전 인스턴스에서 key의 값을 가져오기
-                    if old_value != value:
-                        ec2_display_name = f'{ec2_id}({ec2.get('Name')})' if ec2.get('Name') else ec2_id
+        if self.instance_status is None:
+            # 시작 후 첫 조회는 비교할 이전 상태가 없으므로 기준으로 저장만 합니다.
+            events = []
+        else:
+            events = self.ec2_differ.diff(self.instance_status['ec2'], current_ec2_status)
+            events += self.rds_differ.diff(self.instance_status['rds'], current_rds_status)
+            events += self.asg_differ.diff(self.instance_status['asg'], current_asg_status)
+        result = [self.format_change_event(event) for event in events]
 
-                        if key in ['CPU', 'RAM']:
-                            value = float(value)
-                            if not value:
-                                result.append(f'EC2 {ec2_display_name}의 {key} 변경됨: {old_value} -> 확인 불가')
-                            elif self.alert_value <= value:
-                                result.append(f'EC2 {ec2_display_name}의 {key} 사용량이 {value:.2f}% 입니다!')
-                            else:
-                                pass
-                        elif key in ['NetworkIn', 'NetworkOut']:
-                            pass
-                        elif not old_value and value:
-                            result.append(f'EC2 {ec2_display_name}에 새로운 {key} 지정됨: {value}')
-                        else:
-                            result.append(f'EC2 {ec2_display_name}의 {key} 변경됨: {old_value} -> {value}')
-
-        # EC2 제거된 인스턴스 확인
-        for ec2_id in old_ec2_ids:
-            if ec2_id not in current_ec2_ids:
-                result.append(f"EC2 {ec2_id} 제거됨: {old_ec2_ids[ec2_id]}")
+        # 인스턴스의 모든 정보를 업데이트
+        self.instance_status = {
+            'ec2': current_ec2_status,
+            'rds': current_rds_status,
+            'asg': current_asg_status
+        }
 
-        old_rds_ids = {rds['RDS_Identifier']: rds for rds in self.instance_status['rds']}
-        current_rds_ids = {rds['RDS_Identifier']: rds for rds in current_rds_status}
+        transitional = self.polling_policy.is_transitional(current_ec2_status, current_rds_status, current_asg_status)
+        active = self.polling_policy.is_active(current_ec2_status, current_rds_status)
+        self.reschedule_monitor(self.polling_policy.next_interval(transitional, active, bool(events), self.aws_instance_controller.last_mutation_at))
+        diffed = time.perf_counter()
 
-        # RDS 인스턴스 확인
-        for rds_id, rds in current_rds_ids.items():
-            if rds_id not in old_rds_ids:
-                result.append(f"RDS {rds_id} 추가됨: {rds}")
-            else:
-                for key, value in rds.items():
-                    if old_rds_ids[rds_id].get(key) != value:
-                        result.append(f"RDS {rds_id}의 {key} 변경됨: {old_rds_ids[rds_id][key]} -> {value}")
+        # Slack 알림과 DB 저장은 서로 기다릴 필요가 없으므로 동시에 실행합니다.
+        stages = {'mysql': loop.run_in_executor(self.io_executor, self.mysql_insert_my_status, events)}
+        if result:
+            # 변경이 많으면 Slack 제한에 맞게 여러 메시지나 파일로 나누어 보냅니다.
+            stages['slack'] = loop.run_in_executor(self.io_executor, self.slack_output.send, self.channel_id, result)
 
-        # RDS 제거된 인스턴스 확인
-        for rds_id in old_rds_ids:
-            if rds_id not in current_rds_ids:
-                result.append(f"RDS {rds_id} 제거됨: {old_rds_ids[rds_id]}")
+        outcomes = await asyncio.gather(*stages.values(), return_exceptions=True)
+        for stage, outcome in zip(stages, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f'monitor_instances_status {stage} 실패: {outcome}')
+        finished = time.perf_counter()
 
-        old_asg_ids = {asg['ASG_NAME']: asg for asg in self.instance_status['asg']}
-        current_asg_ids = {asg['ASG_NAME']: asg for asg in current_asg_status}
+        self.logger.info(
+            f'monitor_instances_status: 조회 {fetched - started:.2f}s, 비교 {diffed - fetched:.3f}s, '
+            f'알림/저장 {finished - diffed:.2f}s, 전체 {finished - started:.2f}s, 변경 {len(result)}건, '
+            f'다음 조회 {self.monitor_interval:.0f}s 후'
+        )
 
-        # ASG 인스턴스 확인
-        for asg_id, asg in current_asg_ids.items():
-            if asg_id not in old_asg_ids:
-                result.append(f"ASG {asg_id} 추가됨: {asg}")
-            else:
-                for key, value in asg.items():
-                    if old_asg_ids[asg_id].get(key) != value:
-                        result.append(f"ASG {asg_id}의 {key} 변경됨: {old_asg_ids[asg_id][key]} -> {value}")
+    def reschedule_monitor(self, seconds: float):
+        """모니터링 간격이 바뀌었을 때만 작업을 다시 예약합니다. 다음 실행은 지금부터 seconds 후입니다."""
+        if seconds == self.monitor_interval:
+            return
 
-        # ASG 제거된 인스턴스 확인
-        for asg_id in old_asg_ids:
-            if asg_id not in current_asg_ids:
-                result.append(f"ASG {asg_id} 제거됨: {old_asg_ids[asg_id]}")
+        self.monitor_interval = seconds
+        self.scheduler.reschedule_job('monitor_instances_status', trigger='interval', seconds=seconds)
+        self.logger.debug(f'monitor_instances_status 간격 변경: {seconds:.0f}s')
 
-        # 인스턴스의 모든 정보를 업데이트
-        self.instance_status['ec2'] = current_ec2_status
-        self.instance_status['rds'] = current_rds_status
-        self.instance_status['asg'] = current_asg_status
+    def poll_soon(self):
+        """리소스를 변경한 직후 호출되며, 모니터링을 빠른 간격으로 바꿉니다."""
+        self.reschedule_monitor(self.polling_policy.fast_interval)
 
-        if result:
-            text = '\n'.join(result)
-            self.client.chat_postMessage(channel=self.channel_id, text=text)
-        
-        self.mysql_insert_my_status()
+    def format_change_event(self, event: ChangeEvent) -> str:
+        """변경 이벤트를 Slack 알림 문장으로 만듭니다."""
+        record = event.record
+        resource = f'{event.resource_type} {record.display_name}'
 
-    def mysql_insert_my_status(self):
-        try:
-            connection = mysql.connector.connect(**self.mysql_config)
-            if connection.is_connected():
-                cursor = connection.cursor()
-                ec2_insert_query = """
-                INSERT INTO ec2_status (ec2_id, state, launch_time, instance_type, private_ip, public_ip, cpu_utilization, ram_utilization, network_in_utilization, network_out_utilization, name)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                for ec2_instance in self.instance_status['ec2']:
-                    cursor.execute(ec2_insert_query, (
-                        ec2_instance['EC2_ID'],
-                        ec2_instance['State'],
-                        ec2_instance['LaunchTime'],
-                        ec2_instance['Type'],
-                        ec2_instance.get('PrivateIpAddress', None),
-                        ec2_instance.get('PublicIpAddress', None),
-                        ec2_instance.get('CPU', None),
-                        ec2_instance.get('RAM', None),
-                        ec2_instance.get('NetworkIn', None),
-                        ec2_instance.get('NetworkOut', None),
-                        ec2_instance.get('Name', None)
-                    ))
+        if event.kind == ChangeEvent.ADDED:
+            return f'{event.resource_type} {event.resource_id} 추가됨: {render_slack([record])}'
+        if event.kind == ChangeEvent.REMOVED:
+            return f'{event.resource_type} {event.resource_id} 제거됨: {render_slack([record])}'
 
-                rds_insert_query = """
-                INSERT INTO rds_status (rds_identifier, status, class, engine_version)
-                VALUES (%s, %s, %s, %s)
-                """
-                for rds_instance in self.instance_status['rds']:
-                    cursor.execute(rds_insert_query, (
-                        rds_instance['RDS_Identifier'],
-                        rds_instance['Status'],
-                        rds_instance['Class'],
-                        rds_instance['EngineVersion']
-                    ))
+        key = record.LABELS[event.field]
+        if event.kind == ChangeEvent.THRESHOLD_CROSSED:
+            return f'{resource}의 {key} 사용량이 {event.new_value:.2f}% 입니다!'
 
-                asg_insert_query = """
-                INSERT INTO asg_status (asg_name, instances, desired_capacity, min_size, max_size, default_cooldown)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """
-                for asg_instance in self.instance_status['asg']:
-                    cursor.execute(asg_insert_query, (
-                        asg_instance['ASG_NAME'],
-                        asg_instance['Instances'],
-                        asg_instance['DesiredCapacity'],
-                        asg_instance['MinSize'],
-                        asg_instance['MaxSize'],
-                        asg_instance['DefaultCooldown']
-                    ))
+        if event.field in record.OPTIONAL_FIELDS and event.new_value is None:
+            # 태그가 사라졌을 때
+            return f'{event.resource_type} {event.resource_id}의 {key} 태그가 제거됨: 이전 값 -> {event.old_value}'
+        if event.field in record.METRIC_FIELDS:
+            return f'{resource}의 {key} 변경됨: {format_slack_value(event.field, event.old_value)} -> 확인 불가'
+        if not event.old_value and event.new_value:
+            return f'{resource}에 새로운 {key} 지정됨: {event.new_value}'
+        return f'{resource}의 {key} 변경됨: {event.old_value} -> {event.new_value}'
 
-                connection.commit()
-        except Error as e:
-            self.logger.error(f'Error: {e}')
-        finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+    def mysql_insert_my_status(self, events: list[ChangeEvent] = None) -> int:
+        return self.status_store.write(self.instance_status, events)
 
     def add_job(self, func, run_date, args=[]):
         self.scheduler.add_job(func, 'date', run_date=run_date, args=args)
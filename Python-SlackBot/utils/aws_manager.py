@@ -1,9 +1,18 @@
-import boto3
+import time
 import concurrent.futures
+from functools import partial
+from typing import Callable, Iterator
 import pytz
 import logging
-from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
+from utils.aws_client_pool import AWSClientPool, get_client_pool
+from utils.aws_metrics import CloudWatchMetricCollector
+from utils.aws_resources import AWSResourceLister
+from utils.aws_mutation import MutationResult, MutationExecutor, EC2StateTransition, summarize_results
+from utils.aws_state_waiter import ResourceStateWaiter
+from utils.inventory_cache import InventoryCache
+from utils.aws_status import EC2Status, RDSStatus, ASGStatus, format_bytes, render_slack
+from utils.service_lifecycle import DrainableExecutor
 
 class AWSInstanceController:
     """AWS 리소스를 관리하는 클래스입니다.
@@ -16,6 +25,11 @@ class AWSInstanceController:
         worker (str): ASG Worker 이름
         logger (logging.Logger): 로깅을 위한 Logger
         region (str): AWS Region 정보
+        client_pool (AWSClientPool): boto3 client 저장소, 지정하지 않으면 프로세스 공용 저장소를 사용
+        mutation_workers (int): RDS, ASG 변경 API를 동시에 호출할 최대 스레드 수
+        mutation_timeout (float): 한 번의 변경 작업에서 모든 API 호출을 기다리는 최대 시간(초)
+        cache_ttls (dict[str, float]): 'ec2', 'rds', 'asg' 상태 조회 결과를 캐시할 시간(초)
+        completion_workers (int): 완료 추적을 동시에 실행할 최대 스레드 수, 넘는 추적은 앞의 추적이 끝날 때까지 기다립니다.
     """
     def __init__(
             self,
@@ -25,9 +39,13 @@ class AWSInstanceController:
             control_plane: str,
             worker: str,
             logger: logging.Logger,
-            region: str
+            region: str,
+            client_pool: AWSClientPool = None,
+            mutation_workers: int = 10,
+            mutation_timeout: float = 30,
+            cache_ttls: dict[str, float] = None,
+            completion_workers: int = 4
         ):
-        self.is_working = False
         self.db_instance_ids = db_instance_ids.split(',') if db_instance_ids else []
         self.db_protect_ids = db_protect_ids.split(',') if db_protect_ids else []
         self.ec2_instance_ids = ec2_instance_ids.split(',') if ec2_instance_ids else []
@@ -35,183 +53,216 @@ class AWSInstanceController:
         self.worker = worker
         self.logger = logger
         self.region = region
+        self.client_pool = client_pool or get_client_pool()
+        self.metric_collector = CloudWatchMetricCollector(logger)
+        self.resource_lister = AWSResourceLister(logger)
+        self.ec2_state_transition = EC2StateTransition(logger)
+        self.mutation_executor = MutationExecutor(logger, mutation_workers, mutation_timeout)
+        self.state_waiter = ResourceStateWaiter(logger, self.client_pool, self.resource_lister)
+        self.completion_executor = DrainableExecutor(max_workers=completion_workers, thread_name_prefix='completion')
+        self.inventory_cache = InventoryCache(logger, cache_ttls or {'ec2': 120, 'rds': 300, 'asg': 300})
+        # 마지막으로 리소스를 변경한 time.monotonic() 값과, 변경할 때마다 호출할 함수 목록
+        self.last_mutation_at = None
+        self.mutation_listeners = []
+
+    def record_mutation(self, *resource_types: str):
+        """리소스를 변경한 뒤 캐시를 버리고, 변경 시각을 기록하여 mutation_listeners에 알립니다."""
+        for resource_type in resource_types:
+            self.inventory_cache.invalidate(resource_type)
+
+        self.last_mutation_at = time.monotonic()
+        for listener in self.mutation_listeners:
+            try:
+                listener()
+            except Exception as e:
+                self.logger.error(f'mutation listener 오류: {e}')
 
     def format_bytes(self, size: float) -> str:
-        if not size:
-            return "0 B"
-
-        # 단위 리스트
-        units = ['B', 'K', 'M', 'G', 'T']
-        index = 0
-
-        while size >= 1024 and index < len(units) - 1:
-            size /= 1024.0
-            index += 1
-
-        # 소수점 한 자리까지 표시
-        return f"{size:.1f} {units[index]}"
+        return format_bytes(size)
     
-    def format_output(self, data):
-        """Status 값을 받고 Slack으로 보내기 전에 저를 한번 생각해 주세요."""
+    def format_output(self, data) -> str:
+        """Status 레코드를 Slack 메시지로 만듭니다. 레코드는 바꾸지 않습니다."""
         if not data:
             return ""
-        
-        formatted_lines = []
-        
-        for item in data:
-            if item.get('NetworkIn'):
-                item['NetworkIn'] = self.format_bytes(item['NetworkIn'])
-            if item.get('NetworkOut'):
-                item['NetworkOut'] = self.format_bytes(item['NetworkOut'])
-            formatted_lines.append(", ".join([f"{key}: {item[key]}" for key in item.keys()]))
-        
-        return "\n".join(formatted_lines)
+
+        # 조회 중 오류가 발생하면 오류 메시지 문자열이 전달됩니다.
+        if isinstance(data, str):
+            return data
+
+        return render_slack(data)
 
     # RDS
-    def manage_rds_instance(self, action: str, db_instance_ids: list = []) -> bool:
+    def manage_rds_instance(self, action: str, db_instance_ids: list = []) -> list[MutationResult]:
         """
         RDS 인스턴스 상태를 변경하는 함수.
 
+        상태를 바꿀 수 있는 인스턴스만 골라 mutation_executor로 동시에 호출하고,
+        인스턴스별 결과를 반환합니다.
+
         :param action: RDS 인스턴스에서 수행할 작업. 
                     'start'는 인스턴스를 시작하고,
                     'stop'은 인스턴스를 중지합니다.
         :type action: str
         """
-        rds = boto3.client('rds')
-        describe_instances = rds.describe_db_instances()
-        for instance in describe_instances['DBInstances']:
-            db_instance_id = instance['DBInstanceIdentifier']
-
-            def action_db_instance():
-                if instance['DBInstanceIdentifier'] == db_instance_id:
-                    current_state = instance['DBInstanceStatus']
-
-                    # 인스턴스를 시작하려면 'stopped' 상태여야 합니다.
-                    if action == 'start' and current_state != 'stopped':
-                        self.logger.debug(f'RDS {db_instance_id} 인스턴스는 {current_state} 상태입니다.')
-                        return False
-                    # 인스턴스를 중지하려면 'available' 상태여야 합니다.
-                    if action == 'stop' and current_state != 'available':
-                        self.logger.debug(f'RDS {db_instance_id} 인스턴스는 {current_state} 상태입니다.')
-                        return False
-
-                    try:
-                        if action == 'start':
-                            response = rds.start_db_instance(DBInstanceIdentifier=db_instance_id)
-                            self.logger.debug(f'RDS {db_instance_id} 인스턴스 시작: {response}')
-                        elif action == 'stop':
-                            if db_instance_id in self.db_protect_ids:
-                                self.logger.debug(f'RDS Protect, {db_instance_id} 인스턴스는 중지되지 않습니다.')
-                            else:
-                                response = rds.stop_db_instance(DBInstanceIdentifier=db_instance_id)
-                                self.logger.debug(f'RDS {db_instance_id} 인스턴스 중지: {response}')
-                        else:
-                            self.logger.error(f'RDS 인스턴스, {action}는 존재하지 않는 action입니다.')
-                            return False
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == 'InvalidDBInstanceState':
-                            self.logger.error(f'RDS Error: {e.response['Error']['Message']}')
-                            instance_info = rds.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-                            current_state = instance_info['DBInstances'][0]['DBInstanceStatus']
-                            self.logger.error(f'RDS 인스턴스 상태: {current_state}')
-                        else:
-                            self.logger.error(f'알 수 없는 오류 발생: {e}')
-                            return False
-                    
-                    return True
-        
-            if not db_instance_ids or (db_instance_id in db_instance_ids):
-                action_db_instance()
-
-        return True
+        # 인스턴스를 시작하려면 'stopped', 중지하려면 'available' 상태여야 합니다.
+        required_states = {
+            'start': 'stopped',
+            'stop': 'available'
+        }
+        if action not in required_states:
+            self.logger.error(f'RDS 인스턴스, {action}는 존재하지 않는 action입니다.')
+            return []
+
+        rds = self.client_pool.get('rds')
+        results = []
+        tasks = []
+
+        try:
+            for instance in self.resource_lister.iter_db_instances(rds, db_instance_ids):
+                db_instance_id = instance['DBInstanceIdentifier']
+                current_state = instance['DBInstanceStatus']
+
+                if current_state != required_states[action]:
+                    self.logger.debug(f'RDS {db_instance_id} 인스턴스는 {current_state} 상태입니다.')
+                    results.append(MutationResult('RDS', db_instance_id, MutationResult.SKIPPED, current_state))
+                elif action == 'stop' and db_instance_id in self.db_protect_ids:
+                    self.logger.debug(f'RDS Protect, {db_instance_id} 인스턴스는 중지되지 않습니다.')
+                    results.append(MutationResult('RDS', db_instance_id, MutationResult.PROTECTED, current_state))
+                else:
+                    tasks.append(('RDS', db_instance_id, partial(self.action_db_instance, rds, action, db_instance_id)))
+        except Exception as e:
+            self.logger.error(f'RDS Error: {e}')
+            return results
+
+        results += self.mutation_executor.run(tasks)
+        self.record_mutation('rds')
+        return results
+
+    def action_db_instance(self, rds, action: str, db_instance_id: str) -> MutationResult:
+        """RDS 인스턴스 하나를 시작하거나 중지합니다."""
+        try:
+            if action == 'start':
+                response = rds.start_db_instance(DBInstanceIdentifier=db_instance_id)
+                self.logger.debug(f'RDS {db_instance_id} 인스턴스 시작: {response}')
+            else:
+                response = rds.stop_db_instance(DBInstanceIdentifier=db_instance_id)
+                self.logger.debug(f'RDS {db_instance_id} 인스턴스 중지: {response}')
+
+            return MutationResult('RDS', db_instance_id, MutationResult.SUCCESS, response['DBInstance']['DBInstanceStatus'])
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'InvalidDBInstanceState':
+                self.logger.error(f'RDS Error: {e.response['Error']['Message']}')
+                instance_info = rds.describe_db_instances(DBInstanceIdentifier=db_instance_id)
+                current_state = instance_info['DBInstances'][0]['DBInstanceStatus']
+                self.logger.error(f'RDS 인스턴스 상태: {current_state}')
+                return MutationResult('RDS', db_instance_id, MutationResult.SKIPPED, current_state)
+
+            self.logger.error(f'알 수 없는 오류 발생: {e}')
+            return MutationResult('RDS', db_instance_id, MutationResult.ERROR, str(e))
 
     # EC2
-    def manage_ec2_instance(self, action: str, ec2_instance_ids: list = []) -> bool:
+    def manage_ec2_instance(self, action: str, ec2_instance_ids: list = []) -> list[MutationResult]:
         """
         EC2 인스턴스 상태를 변경하는 함수.
 
+        대상 인스턴스를 모두 모은 뒤 여러 ID를 묶어서 한 번에 시작/중지하고,
+        인스턴스별 결과를 반환합니다.
+
         :param action: EC2 인스턴스에서 수행할 작업.
                     'start'는 인스턴스를 시작하고,
                     'stop'은 인스턴스를 중지합니다.
         :type action: str
         """
-        ec2 = boto3.client('ec2')
+        ec2 = self.client_pool.get('ec2')
         try:
-            describe_instances = ec2.describe_instances()
-            for instance in describe_instances['Reservations']:
-                ec2_instance_id = instance['Instances'][0]['InstanceId']
-
-                def action_ec2_instance():
-                    current_state = instance['Instances'][0]['State']['Name']
-
-                    # 인스턴스를 시작하려면 'stopped' 상태여야 합니다.
-                    if action == 'start' and current_state != 'stopped':
-                        self.logger.debug(f'EC2 {ec2_instance_id} 인스턴스는 {current_state} 상태입니다.')
-                        return False
-                    # 인스턴스를 중지하려면 'running' 상태여야 합니다.
-                    if action == 'stop' and current_state != 'running':
-                        self.logger.debug(f'EC2 {ec2_instance_id} 인스턴스는 {current_state} 상태입니다.')
-                        return False
-                    
-                    if action == 'start':
-                        response = ec2.start_instances(InstanceIds=[ec2_instance_id])
-                        self.logger.debug(f'EC2 {ec2_instance_id} 인스턴스 시작: {response}')
-                    elif action == 'stop':
-                        response = ec2.stop_instances(InstanceIds=[ec2_instance_id])
-                        self.logger.debug(f'EC2 {ec2_instance_id} 인스턴스 중지: {response}')
-                    else:
-                        self.logger.error(f'EC2 인스턴스 {action}는 존재하지 않는 action입니다.')
-                        return False
-
-                    return True
-
-                if not ec2_instance_ids or (ec2_instance_id in ec2_instance_ids):
-                    action_ec2_instance()
-
+            # 시작/중지 대상은 인스턴스 ID로만 고릅니다. 같은 Name 태그를 가진 다른 인스턴스를 건드리지 않습니다.
+            instances = self.resource_lister.iter_ec2_instances(ec2, ec2_instance_ids, match_names=False)
+            return self.ec2_state_transition.transition(ec2, action, instances)
         except Exception as e:
             self.logger.error(f'EC2 Error: {e}')
-            return False
-        
-        return True
+            return []
+        finally:
+            self.record_mutation('ec2')
     
     # Auto Scaling Group
-    def update_auto_scaling_group_capacity(self, asg_info_list: dict = {}, default_desired_capacity: int = 0) -> None:
+    def update_auto_scaling_group_capacity(self, asg_info_list: dict = {}, default_desired_capacity: int = 0) -> list[MutationResult]:
         """
         Auto Scaling 그룹의 Desired Capacity를 업데이트하는 함수.
+
+        용량을 바꿔야 하는 그룹만 mutation_executor로 동시에 업데이트하고, 그룹별 결과를 반환합니다.
         """
-        autoscaling = boto3.client('autoscaling')
-
-        describe_auto_scaling_groups = autoscaling.describe_auto_scaling_groups()
-        for group in describe_auto_scaling_groups['AutoScalingGroups']:
-            group_name = group['AutoScalingGroupName']
-
-            def update_desired_capacity():
-                if not asg_info_list or (group_name in asg_info_list):
-                    # desired capacity가 사용자가 원하는 용량이랑 똑같은지 확인하여 원래 값이랑 같을 경우 로그만 남깁니다.
-                    desired_capacity = asg_info_list[group_name]['DesiredCapacity'] if asg_info_list else default_desired_capacity
-                    if group['DesiredCapacity'] == desired_capacity:
-                        self.logger.debug(f'{group_name}의 원하는 용량은 이미 {desired_capacity} 입니다.')
-                        return False
-                    
-                    try:
-                        autoscaling.update_auto_scaling_group(
-                            AutoScalingGroupName=group_name,
-                            DesiredCapacity=desired_capacity
-                        )
-
-                        self.logger.debug(f'{group_name}의 원하는 용량을 {desired_capacity} 값으로 업데이트했습니다.')
-                    except Exception as e:
-                        self.logger.error(f'{group_name} 업데이트 중 오류 발생: {e}')
-                        return False
-            
-            update_desired_capacity()
-
-    def all_update_auto_scaling_group_capacity(self, desired_capacity: int = 0) -> str:
-        self.update_auto_scaling_group_capacity(default_desired_capacity=desired_capacity)
-        return f'모든 ASG의 원하는 용량을 {desired_capacity} 값으로 변경했습니다.'
+        autoscaling = self.client_pool.get('autoscaling')
+        results = []
+        tasks = []
+
+        try:
+            for group in self.resource_lister.iter_auto_scaling_groups(autoscaling, list(asg_info_list)):
+                group_name = group['AutoScalingGroupName']
+
+                # desired capacity가 사용자가 원하는 용량이랑 똑같은지 확인하여 원래 값이랑 같을 경우 로그만 남깁니다.
+                desired_capacity = asg_info_list[group_name]['DesiredCapacity'] if asg_info_list else default_desired_capacity
+                if group['DesiredCapacity'] == desired_capacity:
+                    self.logger.debug(f'{group_name}의 원하는 용량은 이미 {desired_capacity} 입니다.')
+                    results.append(MutationResult('ASG', group_name, MutationResult.SKIPPED, str(desired_capacity)))
+                else:
+                    tasks.append(('ASG', group_name, partial(self.update_desired_capacity, autoscaling, group_name, desired_capacity)))
+        except Exception as e:
+            self.logger.error(f'ASG Error: {e}')
+            return results
+
+        results += self.mutation_executor.run(tasks)
+        # ASG 용량을 바꾸면 EC2 인스턴스 목록도 달라집니다.
+        self.record_mutation('asg', 'ec2')
+        return results
+
+    def update_desired_capacity(self, autoscaling, group_name: str, desired_capacity: int) -> MutationResult:
+        """Auto Scaling 그룹 하나의 Desired Capacity를 변경합니다."""
+        try:
+            autoscaling.update_auto_scaling_group(
+                AutoScalingGroupName=group_name,
+                DesiredCapacity=desired_capacity
+            )
+
+            self.logger.debug(f'{group_name}의 원하는 용량을 {desired_capacity} 값으로 업데이트했습니다.')
+            return MutationResult('ASG', group_name, MutationResult.SUCCESS, str(desired_capacity))
+        except Exception as e:
+            self.logger.error(f'{group_name} 업데이트 중 오류 발생: {e}')
+            return MutationResult('ASG', group_name, MutationResult.ERROR, str(e))
+
+    def all_update_auto_scaling_group_capacity(self, desired_capacity: int = 0, on_complete: Callable[[str], None] = None) -> str:
+        results = self.update_auto_scaling_group_capacity(default_desired_capacity=desired_capacity)
+        self.track_completion(f'desired_{desired_capacity}', results, on_complete)
+        return f'모든 ASG의 원하는 용량을 {desired_capacity} 값으로 변경했습니다.\n{summarize_results(results)}'
+
+    def track_completion(self, action: str, results: list[MutationResult], on_complete: Callable[[str], None] = None):
+        """
+        변경된 리소스가 목표 상태에 도달할 때까지 백그라운드에서 기다린 뒤,
+        최종 상태와 경과 시간을 on_complete로 한 번 전달합니다.
+
+        :param on_complete: 완료 메시지를 받을 함수. 없으면 추적하지 않습니다.
+        """
+        if not on_complete:
+            return
+
+        def wait_for_target_state():
+            try:
+                on_complete(self.state_waiter.wait(action, results))
+            except Exception as e:
+                self.logger.error(f"'{action}' 완료 추적 실패: {e}")
+
+        self.completion_executor.submit(wait_for_target_state)
+
+    def shutdown(self, timeout: float = None) -> bool:
+        """
+        진행 중인 완료 추적을 끝내고 추적 스레드를 정리합니다. 모두 끝나면 True를 반환합니다.
+
+        :param timeout: 진행 중인 상태 조회를 기다리는 최대 시간(초), None이면 끝날 때까지 기다립니다.
+        """
+        self.state_waiter.stop()
+        return self.completion_executor.drain(timeout)
 
     # Custom Resources
-    def start_custom_all_resources(self) -> str:
+    def start_custom_all_resources(self, on_complete: Callable[[str], None] = None) -> str:
         """
         설정에 있는 모든 리소스를 시작하는 함수.
         RDS, EC2, kOps를 시작하는 함수입니다.
@@ -224,13 +275,12 @@ class AWSInstanceController:
                 self.worker: {'DesiredCapacity': 1}
             })
 
-            ec2_future.result()
-            rds_future.result()
-            asg_future.result()
+            results = ec2_future.result() + rds_future.result() + asg_future.result()
 
-        return '특정된 모든 리소스가 시작되었습니다.'
+        self.track_completion('start', results, on_complete)
+        return f'특정된 모든 리소스가 시작되었습니다.\n{summarize_results(results)}'
 
-    def stop_custom_all_resources(self) -> str:
+    def stop_custom_all_resources(self, on_complete: Callable[[str], None] = None) -> str:
         """
         설정에 있는 모든 리소스를 중지하는 함수.
         RDS, EC2, kOps를 중지하는 함수입니다.
@@ -243,322 +293,291 @@ class AWSInstanceController:
                 self.worker: {'DesiredCapacity': 0}
             })
 
-            ec2_future.result()
-            rds_future.result()
-            asg_future.result()
+            results = ec2_future.result() + rds_future.result() + asg_future.result()
+
+        self.track_completion('stop', results, on_complete)
+        return f'특정된 모든 리소스가 중지되었습니다.\n{summarize_results(results)}'
 
-        return '특정된 모든 리소스가 중지되었습니다.'
+    def custom_status_lookups(self) -> list[Callable]:
+        return [
+            partial(self.status_all_ec2_instances, self.ec2_instance_ids),
+            partial(self.status_all_rds_instances, self.db_instance_ids),
+            partial(self.status_all_auto_scaling_groups, [self.control_plane, self.worker])
+        ]
 
     def status_custom_all_resources(self) -> str:
         """설정에 있는 RDS, EC2, kOps의 상태를 확인하는 함수입니다."""
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            ec2_future = executor.submit(self.status_all_ec2_instances, self.ec2_instance_ids)
-            rds_future = executor.submit(self.status_all_rds_instances, self.db_instance_ids)
-            asg_future = executor.submit(self.status_all_auto_scaling_groups, [self.control_plane, self.worker])
-            
-            ec2_output = self.format_output(ec2_future.result())
-            rds_output = self.format_output(rds_future.result())
-            asg_output = self.format_output(asg_future.result())
+        return '\n\n'.join(self.iter_status_outputs(self.custom_status_lookups()))
 
-        return f'{ec2_output}\n\n{rds_output}\n\n{asg_output}'
+    def iter_status_custom_all_resources(self) -> Iterator[str]:
+        """설정에 있는 RDS, EC2, kOps의 상태를 조회가 끝나는 순서대로 반환합니다."""
+        return self.iter_status_outputs(self.custom_status_lookups(), ordered=False)
 
     # ALL
     ## EC2
-    def start_all_ec2_instances(self) -> str:
-        self.manage_ec2_instance('start')
-        return '모든 EC2 인스턴스를 시작합니다.'
+    def start_all_ec2_instances(self, on_complete: Callable[[str], None] = None) -> str:
+        results = self.manage_ec2_instance('start')
+        self.track_completion('start', results, on_complete)
+        return f'모든 EC2 인스턴스를 시작합니다.\n{summarize_results(results)}'
 
-    def stop_all_ec2_instances(self) -> str:
-        self.manage_ec2_instance('stop')
-        return '모든 EC2 인스턴스를 중지합니다.'
+    def stop_all_ec2_instances(self, on_complete: Callable[[str], None] = None) -> str:
+        results = self.manage_ec2_instance('stop')
+        self.track_completion('stop', results, on_complete)
+        return f'모든 EC2 인스턴스를 중지합니다.\n{summarize_results(results)}'
 
     ## RDS
-    def start_all_rds_instances(self) -> str:
-        self.manage_rds_instance('start')
-        return '모든 RDS 인스턴스를 시작합니다.'
+    def start_all_rds_instances(self, on_complete: Callable[[str], None] = None) -> str:
+        results = self.manage_rds_instance('start')
+        self.track_completion('start', results, on_complete)
+        return f'모든 RDS 인스턴스를 시작합니다.\n{summarize_results(results)}'
     
-    def stop_all_rds_instances(self) -> str:
-        self.manage_rds_instance('stop')
-        return '모든 RDS 인스턴스를 중지합니다.'
+    def stop_all_rds_instances(self, on_complete: Callable[[str], None] = None) -> str:
+        results = self.manage_rds_instance('stop')
+        self.track_completion('stop', results, on_complete)
+        return f'모든 RDS 인스턴스를 중지합니다.\n{summarize_results(results)}'
 
     ## Status
-    def status_all_ec2_instances(self, instances: list = []) -> list[dict]:
-        cloudwatch = boto3.client('cloudwatch', region_name=self.region)
-        ec2 = boto3.client('ec2')
-        ec2_info_list = []
-
+    def status_all_ec2_instances(self, instances: list = [], refresh: bool = False) -> list[EC2Status]:
+        """EC2 상태를 반환합니다. 캐시가 만료되지 않았으면 캐시된 결과를 사용합니다."""
         try:
-            describe_instances = ec2.describe_instances()
-            for reservation in describe_instances['Reservations']:
-                for instance in reservation['Instances']:
-                    # 인스턴스 이름을 태그에서 가져오기
-                    def get_instance_name():
-                        if 'Tags' in instance:
-                            for tag in instance['Tags']:
-                                if tag['Key'] == 'Name':
-                                    return tag['Value']
-                                
-                        return None
-
-                    instance_name = get_instance_name()
-                    if not instances or (instance['InstanceId'] in instances) or (instance_name in instances):
-                        def get_launch_time():
-                            launch_time = instance['LaunchTime']  # UTC
-                            utc_zone = pytz.utc
-                            kst_zone = pytz.timezone('Asia/Seoul')
-                            launch_time_utc = launch_time.replace(tzinfo=utc_zone)
-                            launch_time_kst = launch_time_utc.astimezone(kst_zone)
-                            return launch_time_kst.isoformat()
-
-                        network = self.get_network_utilization(cloudwatch, instance['InstanceId'])
-
-                        instance_info = {
-                            'EC2_ID': instance['InstanceId'],
-                            'State': instance['State']['Name'],
-                            'LaunchTime': get_launch_time(),
-                            'Type': instance['InstanceType'],
-                            'PrivateIpAddress': instance.get('PrivateIpAddress', None),
-                            'PublicIpAddress': instance.get('PublicIpAddress', None),
-                            'CPU': self.get_cpu_utilization(cloudwatch, instance['InstanceId']),
-                            'RAM': self.get_ram_utilization(cloudwatch, instance['InstanceId']),
-                            'NetworkIn': network['NetworkIn'],
-                            'NetworkOut': network['NetworkOut'],
-                        }
-
-                        if instance_name:
-                            instance_info['Name'] = instance_name
-                        
-                        ec2_info_list.append(instance_info)
-
+            ec2_info_list = self.inventory_cache.get(
+                'ec2',
+                tuple(instances),
+                partial(self.fetch_ec2_instances, instances),
+                refresh
+            )
         except Exception as e:
             return f'오류 발생: {e}'
 
-        return ec2_info_list
+        return list(ec2_info_list)
 
-    def get_cpu_utilization(self, cloudwatch, instance_id) -> float:
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(minutes=5)
-
-        response = cloudwatch.get_metric_statistics(
-            Namespace='AWS/EC2',
-            MetricName='CPUUtilization',
-            Dimensions=[
-                {
-                    'Name': 'InstanceId',
-                    'Value': instance_id
-                },
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=60,
-            Statistics=['Average']
-        )
+    def fetch_ec2_instances(self, instances: list = []) -> list[EC2Status]:
+        cloudwatch = self.client_pool.get('cloudwatch', self.region)
+        ec2 = self.client_pool.get('ec2')
+        ec2_info_list = []
 
-        data_points = response['Datapoints']
-        if data_points:
-            average_cpu = data_points[-1]['Average']
-            return f'{average_cpu:.2f}'
-        else:
-            return 0
-    
-    def get_ram_utilization(self, cloudwatch, instance_id) -> float:
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(minutes=5)
-
-        response = cloudwatch.get_metric_statistics(
-            Namespace='CWAgent',
-            MetricName='mem_used_percent',
-            Dimensions=[
-                {
-                    'Name': 'InstanceId',
-                    'Value': instance_id
-                },
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=60,
-            Statistics=['Average']
-        )
-        data_points = response['Datapoints']
-        if data_points:
-            return f'{data_points[-1]['Average']:.2f}'
-        else:
-            return 0
-        
-    def get_network_utilization(self, cloudwatch, instance_id) -> dict:
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(minutes=5)
-
-        response_in = cloudwatch.get_metric_statistics(
-            Namespace='AWS/EC2',
-            MetricName='NetworkIn',
-            Dimensions=[
-                {
-                    'Name': 'InstanceId',
-                    'Value': instance_id
-                },
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=60,
-            Statistics=['Average']
-        )
+        selected_instances = []
+        for instance in self.resource_lister.iter_ec2_instances(ec2, instances):
+            # 인스턴스 이름을 태그에서 가져오기
+            def get_instance_name():
+                if 'Tags' in instance:
+                    for tag in instance['Tags']:
+                        if tag['Key'] == 'Name':
+                            return tag['Value']
+                        
+                return None
 
-        response_out = cloudwatch.get_metric_statistics(
-            Namespace='AWS/EC2',
-            MetricName='NetworkOut',
-            Dimensions=[
-                {
-                    'Name': 'InstanceId',
-                    'Value': instance_id
-                },
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=60,
-            Statistics=['Average']
+            selected_instances.append((instance, get_instance_name()))
+
+        # 선택된 모든 인스턴스의 지표를 GetMetricData로 한 번에 조회합니다.
+        metrics = self.metric_collector.collect(
+            cloudwatch,
+            [instance['InstanceId'] for instance, _ in selected_instances]
         )
 
-        data_points_in = response_in['Datapoints']
-        data_points_out = response_out['Datapoints']
+        for instance, instance_name in selected_instances:
+            def get_launch_time():
+                launch_time = instance['LaunchTime']  # UTC
+                utc_zone = pytz.utc
+                kst_zone = pytz.timezone('Asia/Seoul')
+                launch_time_utc = launch_time.replace(tzinfo=utc_zone)
+                launch_time_kst = launch_time_utc.astimezone(kst_zone)
+                return launch_time_kst.isoformat()
+
+            instance_metrics = metrics[instance['InstanceId']]
+
+            ec2_info_list.append(EC2Status(
+                ec2_id=instance['InstanceId'],
+                state=instance['State']['Name'],
+                launch_time=get_launch_time(),
+                instance_type=instance['InstanceType'],
+                private_ip=instance.get('PrivateIpAddress', None),
+                public_ip=instance.get('PublicIpAddress', None),
+                cpu=instance_metrics['CPU'],
+                ram=instance_metrics['RAM'],
+                network_in=instance_metrics['NetworkIn'],
+                network_out=instance_metrics['NetworkOut'],
+                name=instance_name
+            ))
 
-        network_in = data_points_in[-1]['Average'] if data_points_in else 0
-        network_out = data_points_out[-1]['Average'] if data_points_out else 0
+        return ec2_info_list
 
-        return {
-            'NetworkIn': network_in,
-            'NetworkOut': network_out
-        }
+    def status_all_rds_instances(self, instances: list = [], refresh: bool = False) -> list[RDSStatus]:
+        """RDS 상태를 반환합니다. 캐시가 만료되지 않았으면 캐시된 결과를 사용합니다."""
+        try:
+            rds_info_list = self.inventory_cache.get(
+                'rds',
+                tuple(instances),
+                partial(self.fetch_rds_instances, instances),
+                refresh
+            )
+        except Exception as e:
+            return f'오류 발생: {e}'
+
+        return list(rds_info_list)
 
-    def status_all_rds_instances(self, instances: list = []) -> list[dict]:
-        rds = boto3.client('rds')
+    def fetch_rds_instances(self, instances: list = []) -> list[RDSStatus]:
+        rds = self.client_pool.get('rds')
         rds_info_list = []
 
-        try:
-            describe_db_instances = rds.describe_db_instances()
-            for db_instance in describe_db_instances['DBInstances']:
-                if not instances or (db_instance['DBInstanceIdentifier'] in instances):
-                    instance_info = {
-                        'RDS_Identifier': db_instance['DBInstanceIdentifier'],
-                        'Status': db_instance['DBInstanceStatus'],
-                        'Class': db_instance['DBInstanceClass'],
-                        'EngineVersion': db_instance['EngineVersion']
-                    }
-
-                    rds_info_list.append(instance_info)
+        for db_instance in self.resource_lister.iter_db_instances(rds, instances):
+            rds_info_list.append(RDSStatus(
+                rds_identifier=db_instance['DBInstanceIdentifier'],
+                status=db_instance['DBInstanceStatus'],
+                instance_class=db_instance['DBInstanceClass'],
+                engine_version=db_instance['EngineVersion']
+            ))
+
+        return rds_info_list
 
+    def status_all_auto_scaling_groups(self, groups: list = [], refresh: bool = False) -> list[ASGStatus]:
+        """ASG 상태를 반환합니다. 캐시가 만료되지 않았으면 캐시된 결과를 사용합니다."""
+        try:
+            asg_info_list = self.inventory_cache.get(
+                'asg',
+                tuple(groups),
+                partial(self.fetch_auto_scaling_groups, groups),
+                refresh
+            )
         except Exception as e:
             return f'오류 발생: {e}'
 
-        # return '\n'.join(rds_info_list)
-        return rds_info_list
+        return list(asg_info_list)
 
-    def status_all_auto_scaling_groups(self, groups: list = []) -> list[dict]:
-        autoscaling = boto3.client('autoscaling')
+    def fetch_auto_scaling_groups(self, groups: list = []) -> list[ASGStatus]:
+        autoscaling = self.client_pool.get('autoscaling')
         asg_info_list = []
 
-        try:
-            describe_auto_scaling_groups = autoscaling.describe_auto_scaling_groups()
-            for asg in describe_auto_scaling_groups['AutoScalingGroups']:
-                if not groups or asg['AutoScalingGroupName'] in groups:
-                    asg_info = {
-                        'ASG_NAME': asg['AutoScalingGroupName'],
-                        'Instances': len(asg['Instances']),
-                        'DesiredCapacity': asg['DesiredCapacity'],
-                        'MinSize': asg['MinSize'],
-                        'MaxSize': asg['MaxSize'],
-                        'DefaultCooldown': asg['DefaultCooldown']
-                    }
-
-                    asg_info_list.append(asg_info)
-
-        except Exception as e:
-            return f'오류 발생: {e}'
+        for asg in self.resource_lister.iter_auto_scaling_groups(autoscaling, groups):
+            asg_info_list.append(ASGStatus(
+                asg_name=asg['AutoScalingGroupName'],
+                instances=len(asg['Instances']),
+                desired_capacity=asg['DesiredCapacity'],
+                min_size=asg['MinSize'],
+                max_size=asg['MaxSize'],
+                default_cooldown=asg['DefaultCooldown']
+            ))
 
         return asg_info_list
 
     ## ALL Resources
+    def iter_status_outputs(self, lookups: list[Callable], ordered: bool = True) -> Iterator[str]:
+        """
+        상태 조회 함수를 동시에 실행하고 결과를 Slack 메시지로 만들어 하나씩 반환합니다.
+
+        :param lookups: 리소스 종류별 상태 조회 함수
+        :param ordered: False이면 lookups 순서 대신 먼저 끝난 조회부터 반환합니다.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+            futures = [executor.submit(lookup) for lookup in lookups]
+            for future in futures if ordered else concurrent.futures.as_completed(futures):
+                yield self.format_output(future.result())
+
     def status_all_resources(self) -> str:
         """모든 인스턴스의 상태를 확인"""
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            ec2_future = executor.submit(self.status_all_ec2_instances)
-            rds_future = executor.submit(self.status_all_rds_instances)
-            asg_future = executor.submit(self.status_all_auto_scaling_groups)
+        return '\n\n'.join(self.iter_status_outputs(self.all_status_lookups()))
+
+    def iter_status_all_resources(self) -> Iterator[str]:
+        """모든 인스턴스의 상태를 조회가 끝나는 순서대로 반환합니다."""
+        return self.iter_status_outputs(self.all_status_lookups(), ordered=False)
 
-            ec2_output = self.format_output(ec2_future.result())
-            rds_output = self.format_output(rds_future.result())
-            asg_output = self.format_output(asg_future.result())
+    def all_status_lookups(self) -> list[Callable]:
+        return [self.status_all_ec2_instances, self.status_all_rds_instances, self.status_all_auto_scaling_groups]
 
-        return f"{ec2_output}\n\n{rds_output}\n\n{asg_output}"
-        
-    def start_all_resources(self) -> str:
+    def start_all_resources(self, on_complete: Callable[[str], None] = None) -> str:
         """모든 인스턴스를 시작합니다."""
         with concurrent.futures.ThreadPoolExecutor() as executor:
             ec2_future = executor.submit(self.manage_ec2_instance, 'start')
             rds_future = executor.submit(self.manage_rds_instance, 'start')
             asg_future = executor.submit(self.update_auto_scaling_group_capacity, default_desired_capacity=1)
 
-            ec2_future.result()
-            rds_future.result()
-            asg_future.result()
+            results = ec2_future.result() + rds_future.result() + asg_future.result()
 
-        return '모든 리소스를 시작합니다.'
+        self.track_completion('start', results, on_complete)
+        return f'모든 리소스를 시작합니다.\n{summarize_results(results)}'
 
-    def stop_all_resources(self) -> str:
+    def stop_all_resources(self, on_complete: Callable[[str], None] = None) -> str:
         """모든 인스턴스를 중지합니다."""
         with concurrent.futures.ThreadPoolExecutor() as executor:
             ec2_future = executor.submit(self.manage_ec2_instance, 'stop')
             rds_future = executor.submit(self.manage_rds_instance, 'stop')
             asg_future = executor.submit(self.update_auto_scaling_group_capacity, default_desired_capacity=0)
 
-            ec2_future.result()
-            rds_future.result()
-            asg_future.result()
+            results = ec2_future.result() + rds_future.result() + asg_future.result()
 
-        return '모든 리소스를 중지했습니다.'
+        self.track_completion('stop', results, on_complete)
+        return f'모든 리소스를 중지했습니다.\n{summarize_results(results)}'
 
 class IAMPolicyManager:
     """IAM 정책을 관리하는 클래스입니다.
 
+    attach_policies로 필요한 정책이 빠진 역할(드리프트)을 찾아 다시 연결하고, 이전 확인 이후 분리된 정책을 경고로 남깁니다.
+    생성할 때는 IAM을 호출하지 않으며, 모니터링 주기와 별도로 느린 주기나 필요할 때만 호출합니다.
+
     Parameters:
         role_names (list[str]): IAM 역할 이름의 목록
         logger (logging.Logger): 로깅을 위한 Logger
+        client_pool (AWSClientPool): boto3 client 저장소, 지정하지 않으면 프로세스 공용 저장소를 사용
+        max_workers (int): 역할을 동시에 확인할 최대 스레드 수
     """
-    def __init__(self, role_names: list[str], logger: logging.Logger):
+    def __init__(self, role_names: list[str], logger: logging.Logger, client_pool: AWSClientPool = None, max_workers: int = 8):
         self.logger = logger
         self.role_names = role_names
-        self.iam_client = boto3.client('iam')
+        self.client_pool = client_pool or get_client_pool()
+        self.iam_client = self.client_pool.get('iam')
+        self.max_workers = max_workers
         self.policies = [
             'arn:aws:iam::aws:policy/CloudWatchAgentServerPolicy',
             'arn:aws:iam::aws:policy/AmazonSSMFullAccess',
             'arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore'
         ]
+        # 역할 이름 -> 마지막으로 확인한 연결된 정책 ARN 집합, 분리된 정책을 찾는 데 사용합니다.
+        self.attached_policies = {}
+
+    def attach_policies(self) -> list[str]:
+        """모든 역할을 동시에 확인하여 빠진 정책을 추가하고, 추가한 '역할: 정책' 목록을 반환합니다."""
+        if not self.role_names:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.role_names))) as executor:
+            results = executor.map(self.reconcile_role, self.role_names)
+            return [attached for result in results for attached in result]
+
+    def reconcile_role(self, role_name: str) -> list[str]:
+        """역할 하나의 연결된 정책을 확인하고 빠진 정책을 추가합니다."""
+        previous = self.attached_policies.get(role_name)
 
-        self.attach_policies()
-
-    def attach_policies(self):
-        """Role에 정책을 추가합니다."""
-        for role_name in self.role_names:
-            attached_policies = self.list_attached_policies(role_name)
-            attached_policy_arns = {policy['PolicyArn'] for policy in attached_policies}
-
-            for policy_arn in self.policies:
-                if policy_arn not in attached_policy_arns:
-                    try:
-                        self.iam_client.attach_role_policy(
-                            RoleName=role_name,
-                            PolicyArn=policy_arn
-                        )
-                        self.logger.debug(f'{role_name}에 정책 추가됨: {policy_arn}')
-                    except Exception as e:
-                        self.logger.error(f'{role_name}에 정책 추가 실패: {policy_arn}, 오류: {e}')
-
-    def list_attached_policies(self, role_name):
         try:
-            response = self.iam_client.list_attached_role_policies(
-                RoleName=role_name
-            )
-            return response['AttachedPolicies']
+            attached_policy_arns = {policy['PolicyArn'] for policy in self.list_attached_policies(role_name)}
         except Exception as e:
             self.logger.error(f'{role_name} 정책 목록 조회 실패, 오류: {e}')
             return []
+
+        if previous is not None:
+            for policy_arn in previous - attached_policy_arns:
+                self.logger.warning(f'{role_name}에서 정책이 분리됨: {policy_arn}')
+
+        attached = []
+        for policy_arn in self.policies:
+            if policy_arn not in attached_policy_arns:
+                try:
+                    self.iam_client.attach_role_policy(
+                        RoleName=role_name,
+                        PolicyArn=policy_arn
+                    )
+                    attached_policy_arns.add(policy_arn)
+                    attached.append(f'{role_name}: {policy_arn}')
+                    self.logger.debug(f'{role_name}에 정책 추가됨: {policy_arn}')
+                except Exception as e:
+                    self.logger.error(f'{role_name}에 정책 추가 실패: {policy_arn}, 오류: {e}')
+
+        self.attached_policies[role_name] = attached_policy_arns
+        return attached
+
+    def list_attached_policies(self, role_name: str) -> list[dict]:
+        paginator = self.iam_client.get_paginator('list_attached_role_policies')
+        attached_policies = []
+        for page in paginator.paginate(RoleName=role_name):
+            attached_policies.extend(page['AttachedPolicies'])
+
+        return attached_policies
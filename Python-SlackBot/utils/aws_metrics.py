@@ -0,0 +1,104 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+class CloudWatchMetricCollector:
+    """CloudWatch GetMetricData로 여러 EC2 인스턴스의 지표를 한 번에 조회하는 클래스입니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        period (int): 지표 집계 주기(초)
+        lookback_minutes (int): 현재 시각 기준으로 조회할 구간(분)
+    """
+    # GetMetricData 한 번의 호출에 담을 수 있는 최대 쿼리 수
+    MAX_QUERIES_PER_CALL = 500
+
+    # (결과 키, Namespace, MetricName)
+    METRICS = (
+        ('CPU', 'AWS/EC2', 'CPUUtilization'),
+        ('RAM', 'CWAgent', 'mem_used_percent'),
+        ('NetworkIn', 'AWS/EC2', 'NetworkIn'),
+        ('NetworkOut', 'AWS/EC2', 'NetworkOut'),
+    )
+
+    def __init__(self, logger: logging.Logger, period: int = 60, lookback_minutes: int = 5):
+        self.logger = logger
+        self.period = period
+        self.lookback_minutes = lookback_minutes
+
+    def build_queries(self, instance_ids: list[str]) -> tuple[list[dict], dict]:
+        """모든 인스턴스의 지표 쿼리와 쿼리 ID -> (인스턴스 ID, 결과 키) 매핑을 만듭니다."""
+        queries = []
+        query_map = {}
+
+        for index, instance_id in enumerate(instance_ids):
+            for metric_index, (key, namespace, metric_name) in enumerate(self.METRICS):
+                # 쿼리 ID는 소문자로 시작하고 영문, 숫자, '_'만 사용할 수 있습니다.
+                query_id = f'm{index}_{metric_index}'
+                query_map[query_id] = (instance_id, key)
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': namespace,
+                            'MetricName': metric_name,
+                            'Dimensions': [
+                                {
+                                    'Name': 'InstanceId',
+                                    'Value': instance_id
+                                },
+                            ]
+                        },
+                        'Period': self.period,
+                        'Stat': 'Average'
+                    },
+                    'ReturnData': True
+                })
+
+        return queries, query_map
+
+    def collect(self, cloudwatch, instance_ids: list[str]) -> dict[str, dict]:
+        """
+        인스턴스별 CPU, RAM, NetworkIn, NetworkOut 지표를 조회하는 함수.
+
+        쿼리를 500개 단위로 나누어 GetMetricData를 호출하고 NextToken을 따라갑니다.
+        반환값은 인스턴스 ID별로 {'CPU', 'RAM', 'NetworkIn', 'NetworkOut'}의 최신 값을 담은 dict이며,
+        데이터가 없는 지표는 None입니다.
+
+        :param cloudwatch: CloudWatch boto3 client
+        :param instance_ids: 지표를 조회할 EC2 인스턴스 ID 목록
+        """
+        if not instance_ids:
+            return {}
+
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(minutes=self.lookback_minutes)
+
+        queries, query_map = self.build_queries(instance_ids)
+        latest_values = {}
+
+        paginator = cloudwatch.get_paginator('get_metric_data')
+        for offset in range(0, len(queries), self.MAX_QUERIES_PER_CALL):
+            pages = paginator.paginate(
+                MetricDataQueries=queries[offset:offset + self.MAX_QUERIES_PER_CALL],
+                StartTime=start_time,
+                EndTime=end_time,
+                ScanBy='TimestampDescending'
+            )
+            for page in pages:
+                for result in page['MetricDataResults']:
+                    # 최신 값이 먼저 오므로 처음 받은 값만 사용합니다.
+                    if result['Values'] and result['Id'] not in latest_values:
+                        latest_values[result['Id']] = result['Values'][0]
+
+                for message in page.get('Messages', []):
+                    self.logger.debug(f'GetMetricData 메시지: {message}')
+
+        metrics = {
+            instance_id: dict.fromkeys(('CPU', 'RAM', 'NetworkIn', 'NetworkOut'))
+            for instance_id in instance_ids
+        }
+        for query_id, value in latest_values.items():
+            instance_id, key = query_map[query_id]
+            metrics[instance_id][key] = value
+
+        return metrics
@@ -0,0 +1,195 @@
+import logging
+import concurrent.futures
+from dataclasses import dataclass
+from typing import Callable, Iterable
+from botocore.exceptions import ClientError
+from utils.aws_resources import chunked
+
+@dataclass
+class MutationResult:
+    """리소스 하나에 대한 상태 변경 결과입니다.
+
+    Attributes:
+        resource_type (str): 리소스 종류 ('EC2', 'RDS', 'ASG')
+        resource_id (str): 리소스 ID
+        status (str): 처리 결과 ('success', 'skipped', 'protected', 'error', 'unknown')
+        message (str): 상태 또는 오류 설명
+    """
+    SUCCESS = 'success'
+    SKIPPED = 'skipped'
+    PROTECTED = 'protected'
+    ERROR = 'error'
+    # 제한 시간 안에 응답이 없어 실제로 변경되었는지 알 수 없는 경우
+    UNKNOWN = 'unknown'
+
+    resource_type: str
+    resource_id: str
+    status: str
+    message: str = ''
+
+def summarize_results(results: list[MutationResult]) -> str:
+    """리소스 종류별 처리 결과 개수와 실패한 리소스를 Slack 메시지 형식으로 정리합니다."""
+    labels = {
+        MutationResult.SUCCESS: '성공',
+        MutationResult.SKIPPED: '건너뜀',
+        MutationResult.PROTECTED: '보호됨',
+        MutationResult.ERROR: '실패',
+        MutationResult.UNKNOWN: '확인 필요'
+    }
+
+    counts = {}
+    for result in results:
+        counts.setdefault(result.resource_type, dict.fromkeys(labels, 0))[result.status] += 1
+
+    lines = [
+        f'{resource_type} - ' + ', '.join(f'{labels[status]}: {count}' for status, count in status_counts.items())
+        for resource_type, status_counts in counts.items()
+    ]
+    lines += [
+        f'{result.resource_type} {result.resource_id} 실패: {result.message}'
+        for result in results if result.status == MutationResult.ERROR
+    ]
+    lines += [
+        f'{result.resource_type} {result.resource_id} 확인 필요: {result.message}'
+        for result in results if result.status == MutationResult.UNKNOWN
+    ]
+
+    return '\n'.join(lines) if lines else '변경할 리소스가 없습니다.'
+
+class MutationExecutor:
+    """리소스 변경 API 호출을 제한된 수의 스레드로 동시에 실행하는 클래스입니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        max_workers (int): 동시에 실행할 최대 호출 수
+        timeout (float): 한 번의 run에서 모든 호출이 끝나기를 기다리는 최대 시간(초), 호출마다 따로 적용하지 않습니다.
+    """
+    def __init__(self, logger: logging.Logger, max_workers: int = 10, timeout: float = 30):
+        self.logger = logger
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def run(self, tasks: list[tuple[str, str, Callable[[], MutationResult]]]) -> list[MutationResult]:
+        """
+        (리소스 종류, 리소스 ID, 호출 함수) 목록을 동시에 실행하고 결과를 순서대로 반환합니다.
+
+        제한 시간(timeout)은 호출마다가 아니라 모든 호출에 함께 적용되므로, 호출이 많아도 Slack 응답은 timeout 안에 끝납니다.
+        호출 함수에서 처리하지 못한 예외와 제한 시간이 지나도록 시작하지 못한 호출은 'error'로 기록합니다.
+        시작했지만 제한 시간 안에 끝나지 않은 호출은 요청이 이미 반영되었을 수 있으므로 'unknown'으로 기록합니다.
+        """
+        if not tasks:
+            return []
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks)))
+        try:
+            futures = [
+                (resource_type, resource_id, executor.submit(func))
+                for resource_type, resource_id, func in tasks
+            ]
+            concurrent.futures.wait([future for _, _, future in futures], timeout=self.timeout)
+
+            results = []
+            for resource_type, resource_id, future in futures:
+                # 아직 대기 중인 호출은 취소되므로 AWS에 요청이 전달되지 않았습니다.
+                if future.cancel():
+                    self.logger.error(f'{resource_type} {resource_id} 호출을 {self.timeout}초 안에 시작하지 못했습니다.')
+                    results.append(MutationResult(resource_type, resource_id, MutationResult.ERROR, 'not attempted'))
+                    continue
+
+                if not future.done():
+                    self.logger.error(f'{resource_type} {resource_id} 호출이 {self.timeout}초 안에 끝나지 않았습니다.')
+                    results.append(MutationResult(resource_type, resource_id, MutationResult.UNKNOWN, 'timeout'))
+                    continue
+
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f'{resource_type} {resource_id} 처리 중 오류 발생: {e}')
+                    results.append(MutationResult(resource_type, resource_id, MutationResult.ERROR, str(e)))
+
+            return results
+        finally:
+            # 진행 중인 호출 때문에 응답이 늦어지지 않도록 기다리지 않고 종료합니다.
+            # 이미 시작된 호출은 botocore의 연결/응답 제한 시간이 지나면 끝납니다.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+class EC2StateTransition:
+    """여러 EC2 인스턴스를 묶어서 시작/중지하는 클래스입니다.
+
+    대상 인스턴스를 한 번에 모은 뒤 start_instances/stop_instances를 여러 ID로 호출하고,
+    인스턴스별 결과를 MutationResult로 반환합니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        chunk_size (int): 한 번의 API 호출에 담을 인스턴스 ID 수
+    """
+    # action을 수행하려면 인스턴스가 있어야 하는 상태
+    REQUIRED_STATES = {
+        'start': 'stopped',
+        'stop': 'running'
+    }
+
+    def __init__(self, logger: logging.Logger, chunk_size: int = 100):
+        self.logger = logger
+        self.chunk_size = chunk_size
+
+    def transition(self, ec2, action: str, instances: Iterable[dict]) -> list[MutationResult]:
+        """
+        EC2 인스턴스 상태를 변경하는 함수.
+
+        :param ec2: EC2 boto3 client
+        :param action: 'start'는 인스턴스를 시작하고, 'stop'은 인스턴스를 중지합니다.
+        :param instances: describe_instances 결과의 인스턴스 목록
+        """
+        if action not in self.REQUIRED_STATES:
+            self.logger.error(f'EC2 인스턴스 {action}는 존재하지 않는 action입니다.')
+            return []
+
+        required_state = self.REQUIRED_STATES[action]
+        results = []
+        eligible_ids = []
+
+        for instance in instances:
+            instance_id = instance['InstanceId']
+            current_state = instance['State']['Name']
+
+            if current_state != required_state:
+                self.logger.debug(f'EC2 {instance_id} 인스턴스는 {current_state} 상태입니다.')
+                results.append(MutationResult('EC2', instance_id, MutationResult.SKIPPED, current_state))
+            else:
+                eligible_ids.append(instance_id)
+
+        for chunk in chunked(eligible_ids, self.chunk_size):
+            results.extend(self.call(ec2, action, chunk))
+
+        return results
+
+    def call(self, ec2, action: str, instance_ids: list[str]) -> list[MutationResult]:
+        """인스턴스 ID 묶음으로 API를 호출하고, 실패하면 ID별로 다시 호출하여 원인을 분리합니다."""
+        try:
+            if action == 'start':
+                response = ec2.start_instances(InstanceIds=instance_ids)
+                changes = response['StartingInstances']
+            else:
+                response = ec2.stop_instances(InstanceIds=instance_ids)
+                changes = response['StoppingInstances']
+        except ClientError as e:
+            if len(instance_ids) == 1:
+                self.logger.error(f'EC2 {instance_ids[0]} 인스턴스 {action} 실패: {e}')
+                return [MutationResult('EC2', instance_ids[0], MutationResult.ERROR, str(e))]
+
+            # 하나의 ID 때문에 묶음 전체가 실패하므로 ID별로 나누어 다시 시도합니다.
+            self.logger.debug(f'EC2 {len(instance_ids)}개 인스턴스 {action} 실패, 개별 호출로 재시도합니다: {e}')
+            results = []
+            for instance_id in instance_ids:
+                results.extend(self.call(ec2, action, [instance_id]))
+            return results
+
+        results = []
+        for change in changes:
+            previous_state = change['PreviousState']['Name']
+            current_state = change['CurrentState']['Name']
+            self.logger.debug(f'EC2 {change['InstanceId']} 인스턴스 {action}: {previous_state} -> {current_state}')
+            results.append(MutationResult('EC2', change['InstanceId'], MutationResult.SUCCESS, current_state))
+
+        return results
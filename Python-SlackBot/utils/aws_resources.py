@@ -0,0 +1,116 @@
+import logging
+from typing import Iterator
+
+def chunked(values: list, size: int) -> Iterator[list]:
+    """목록을 size 크기의 묶음으로 나눕니다."""
+    for offset in range(0, len(values), size):
+        yield values[offset:offset + size]
+
+class AWSResourceLister:
+    """boto3 paginator로 EC2, RDS, ASG 리소스를 조회하는 클래스입니다.
+
+    ID와 태그 조건은 describe 호출의 Filters/이름 목록으로 전달하여 서버에서 걸러내고,
+    결과는 페이지를 받는 대로 하나씩 반환합니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+    """
+    # Filter 하나에 넣을 수 있는 Values 개수 제한
+    MAX_FILTER_VALUES = 200
+    # DescribeAutoScalingGroups의 AutoScalingGroupNames 개수 제한
+    MAX_ASG_NAMES = 50
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    # EC2
+    def iter_ec2_instances(self, ec2, instances: list = [], filters: list = [], match_names: bool = True) -> Iterator[dict]:
+        """
+        EC2 인스턴스를 하나씩 반환하는 함수.
+
+        :param ec2: EC2 boto3 client
+        :param instances: 조회할 인스턴스 ID 또는 Name 태그 목록. 비어 있으면 전체를 조회합니다.
+        :param filters: 추가로 적용할 describe_instances Filters
+        :param match_names: False이면 instances를 인스턴스 ID로만 찾고 Name 태그는 비교하지 않습니다.
+        """
+        paginator = ec2.get_paginator('describe_instances')
+
+        if not instances:
+            filter_sets = [list(filters)]
+        else:
+            # InstanceIds 파라미터는 존재하지 않는 ID가 하나라도 있으면 호출 전체가 실패하므로
+            # instance-id Filter를 사용합니다. 이름은 tag:Name Filter로 따로 조회합니다.
+            instance_ids = [value for value in instances if value.startswith('i-')]
+            filter_sets = [
+                [{'Name': 'instance-id', 'Values': chunk}, *filters]
+                for chunk in chunked(instance_ids, self.MAX_FILTER_VALUES)
+            ]
+            if match_names:
+                filter_sets += [
+                    [{'Name': 'tag:Name', 'Values': chunk}, *filters]
+                    for chunk in chunked(list(instances), self.MAX_FILTER_VALUES)
+                ]
+
+        seen_ids = set()
+        for filter_set in filter_sets:
+            pages = paginator.paginate(Filters=filter_set) if filter_set else paginator.paginate()
+            for page in pages:
+                for reservation in page['Reservations']:
+                    for instance in reservation['Instances']:
+                        if instance['InstanceId'] in seen_ids:
+                            continue
+
+                        seen_ids.add(instance['InstanceId'])
+                        yield instance
+
+    # RDS
+    def iter_db_instances(self, rds, db_instance_ids: list = [], filters: list = []) -> Iterator[dict]:
+        """
+        RDS 인스턴스를 하나씩 반환하는 함수.
+
+        :param rds: RDS boto3 client
+        :param db_instance_ids: 조회할 DB 인스턴스 식별자 목록. 비어 있으면 전체를 조회합니다.
+        :param filters: 추가로 적용할 describe_db_instances Filters
+        """
+        paginator = rds.get_paginator('describe_db_instances')
+
+        if not db_instance_ids:
+            filter_sets = [list(filters)]
+        else:
+            # DBInstanceIdentifier는 식별자 하나만 받고, 없는 식별자면 DBInstanceNotFound가 발생하므로
+            # 여러 식별자를 한 번에 받는 db-instance-id Filter를 사용합니다.
+            filter_sets = [
+                [{'Name': 'db-instance-id', 'Values': chunk}, *filters]
+                for chunk in chunked(list(db_instance_ids), self.MAX_FILTER_VALUES)
+            ]
+
+        for filter_set in filter_sets:
+            pages = paginator.paginate(Filters=filter_set) if filter_set else paginator.paginate()
+            for page in pages:
+                yield from page['DBInstances']
+
+    # Auto Scaling Group
+    def iter_auto_scaling_groups(self, autoscaling, group_names: list = [], filters: list = []) -> Iterator[dict]:
+        """
+        Auto Scaling 그룹을 하나씩 반환하는 함수.
+
+        :param autoscaling: Auto Scaling boto3 client
+        :param group_names: 조회할 ASG 이름 목록. 비어 있으면 전체를 조회합니다.
+        :param filters: 추가로 적용할 describe_auto_scaling_groups Filters (예: tag:key)
+        """
+        paginator = autoscaling.get_paginator('describe_auto_scaling_groups')
+
+        if not group_names:
+            name_sets = [[]]
+        else:
+            name_sets = list(chunked(list(group_names), self.MAX_ASG_NAMES))
+
+        for name_set in name_sets:
+            params = {}
+            if name_set:
+                params['AutoScalingGroupNames'] = name_set
+            if filters:
+                params['Filters'] = list(filters)
+
+            for page in paginator.paginate(**params):
+                yield from page['AutoScalingGroups']
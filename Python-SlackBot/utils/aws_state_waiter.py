@@ -0,0 +1,142 @@
+import time
+import logging
+import threading
+from utils.aws_client_pool import AWSClientPool
+from utils.aws_resources import AWSResourceLister
+from utils.aws_mutation import MutationResult
+
+class ResourceStateWaiter:
+    """변경을 요청한 EC2, RDS, ASG 리소스가 목표 상태에 도달할 때까지 기다리는 클래스입니다.
+
+    아직 목표 상태가 아닌 리소스만 종류별로 한 번의 describe 호출로 묶어서 조회하고,
+    조회 간격은 지수적으로 늘려 API 호출 수를 줄입니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        client_pool (AWSClientPool): boto3 client 저장소
+        resource_lister (AWSResourceLister): 리소스 조회 클래스
+        initial_delay (float): 첫 조회까지 기다리는 시간(초)
+        max_delay (float): 조회 간격의 최댓값(초)
+        max_wait (float): 전체 대기 시간의 최댓값(초)
+    """
+    # action별 목표 상태
+    EC2_TARGET_STATES = {
+        'start': 'running',
+        'stop': 'stopped'
+    }
+    RDS_TARGET_STATES = {
+        'start': 'available',
+        'stop': 'stopped'
+    }
+    # 목표 상태가 아니어도 더 이상 바뀌지 않는 상태
+    EC2_TERMINAL_STATES = {'terminated'}
+    NOT_FOUND = 'not found'
+
+    def __init__(
+            self,
+            logger: logging.Logger,
+            client_pool: AWSClientPool,
+            resource_lister: AWSResourceLister,
+            initial_delay: float = 5,
+            max_delay: float = 60,
+            max_wait: float = 1800
+        ):
+        self.logger = logger
+        self.client_pool = client_pool
+        self.resource_lister = resource_lister
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        # stop()이 호출되면 기다리던 추적을 바로 끝냅니다.
+        self.stopped = threading.Event()
+
+    def wait(self, action: str, results: list[MutationResult]) -> str:
+        """
+        변경에 성공했거나 결과를 알 수 없는 리소스가 목표 상태가 될 때까지 기다린 뒤 최종 상태를 Slack 메시지로 반환합니다.
+
+        :param action: 'start', 'stop' 또는 ASG 용량 변경처럼 EC2/RDS가 없는 작업 이름
+        :param results: 변경 함수가 반환한 MutationResult 목록
+        """
+        # 제한 시간이 지나 결과를 모르는 호출도 실제로는 반영되었을 수 있으므로 함께 추적합니다.
+        pending = {
+            (result.resource_type, result.resource_id)
+            for result in results if result.status in (MutationResult.SUCCESS, MutationResult.UNKNOWN)
+        }
+        if not pending:
+            return '상태가 변경된 리소스가 없어 완료 추적을 종료합니다.'
+
+        final_states = {}
+        start_time = time.monotonic()
+        delay = self.initial_delay
+
+        while pending:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= self.max_wait:
+                break
+
+            if self.stopped.wait(min(delay, self.max_wait - elapsed)):
+                break
+            delay = min(delay * 2, self.max_delay)
+
+            try:
+                states = self.describe_states(action, pending)
+            except Exception as e:
+                self.logger.error(f'완료 추적 중 상태 조회 오류 발생: {e}')
+                continue
+
+            for key, (state, done) in states.items():
+                final_states[key] = state
+                if done:
+                    pending.discard(key)
+
+            self.logger.debug(f'완료 추적: 남은 리소스 {len(pending)}개')
+
+        elapsed = time.monotonic() - start_time
+        lines = [f"'{action}' 작업 완료 추적 결과 (경과 시간: {elapsed:.1f}초)"]
+        lines += [
+            f'{resource_type} {resource_id}: {state}'
+            for (resource_type, resource_id), state in sorted(final_states.items())
+        ]
+        if pending:
+            lines.append(f'{self.max_wait:.0f}초 안에 목표 상태에 도달하지 못한 리소스: {len(pending)}개')
+
+        return '\n'.join(lines)
+
+    def stop(self):
+        """진행 중인 추적을 다음 조회 전에 끝내고 지금까지의 상태를 반환하게 합니다."""
+        self.stopped.set()
+
+    def describe_states(self, action: str, pending: set[tuple[str, str]]) -> dict:
+        """
+        남은 리소스의 현재 상태와 추적 종료 여부를 종류별로 한 번에 조회합니다.
+        조회 결과에 없는 리소스는 삭제된 것으로 보고 'not found' 상태로 추적을 끝냅니다.
+        """
+        # 조회 결과에 없으면 이 값이 남습니다.
+        states = {key: (self.NOT_FOUND, True) for key in pending}
+
+        ec2_ids = [resource_id for resource_type, resource_id in pending if resource_type == 'EC2']
+        if ec2_ids:
+            ec2 = self.client_pool.get('ec2')
+            for instance in self.resource_lister.iter_ec2_instances(ec2, ec2_ids, match_names=False):
+                state = instance['State']['Name']
+                done = state == self.EC2_TARGET_STATES.get(action) or state in self.EC2_TERMINAL_STATES
+                states[('EC2', instance['InstanceId'])] = (state, done)
+
+        rds_ids = [resource_id for resource_type, resource_id in pending if resource_type == 'RDS']
+        if rds_ids:
+            rds = self.client_pool.get('rds')
+            for db_instance in self.resource_lister.iter_db_instances(rds, rds_ids):
+                state = db_instance['DBInstanceStatus']
+                states[('RDS', db_instance['DBInstanceIdentifier'])] = (state, state == self.RDS_TARGET_STATES.get(action))
+
+        group_names = [resource_id for resource_type, resource_id in pending if resource_type == 'ASG']
+        if group_names:
+            autoscaling = self.client_pool.get('autoscaling')
+            for group in self.resource_lister.iter_auto_scaling_groups(autoscaling, group_names):
+                desired_capacity = group['DesiredCapacity']
+                in_service = sum(1 for instance in group['Instances'] if instance['LifecycleState'] == 'InService')
+                # 축소 중에는 종료 중인 인스턴스가 남아 있으므로 전체 인스턴스 수도 함께 확인합니다.
+                done = in_service == desired_capacity and len(group['Instances']) == desired_capacity
+                states[('ASG', group['AutoScalingGroupName'])] = (f'InService {in_service}/{desired_capacity}', done)
+
+        return states
@@ -0,0 +1,179 @@
+from dataclasses import dataclass, fields
+from typing import ClassVar
+
+def format_bytes(size: float) -> str:
+    if not size:
+        return "0 B"
+
+    # 단위 리스트
+    units = ['B', 'K', 'M', 'G', 'T']
+    index = 0
+
+    while size >= 1024 and index < len(units) - 1:
+        size /= 1024.0
+        index += 1
+
+    # 소수점 한 자리까지 표시
+    return f"{size:.1f} {units[index]}"
+
+@dataclass(frozen=True, slots=True)
+class EC2Status:
+    """EC2 인스턴스 상태 한 건입니다.
+
+    지표 값은 숫자로 보관하며, CloudWatch에 데이터가 없으면 None입니다.
+    """
+    # Slack 메시지와 변경 알림에 표시하는 이름
+    LABELS: ClassVar[dict[str, str]] = {
+        'ec2_id': 'EC2_ID',
+        'state': 'State',
+        'launch_time': 'LaunchTime',
+        'instance_type': 'Type',
+        'private_ip': 'PrivateIpAddress',
+        'public_ip': 'PublicIpAddress',
+        'cpu': 'CPU',
+        'ram': 'RAM',
+        'network_in': 'NetworkIn',
+        'network_out': 'NetworkOut',
+        'name': 'Name'
+    }
+    # 값이 없으면 Slack 메시지에서 생략하는 필드 (Name 태그)
+    OPTIONAL_FIELDS: ClassVar[tuple[str, ...]] = ('name',)
+    METRIC_FIELDS: ClassVar[tuple[str, ...]] = ('cpu', 'ram', 'network_in', 'network_out')
+    # 데이터가 없어지면 알리는 지표, 네트워크 지표는 기본 모니터링에서 데이터가 자주 비므로 알리지 않습니다.
+    ALERT_FIELDS: ClassVar[tuple[str, ...]] = ('cpu', 'ram')
+
+    ec2_id: str
+    state: str
+    launch_time: str
+    instance_type: str
+    private_ip: str | None
+    public_ip: str | None
+    cpu: float | None
+    ram: float | None
+    network_in: float | None
+    network_out: float | None
+    name: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.ec2_id
+
+    @property
+    def display_name(self) -> str:
+        return f'{self.ec2_id}({self.name})' if self.name else self.ec2_id
+
+    def to_sql_row(self) -> tuple:
+        # 지표가 없는 경우 기존과 같이 0으로 저장합니다.
+        return (
+            self.ec2_id,
+            self.state,
+            self.launch_time,
+            self.instance_type,
+            self.private_ip,
+            self.public_ip,
+            self.cpu or 0,
+            self.ram or 0,
+            self.network_in or 0,
+            self.network_out or 0,
+            self.name
+        )
+
+@dataclass(frozen=True, slots=True)
+class RDSStatus:
+    """RDS 인스턴스 상태 한 건입니다."""
+    LABELS: ClassVar[dict[str, str]] = {
+        'rds_identifier': 'RDS_Identifier',
+        'status': 'Status',
+        'instance_class': 'Class',
+        'engine_version': 'EngineVersion'
+    }
+    OPTIONAL_FIELDS: ClassVar[tuple[str, ...]] = ()
+    METRIC_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    rds_identifier: str
+    status: str
+    instance_class: str
+    engine_version: str
+
+    @property
+    def key(self) -> str:
+        return self.rds_identifier
+
+    @property
+    def display_name(self) -> str:
+        return self.rds_identifier
+
+    def to_sql_row(self) -> tuple:
+        return (
+            self.rds_identifier,
+            self.status,
+            self.instance_class,
+            self.engine_version
+        )
+
+@dataclass(frozen=True, slots=True)
+class ASGStatus:
+    """Auto Scaling 그룹 상태 한 건입니다."""
+    LABELS: ClassVar[dict[str, str]] = {
+        'asg_name': 'ASG_NAME',
+        'instances': 'Instances',
+        'desired_capacity': 'DesiredCapacity',
+        'min_size': 'MinSize',
+        'max_size': 'MaxSize',
+        'default_cooldown': 'DefaultCooldown'
+    }
+    OPTIONAL_FIELDS: ClassVar[tuple[str, ...]] = ()
+    METRIC_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    asg_name: str
+    instances: int
+    desired_capacity: int
+    min_size: int
+    max_size: int
+    default_cooldown: int
+
+    @property
+    def key(self) -> str:
+        return self.asg_name
+
+    @property
+    def display_name(self) -> str:
+        return self.asg_name
+
+    def to_sql_row(self) -> tuple:
+        return (
+            self.asg_name,
+            self.instances,
+            self.desired_capacity,
+            self.min_size,
+            self.max_size,
+            self.default_cooldown
+        )
+
+def format_slack_value(field_name: str, value) -> str:
+    """필드 값을 Slack 메시지에 표시할 문자열로 바꿉니다. 레코드는 바꾸지 않습니다."""
+    if field_name in ('cpu', 'ram'):
+        return f'{value:.2f}' if value is not None else '0'
+    if field_name in ('network_in', 'network_out'):
+        return format_bytes(value) if value else '0'
+    return str(value)
+
+def render_slack(records: list) -> str:
+    """상태 레코드 목록을 한 줄에 하나씩 'Label: 값' 형식으로 만듭니다."""
+    formatted_lines = []
+
+    for record in records:
+        values = []
+        for field in fields(record):
+            value = getattr(record, field.name)
+            if value is None and field.name in record.OPTIONAL_FIELDS:
+                continue
+            values.append(f'{record.LABELS[field.name]}: {format_slack_value(field.name, value)}')
+
+        formatted_lines.append(", ".join(values))
+
+    return "\n".join(formatted_lines)
+
+def to_sql_rows(records: list) -> list[tuple]:
+    """상태 레코드 목록을 INSERT 쿼리 파라미터 목록으로 바꿉니다."""
+    return [record.to_sql_row() for record in records]
@@ -0,0 +1,145 @@
+import time
+import heapq
+import logging
+import itertools
+import threading
+from typing import Callable, Hashable
+
+class CommandDispatcher:
+    """Slack 명령을 고정된 수의 작업 스레드에서 우선순위 순서로 실행하는 클래스입니다.
+
+    대기열의 크기가 정해져 있어 요청이 몰려도 스레드와 boto3 client가 늘어나지 않고,
+    같은 key의 명령이 대기 중이거나 실행 중이면 다시 넣지 않습니다.
+    priority 값이 작을수록 먼저 실행하며, 같은 우선순위는 들어온 순서대로 실행합니다.
+    변경 명령이 리소스 잠금을 기다리며 모든 작업 스레드를 차지해도 조회 명령은 status_workers 스레드에서 바로 실행됩니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        workers (int): 모든 명령을 실행할 스레드 수
+        max_queue_size (int): 실행을 기다릴 수 있는 최대 명령 수
+        status_workers (int): STATUS_PRIORITY 명령만 실행할 스레드 수
+    """
+    QUEUED = 'queued'
+    DUPLICATE = 'duplicate'
+    FULL = 'full'
+    CLOSED = 'closed'
+
+    # 조회 명령은 변경 명령보다 먼저 실행합니다.
+    STATUS_PRIORITY = 0
+    MUTATION_PRIORITY = 1
+
+    def __init__(self, logger: logging.Logger, workers: int = 4, max_queue_size: int = 50, status_workers: int = 1):
+        self.logger = logger
+        self.max_queue_size = max_queue_size
+        # (priority, 순번, 넣은 시각, key, func, args)의 힙, _condition으로 보호합니다.
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._in_flight = set()
+        self._closed = False
+        self._stats = {'submitted': 0, 'duplicate': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'running': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+
+        # max_priority가 None이면 모든 명령을, 아니면 그 우선순위 이하의 명령만 실행합니다.
+        self._workers = [
+            threading.Thread(target=self._work, args=(None,), name=f'command-worker-{index}', daemon=True)
+            for index in range(workers)
+        ] + [
+            threading.Thread(target=self._work, args=(self.STATUS_PRIORITY,), name=f'command-status-worker-{index}', daemon=True)
+            for index in range(status_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, key: Hashable, priority: int, func: Callable, *args) -> str:
+        """
+        명령을 대기열에 넣고 결과(QUEUED, DUPLICATE, FULL, CLOSED)를 반환합니다.
+
+        :param key: 중복 확인에 사용할 값, 예: (command, action_type)
+        :param priority: STATUS_PRIORITY 또는 MUTATION_PRIORITY
+        :param func: 작업 스레드에서 실행할 함수
+        :param args: func에 전달할 인자
+        """
+        with self._condition:
+            if self._closed:
+                return self.CLOSED
+            if key in self._in_flight:
+                self._stats['duplicate'] += 1
+                return self.DUPLICATE
+
+            if len(self._queue) >= self.max_queue_size:
+                self._stats['rejected'] += 1
+                self.logger.warning(f'명령 대기열이 가득 찼습니다: {key}')
+                return self.FULL
+
+            heapq.heappush(self._queue, (priority, next(self._sequence), time.monotonic(), key, func, args))
+            self._in_flight.add(key)
+            self._stats['submitted'] += 1
+            # 조회 전용 스레드는 변경 명령을 가져가지 않으므로 모든 스레드를 깨웁니다.
+            self._condition.notify_all()
+            return self.QUEUED
+
+    def _next(self, max_priority: int | None):
+        """실행할 명령을 꺼냅니다. 종료 중이고 이 스레드가 실행할 명령이 없으면 None을 반환합니다."""
+        with self._condition:
+            while True:
+                if self._queue and (max_priority is None or self._queue[0][0] <= max_priority):
+                    item = heapq.heappop(self._queue)
+                    break
+                # 종료 중에도 남은 명령은 모두 실행한 뒤 끝냅니다.
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+            _, _, queued_at, key, _, _ = item
+            wait = time.monotonic() - queued_at
+            self._stats['running'] += 1
+            self._stats['total_wait'] += wait
+            self._stats['max_wait'] = max(self._stats['max_wait'], wait)
+            self.logger.debug(f'{key} 실행 (대기 {wait:.2f}s, 남은 명령 {len(self._queue)}개)')
+            return item
+
+    def _work(self, max_priority: int | None):
+        while True:
+            item = self._next(max_priority)
+            if item is None:
+                return
+
+            _, _, _, key, func, args = item
+            try:
+                func(*args)
+                outcome = 'completed'
+            except Exception as e:
+                self.logger.error(f'{key} 실행 실패: {e}')
+                outcome = 'failed'
+            finally:
+                with self._condition:
+                    self._in_flight.discard(key)
+                    self._stats['running'] -= 1
+                    self._stats[outcome] += 1
+
+    def metrics(self) -> dict:
+        """대기열 길이, 실행 중인 명령 수, 대기 시간 등 현재 통계를 반환합니다."""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['queue_depth'] = len(self._queue)
+
+        started = stats['completed'] + stats['failed'] + stats['running']
+        stats['avg_wait'] = stats.pop('total_wait') / started if started else 0.0
+        return stats
+
+    def shutdown(self, timeout: float = None) -> bool:
+        """
+        새 명령을 받지 않고, 대기 중이거나 실행 중인 명령이 끝날 때까지 기다립니다. 모두 끝나면 True를 반환합니다.
+
+        :param timeout: 최대 대기 시간(초), None이면 끝날 때까지 기다립니다.
+        """
+        # 작업 스레드는 대기열이 빌 때까지 실행한 뒤 스스로 끝나므로 대기열에 아무것도 넣지 않습니다.
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+        return not any(worker.is_alive() for worker in self._workers)
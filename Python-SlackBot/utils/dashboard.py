@@ -2,9 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+import time
+import threading
 import concurrent.futures
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL
 from datetime import datetime, timedelta, timezone
+# streamlit은 이 파일의 디렉터리를 sys.path에 추가하므로 같은 디렉터리의 모듈을 바로 가져옵니다.
+from dashboard_format import add_warning_labels, format_traffic
 
 st.set_page_config(
     page_title='AWeSome 대시보드',
@@ -22,51 +27,152 @@ mysql_config = {
     'password': os.environ['MYSQL_PASSWORD']
 }
 
+# 봇의 상태 저장 방식(STORAGE_MODE)에 맞는 테이블을 조회합니다.
+# delta 저장 방식은 EC2를 지표와 속성을 합친 ec2_status_snapshot 뷰에서, RDS와 ASG를 변경된 시점의 행만 있는 변경 테이블에서 가져옵니다.
+STORAGE_MODE = os.environ.get('STORAGE_MODE', 'full')
+SOURCE_TABLES = {
+    'full': {'ec2': 'ec2_status', 'rds': 'rds_status', 'asg': 'asg_status'},
+    'delta': {'ec2': 'ec2_status_snapshot', 'rds': 'rds_changes', 'asg': 'asg_changes'}
+}
+if STORAGE_MODE not in SOURCE_TABLES:
+    st.error(f"지원하지 않는 STORAGE_MODE입니다: {STORAGE_MODE} ('full' 또는 'delta')")
+    st.stop()
+
+# 프로세스에서 하나의 엔진(연결 풀)을 모든 세션과 재실행이 함께 사용합니다.
+@st.cache_resource
 def get_engine():
-    return create_engine(f"mysql+pymysql://{mysql_config['user']}:{mysql_config['password']}@{mysql_config['host']}:{mysql_config['port']}/{mysql_config['database']}")
+    url = URL.create(
+        'mysql+pymysql',
+        username=mysql_config['user'],
+        password=mysql_config['password'],
+        host=mysql_config['host'],
+        port=int(mysql_config['port']),
+        database=mysql_config['database']
+    )
+    # load_data가 세 쿼리를 동시에 실행하므로 그 이상의 연결을 유지하고, 끊어진 연결은 사용 전에 확인합니다.
+    return create_engine(url, pool_size=5, max_overflow=5, pool_pre_ping=True, pool_recycle=3600)
+
+# 선택한 시간 범위
+TIME_RANGES = {
+    '1시간': timedelta(hours=1),
+    '3시간': timedelta(hours=3),
+    '12시간': timedelta(hours=12),
+    '1일': timedelta(days=1),
+    '3일': timedelta(days=3),
+    '1주': timedelta(weeks=1),
+    '3주': timedelta(weeks=3)
+}
+
+# (조회 기간, 집계 단위(초)), 조회 기간이 이 값 이하이면 해당 단위로 묶습니다. 0은 원본 행을 그대로 사용합니다.
+RESOLUTIONS = [
+    (timedelta(hours=12), 0),
+    (timedelta(days=1), 900),
+    (timedelta(days=3), 1800),
+    (timedelta(weeks=1), 3600),
+    (timedelta(weeks=3), 3 * 3600)
+]
+
+def get_time_window(time_range, start_date=None, end_date=None):
+    """선택한 시간 범위를 UTC 기준 (시작, 끝) 시각으로 바꿉니다."""
+    if time_range == '직접 설정' and start_date and end_date:
+        # KST 날짜 -> UTC
+        start_time = datetime.combine(start_date, datetime.min.time()) - timedelta(hours=9)
+        end_time = datetime.combine(end_date, datetime.max.time()) - timedelta(hours=9)
+        return start_time, end_time
+
+    end_time = datetime.now(timezone.utc).replace(tzinfo=None)
+    return end_time - TIME_RANGES.get(time_range, timedelta(days=30)), end_time
+
+def get_bucket_seconds(start_time, end_time):
+    """조회 기간에 맞는 집계 단위(초)를 반환합니다."""
+    span = end_time - start_time
+    for max_span, bucket_seconds in RESOLUTIONS:
+        if span <= max_span:
+            return bucket_seconds
+    return 6 * 3600
+
+def bucket_column(bucket_seconds):
+    """timestamp를 집계 단위로 내린 KST 시각 컬럼 식을 반환합니다."""
+    if not bucket_seconds:
+        return "CONVERT_TZ(timestamp, '+00:00', '+09:00')"
+    return f"CONVERT_TZ(FROM_UNIXTIME(FLOOR(UNIX_TIMESTAMP(timestamp) / {bucket_seconds}) * {bucket_seconds}), '+00:00', '+09:00')"
+
+# 그래프, 경고, 표에서 사용하는 컬럼만 가져옵니다.
+EC2_ATTRIBUTE_COLUMNS = ['state', 'instance_type', 'private_ip', 'public_ip', 'name']
+EC2_METRIC_COLUMNS = ['cpu_utilization', 'ram_utilization', 'network_in_utilization', 'network_out_utilization']
+RDS_COLUMNS = ['rds_identifier', 'status', 'class', 'engine_version']
+ASG_COLUMNS = ['asg_name', 'instances', 'desired_capacity', 'min_size', 'max_size']
+
+def last_value(column):
+    """구간에서 timestamp가 가장 늦은 행의 값을 고르는 식을 반환합니다.
+
+    Name 태그 값에는 쉼표도 들어갈 수 있으므로 상태, 타입, IP, 태그 값에 나오지 않는 NUL 문자('\\0')로 시간 역순으로 이어 붙인 뒤 첫 값을 고릅니다.
+    group_concat_max_len을 넘으면 뒤쪽이 잘리지만 첫 값만 사용하므로 결과에는 영향이 없습니다.
+    NULL은 빈 문자열로 바꿔 이어 붙이므로 마지막 행의 값이 없으면 NULL을 반환합니다.
+    """
+    return f"NULLIF(SUBSTRING_INDEX(GROUP_CONCAT(COALESCE({column}, '') ORDER BY timestamp DESC SEPARATOR '\\0'), '\\0', 1), '')"
 
 # 데이터베이스에서 데이터 가져오기
-@st.cache_data(ttl=300)  # 5분 캐시
-def load_data(start_date = None, end_date = None):
+def load_data(start_time, end_time, bucket_seconds, table_start_times=None):
+    """UTC 기준 start_time ~ end_time의 데이터를 가져옵니다. bucket_seconds가 0이 아니면 그 단위로 묶습니다.
+
+    Args:
+        table_start_times (tuple): (EC2, RDS, ASG) 테이블별 시작 시각, 지정하면 start_time 대신 사용합니다.
+    """
     engine = get_engine()
+    ec2_start, rds_start, asg_start = table_start_times or (start_time,) * 3
 
-    if start_date and end_date:
-        start_date = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc) - timedelta(hours=9)
-        end_date = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc) - timedelta(hours=9)
-    else:
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=30)
+    # 시간 범위는 DB에서 거르고, 기간이 길면 집계 단위로 묶어서 가져옵니다.
+    time_column = bucket_column(bucket_seconds)
+    # 시각은 바인딩 파라미터로 전달합니다. 집계 단위는 RESOLUTIONS의 정수이므로 쿼리에 직접 넣습니다.
+    time_filter = 'timestamp >= :start_time AND timestamp <= :end_time'
+    tables = SOURCE_TABLES[STORAGE_MODE]
+    # delta 저장 방식의 변경 테이블에서 제거를 기록한 행은 그리지 않습니다.
+    change_filter = f'{time_filter} AND removed = 0' if STORAGE_MODE == 'delta' else time_filter
 
     # UTC -> KST
-    query_ec2 = f"""
-    SELECT ec2_id, state, 
-        CONVERT_TZ(launch_time, '+00:00', '+09:00') AS 'Launch Time (KST)',
-        CONVERT_TZ(timestamp, '+00:00', '+09:00') AS '타임스탬프 (KST)', 
-        instance_type, private_ip, public_ip,
-        cpu_utilization, ram_utilization,
-        network_in_utilization, network_out_utilization, name
-    FROM ec2_status
-    WHERE timestamp >= '{start_date.strftime('%Y-%m-%d %H:%M:%S')}' AND timestamp <= '{end_date.strftime('%Y-%m-%d %H:%M:%S')}'
-    """
-    
+    if bucket_seconds:
+        # 상태와 속성은 구간의 마지막 값, CPU/RAM은 경고가 가려지지 않도록 구간 최댓값, 네트워크는 구간 평균을 사용합니다.
+        attributes = ', '.join(f'{last_value(column)} AS {column}' for column in EC2_ATTRIBUTE_COLUMNS)
+        query_ec2 = f"""
+        SELECT ec2_id, {attributes},
+            {time_column} AS '타임스탬프 (KST)',
+            MAX(cpu_utilization) AS cpu_utilization, MAX(ram_utilization) AS ram_utilization,
+            AVG(network_in_utilization) AS network_in_utilization, AVG(network_out_utilization) AS network_out_utilization
+        FROM {tables['ec2']}
+        WHERE {time_filter}
+        GROUP BY ec2_id, {time_column}
+        """
+    else:
+        query_ec2 = f"""
+        SELECT ec2_id, {', '.join(EC2_ATTRIBUTE_COLUMNS)},
+            {time_column} AS '타임스탬프 (KST)',
+            {', '.join(EC2_METRIC_COLUMNS)}
+        FROM {tables['ec2']}
+        WHERE {time_filter}
+        """
+
+    # RDS, ASG는 구간 안에서 값이 같은 행을 하나로 합칩니다.
+    rds_columns = ', '.join(RDS_COLUMNS)
     query_rds = f"""
-    SELECT rds_identifier, status, class, engine_version, 
-        CONVERT_TZ(timestamp, '+00:00', '+09:00') AS '타임스탬프 (KST)'
-    FROM rds_status
-    WHERE timestamp >= '{start_date.strftime('%Y-%m-%d %H:%M:%S')}' AND timestamp <= '{end_date.strftime('%Y-%m-%d %H:%M:%S')}'
+    SELECT {rds_columns}, {time_column} AS '타임스탬프 (KST)'
+    FROM {tables['rds']}
+    WHERE {change_filter}
+    GROUP BY {rds_columns}, {time_column}
     """
-    
+
+    asg_columns = ', '.join(ASG_COLUMNS)
     query_asg = f"""
-    SELECT asg_name, instances, desired_capacity, min_size, max_size, default_cooldown, 
-        CONVERT_TZ(timestamp, '+00:00', '+09:00') AS '타임스탬프 (KST)'
-    FROM asg_status
-    WHERE timestamp >= '{start_date.strftime('%Y-%m-%d %H:%M:%S')}' AND timestamp <= '{end_date.strftime('%Y-%m-%d %H:%M:%S')}'
+    SELECT {asg_columns}, {time_column} AS '타임스탬프 (KST)'
+    FROM {tables['asg']}
+    WHERE {change_filter}
+    GROUP BY {asg_columns}, {time_column}
     """
 
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        df_ec2_future = executor.submit(pd.read_sql, query_ec2, engine)
-        df_rds_future = executor.submit(pd.read_sql, query_rds, engine)
-        df_asg_future = executor.submit(pd.read_sql, query_asg, engine)
+        df_ec2_future = executor.submit(pd.read_sql, text(query_ec2), engine, params={'start_time': ec2_start, 'end_time': end_time})
+        df_rds_future = executor.submit(pd.read_sql, text(query_rds), engine, params={'start_time': rds_start, 'end_time': end_time})
+        df_asg_future = executor.submit(pd.read_sql, text(query_asg), engine, params={'start_time': asg_start, 'end_time': end_time})
 
         df_ec2 = df_ec2_future.result()
         df_rds = df_rds_future.result()
@@ -74,34 +180,125 @@ def load_data(start_date = None, end_date = None):
 
     return df_ec2, df_rds, df_asg
 
-# 경고/위험
-def add_warning_labels(df):
-    df['CPU 경고'] = df['CPU 사용량'].apply(lambda x: '위험' if x >= 90 else ('경고' if x >= 75 else '정상'))
-    df['RAM 경고'] = df['RAM 사용량'].apply(lambda x: '위험' if x >= 90 else ('경고' if x >= 75 else '정상'))
-    return df
+class IncrementalLoader:
+    """시간 범위별로 마지막으로 가져온 데이터를 보관하고, 새로고침할 때 새로 추가된 행만 가져오는 클래스입니다.
 
-# 시간 필터 함수
-def filter_data_by_time(df, time_range, start_date=None, end_date=None):
-    if time_range == '직접 설정' and start_date and end_date:
-        end_date = datetime.combine(end_date, datetime.max.time())
-        return df[(df['타임스탬프 (KST)'] >= pd.Timestamp(start_date)) & (df['타임스탬프 (KST)'] <= pd.Timestamp(end_date))]
-    
-    now = datetime.now()
-    time_filter = {
-        '1시간': now - timedelta(hours=1),
-        '3시간': now - timedelta(hours=3),
-        '12시간': now - timedelta(hours=12),
-        '1일': now - timedelta(days=1),
-        '3일': now - timedelta(days=3),
-        '1주': now - timedelta(weeks=1),
-        '3주': now - timedelta(weeks=3)
-    }
-    return df[df['타임스탬프 (KST)'] >= time_filter[time_range]]
+    각 테이블에서 가장 최근 시각(집계 중이면 마지막 구간의 시작) 이후만 다시 조회하여 기존 행을 바꾸고,
+    시간 범위를 벗어난 오래된 행은 버립니다. 집계 단위가 바뀌면 전체를 다시 가져옵니다.
+
+    Parameters:
+        refresh_interval (float): 이 시간(초) 안에 다시 요청하면 DB를 조회하지 않고 보관한 데이터를 반환
+        max_entries (int): 보관할 시간 범위의 최대 개수
+    """
+    def __init__(self, refresh_interval=60, max_entries=16):
+        self.refresh_interval = refresh_interval
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        # (time_range, start_date, end_date) -> {'bucket_seconds', 'refreshed_at', 'frames'}
+        self.entries = {}
+        self.stats = {'hit': 0, 'incremental': 0, 'miss': 0, 'rows_fetched': 0}
+
+    def load(self, time_range, start_date=None, end_date=None):
+        start_time, end_time = get_time_window(time_range, start_date, end_date)
+        bucket_seconds = get_bucket_seconds(start_time, end_time)
+        key = (time_range, start_date, end_date)
+
+        # 잠금은 보관한 데이터를 확인하고 바꿀 때만 잡고, DB 조회는 잠금 밖에서 하여 다른 세션이 기다리지 않게 합니다.
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry['bucket_seconds'] == bucket_seconds:
+                if time.monotonic() - entry['refreshed_at'] < self.refresh_interval:
+                    self.stats['hit'] += 1
+                    return entry['frames']
+                cached_frames = entry['frames']
+            else:
+                cached_frames = None
+
+        if cached_frames is not None:
+            frames, rows_fetched = self.refresh(cached_frames, start_time, end_time, bucket_seconds)
+        else:
+            frames = load_data(start_time, end_time, bucket_seconds)
+            rows_fetched = sum(len(df) for df in frames)
+
+        with self.lock:
+            self.stats['incremental' if cached_frames is not None else 'miss'] += 1
+            self.stats['rows_fetched'] += rows_fetched
+
+            self.entries.pop(key, None)
+            self.entries[key] = {'bucket_seconds': bucket_seconds, 'refreshed_at': time.monotonic(), 'frames': frames}
+            # 가장 오래전에 사용한 시간 범위부터 버립니다.
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+
+        return frames
+
+    def refresh(self, frames, start_time, end_time, bucket_seconds):
+        """테이블마다 보관한 데이터의 가장 최근 시각 이후만 다시 가져와 합치고, 범위를 벗어난 행을 버립니다. (데이터, 가져온 행 수)를 반환합니다."""
+        # 타임스탬프 컬럼은 KST입니다.
+        window_start = pd.Timestamp(start_time + timedelta(hours=9))
+        # 테이블마다 저장 주기가 다르므로(delta 저장 방식의 변경 테이블 등) 가장 최근 시각을 따로 구합니다.
+        since = [df['타임스탬프 (KST)'].max() if not df.empty else window_start for df in frames]
+
+        new_frames = load_data(
+            start_time,
+            end_time,
+            bucket_seconds,
+            tuple(max(table_since.to_pydatetime() - timedelta(hours=9), start_time) for table_since in since)
+        )
+
+        merged = []
+        for old, new, table_since in zip(frames, new_frames, since):
+            timestamps = old['타임스탬프 (KST)']
+            old = old[(timestamps >= window_start) & (timestamps < table_since)]
+            merged.append(pd.concat([old, new], ignore_index=True) if not old.empty else new)
+
+        return tuple(merged), sum(len(df) for df in new_frames)
+
+# 모든 세션이 함께 사용하는 증분 로더
+@st.cache_resource
+def get_loader():
+    return IncrementalLoader()
 
 # 데이터 정렬 함수
 def sort_data(df, column, ascending=True):
     return df.sort_values(by=column, ascending=ascending)
 
+# 그래프 하나에 그릴 최대 점 수와 WebGL로 그리기 시작하는 점 수
+POINT_BUDGET = 5000
+WEBGL_THRESHOLD = 1000
+
+def downsample(df, column, point_budget=POINT_BUDGET, group='ec2_id', time_column='타임스탬프 (KST)'):
+    """인스턴스별 시계열을 시간 순서로 구간을 나누어 구간마다 최솟값과 최댓값 행만 남깁니다.
+
+    CPU 또는 RAM 사용량이 75 이상인 행은 항상 남기며, column이 숫자가 아니면 구간의 첫 행을 남깁니다.
+    원래 행 순서(정렬 순서)는 그대로 유지합니다.
+
+    Args:
+        df (pd.DataFrame): EC2 데이터.
+        column (str): 그래프의 y축 컬럼.
+        point_budget (int): 남길 전체 점 수의 목표치.
+
+    Returns:
+        pd.DataFrame: 줄어든 데이터.
+    """
+    if len(df) <= point_budget:
+        return df
+
+    ordered = df.sort_values([group, time_column])
+    groups = ordered.groupby(group, sort=False)
+    # 구간마다 최솟값과 최댓값 두 점을 남기므로 인스턴스별 구간 수는 예산의 절반입니다.
+    buckets_per_group = max(point_budget // max(ordered[group].nunique(), 1) // 2, 10)
+    bucket = groups.cumcount() * buckets_per_group // groups[group].transform('size')
+    bucketed = ordered.groupby([ordered[group], bucket], sort=False)[column]
+
+    if pd.api.types.is_numeric_dtype(ordered[column]):
+        keep = pd.Index(bucketed.idxmin().dropna()).union(pd.Index(bucketed.idxmax().dropna()))
+    else:
+        keep = bucketed.head(1).index
+
+    threshold = (df['CPU 사용량'] >= 75) | (df['RAM 사용량'] >= 75)
+    return df[df.index.isin(keep) | threshold]
+
 st.title('AWeSome팀 인스턴스 대시보드')
 st.header('')  # 간격
 
@@ -131,7 +328,12 @@ if time_range == '직접 설정':
     start_date = st.date_input('시작 날짜', value=(datetime.now() - timedelta(days=7)).date())
     end_date = st.date_input('종료 날짜', value=datetime.now().date())
 
-df_ec2, df_rds, df_asg = load_data(start_date, end_date)  # 데이터 로드
+loader = get_loader()
+df_ec2, df_rds, df_asg = loader.load(time_range, start_date, end_date)  # 선택한 시간 범위의 데이터만 로드
+st.caption(
+    f"데이터 캐시 - 적중: {loader.stats['hit']}, 증분 조회: {loader.stats['incremental']}, "
+    f"전체 조회: {loader.stats['miss']}, 가져온 행: {loader.stats['rows_fetched']:,}"
+)
 df_ec2 = df_ec2.rename(columns={
     'cpu_utilization': 'CPU 사용량',
     'ram_utilization': 'RAM 사용량',
@@ -147,46 +349,35 @@ st.header('EC2 상태')
 sort_column_ec2 = st.selectbox('Sort EC2 by', ['CPU 사용량', 'RAM 사용량', '네트워크 수신 트래픽', '네트워크 송신 트래픽', 'state', 'ec2_id'])  # 정렬 및 필터링 옵션
 sort_ascending_ec2 = st.checkbox('Ascending Order (EC2)', value=True)
 
-df_ec2_filtered = filter_data_by_time(df_ec2, time_range, start_date, end_date)  # 시간 필터 적용 (선택된 날짜 또는 미리 정의된 기간에 맞춰 필터링)
-df_ec2_sorted = sort_data(df_ec2_filtered, sort_column_ec2, sort_ascending_ec2)  # 정렬 적용
+df_ec2_sorted = sort_data(df_ec2, sort_column_ec2, sort_ascending_ec2)  # 정렬 적용
 graph_type_ec2 = st.selectbox('EC2 그래프 타입 선택', ['Scatter Plot', 'Violin Plot'])  # 그래프 타입 선택
 
-def format_traffic(value: float) -> str:
-    """주어진 트래픽 값을 적절한 단위로 변환하여 문자열로 반환합니다.
-
-    Args:
-        value (float): 변환할 트래픽 값 (바이트 단위).
-
-    Returns:
-        str: 변환된 트래픽 값과 해당 단위 (예: '1.23 G').
-    """
-    units = [('PB', 1e15), ('T', 1e12), ('G', 1e9), ('M', 1e6), ('K', 1e3)]
-    for unit, threshold in units:
-        if value >= threshold:
-            return f'{value / threshold:.2f} {unit}'
-    return f'{value:.2f} B'
-    
-df_ec2_sorted['네트워크 수신 트래픽 (형식)'] = df_ec2_sorted['네트워크 수신 트래픽'].apply(format_traffic)
-df_ec2_sorted['네트워크 송신 트래픽 (형식)'] = df_ec2_sorted['네트워크 송신 트래픽'].apply(format_traffic)
-
+df_ec2_sorted['네트워크 수신 트래픽 (형식)'] = format_traffic(df_ec2_sorted['네트워크 수신 트래픽'])
+df_ec2_sorted['네트워크 송신 트래픽 (형식)'] = format_traffic(df_ec2_sorted['네트워크 송신 트래픽'])
 if graph_type_ec2 == 'Scatter Plot':
+    df_ec2_plot = downsample(df_ec2_sorted, sort_column_ec2)  # 점 그래프에는 모양을 유지하며 줄인 데이터를 사용
+    if len(df_ec2_plot) < len(df_ec2_sorted):
+        st.caption(f'그래프에는 {len(df_ec2_sorted):,}개 중 {len(df_ec2_plot):,}개의 점을 표시합니다. (75% 이상 사용량은 모두 표시)')
+
     fig_ec2 = px.scatter(
-        df_ec2_sorted, 
+        df_ec2_plot, 
         x='타임스탬프 (KST)',
         y=sort_column_ec2, 
         title=f'EC2 {sort_column_ec2.capitalize()} 시간에 따른 변화 (Scatter Plot)',
         color='ec2_id',
         hover_data=['CPU 사용량', 'RAM 사용량', 'CPU 경고', 'RAM 경고', 'state', 'instance_type', 'private_ip', 'public_ip', 'name', '네트워크 수신 트래픽 (형식)', '네트워크 송신 트래픽 (형식)', '타임스탬프 (KST)'],
-        color_discrete_sequence=px.colors.qualitative.Dark2  # Set1, Set2, Dark2, Pastel1
+        color_discrete_sequence=px.colors.qualitative.Dark2,  # Set1, Set2, Dark2, Pastel1
+        render_mode='webgl' if len(df_ec2_plot) > WEBGL_THRESHOLD else 'svg'
     )
 elif graph_type_ec2 == 'Violin Plot':
+    # 분포 모양이 바뀌지 않도록 전체 데이터로 그리고, 점은 이상치만 표시합니다.
     fig_ec2 = px.violin(
         df_ec2_sorted,
         y=sort_column_ec2,
         x='ec2_id',
         color='ec2_id',
         box=True,
-        points="all",
+        points='outliers',
         title=f'EC2 {sort_column_ec2.capitalize()} 분포 (Violin Plot)',
         labels={'ec2_id': 'EC2 ID'},
         hover_data=['CPU 사용량', 'RAM 사용량', 'CPU 경고', 'RAM 경고', 'state', 'instance_type', 'private_ip', 'public_ip', 'name', '네트워크 수신 트래픽 (형식)', '네트워크 송신 트래픽 (형식)', '타임스탬프 (KST)'],
@@ -213,7 +404,8 @@ if not df_warning_filtered.empty:
         color='CPU 경고',
         title='CPU 경고 상태 (Scatter Plot)',
         hover_data=['CPU 경고', 'RAM 경고', 'CPU 사용량', 'RAM 사용량', 'state', 'instance_type', 'private_ip', 'public_ip', 'name', '네트워크 수신 트래픽 (형식)', '네트워크 송신 트래픽 (형식)'],
-        color_discrete_map=color_map
+        color_discrete_map=color_map,
+        render_mode='webgl' if (df_ec2_sorted['CPU 사용량'] >= 75).sum() > WEBGL_THRESHOLD else 'svg'
     )
     st.plotly_chart(fig_cpu_warning)
 
@@ -225,7 +417,8 @@ if not df_warning_filtered.empty:
         color='RAM 경고',
         title='RAM 경고 상태 (Scatter Plot)',
         hover_data=['CPU 경고', 'RAM 경고', 'CPU 사용량', 'RAM 사용량', 'state', 'instance_type', 'private_ip', 'public_ip', 'name', '네트워크 수신 트래픽 (형식)', '네트워크 송신 트래픽 (형식)'],
-        color_discrete_map=color_map
+        color_discrete_map=color_map,
+        render_mode='webgl' if (df_ec2_sorted['RAM 사용량'] >= 75).sum() > WEBGL_THRESHOLD else 'svg'
     )
     st.plotly_chart(fig_ram_warning)
 
@@ -242,8 +435,7 @@ st.header('RDS 상태')
 
 sort_column_rds = st.selectbox('Sort RDS by', ['status', 'class', 'engine_version', 'rds_identifier'])
 sort_ascending_rds = st.checkbox('Ascending Order (RDS)', value=True)
-df_rds_filtered = filter_data_by_time(df_rds, time_range, start_date, end_date)
-df_rds_sorted = sort_data(df_rds_filtered, sort_column_rds, sort_ascending_rds)
+df_rds_sorted = sort_data(df_rds, sort_column_rds, sort_ascending_rds)
 
 # RDS 그래프 출력
 fig_rds = px.scatter(
@@ -261,8 +453,7 @@ st.header('오토스케일링 그룹 상태')
 
 sort_column_asg = st.selectbox('Sort ASG by', ['instances', 'desired_capacity', 'min_size', 'max_size', 'asg_name'])
 sort_ascending_asg = st.checkbox('Ascending Order (ASG)', value=True)
-df_asg_filtered = filter_data_by_time(df_asg, time_range, start_date, end_date)
-df_asg_sorted = sort_data(df_asg_filtered, sort_column_asg, sort_ascending_asg)
+df_asg_sorted = sort_data(df_asg, sort_column_asg, sort_ascending_asg)
 
 # ASG 그래프 출력
 fig_asg = px.scatter(
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+# 트래픽 단위와 다음 단위로 넘어가는 기준값(바이트), 소수 둘째 자리 문자열
+TRAFFIC_UNITS = np.array([' B', ' K', ' M', ' G', ' T', ' PB'])
+TRAFFIC_THRESHOLDS = np.array([1e3, 1e6, 1e9, 1e12, 1e15])
+TRAFFIC_DIVISORS = np.concatenate(([1.0], TRAFFIC_THRESHOLDS))
+TRAFFIC_DECIMALS = np.array([f'.{cents:02d}' for cents in range(100)])
+
+# 경고/위험
+WARNING_LEVELS = ['정상', '경고', '위험']
+
+def warning_label(values: pd.Series) -> pd.Series:
+    """사용량이 90 이상이면 '위험', 75 이상이면 '경고', 나머지는 '정상'인 범주형 Series를 반환합니다."""
+    codes = np.select([values >= 90, values >= 75], [2, 1], default=0)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=WARNING_LEVELS, ordered=True), index=values.index)
+
+def add_warning_labels(df: pd.DataFrame) -> pd.DataFrame:
+    df['CPU 경고'] = warning_label(df['CPU 사용량'])
+    df['RAM 경고'] = warning_label(df['RAM 사용량'])
+    return df
+
+# 유한하지 않은 값의 키와 표시 문자열, 유한한 값의 키는 0 이상이거나 단위 수의 배수입니다.
+TRAFFIC_MISSING = {-1: 'nan B', -2: 'inf B', -3: '-inf B'}
+
+def format_traffic(values: pd.Series) -> pd.Series:
+    """주어진 트래픽 값들을 적절한 단위로 변환하여 범주형 문자열로 반환합니다.
+
+    Args:
+        values (pd.Series): 변환할 트래픽 값 (바이트 단위).
+
+    Returns:
+        pd.Series: 변환된 트래픽 값과 해당 단위 (예: '1.23 G')의 범주형 Series.
+    """
+    numbers = values.to_numpy(dtype=float)
+    missing = ~np.isfinite(numbers)
+
+    # 값 이하인 기준값의 개수가 단위의 위치입니다.
+    index = np.searchsorted(TRAFFIC_THRESHOLDS, numbers, side='right')
+    index[missing] = 0
+    scaled = numbers / TRAFFIC_DIVISORS[index]
+
+    # 표시 문자열은 (소수 둘째 자리까지의 값, 단위)로 정해지므로 이를 하나의 정수 키로 묶고 서로 다른 키만 문자열로 만듭니다.
+    cents = np.round(np.where(missing, 0, scaled) * 100).astype(np.int64)
+    keys = cents * len(TRAFFIC_UNITS) + index
+    keys[missing] = np.where(np.isnan(numbers[missing]), -1, np.where(numbers[missing] > 0, -2, -3))
+    unique_keys, codes = np.unique(keys, return_inverse=True)
+
+    finite = unique_keys >= 0
+    unique_cents, unique_index = np.divmod(unique_keys[finite], len(TRAFFIC_UNITS))
+    # 문자열 포맷을 값마다 호출하지 않도록 정수부와 소수 둘째 자리를 나누어 이어 붙입니다.
+    labels = np.char.add(np.char.add((unique_cents // 100).astype(str), TRAFFIC_DECIMALS[unique_cents % 100]), TRAFFIC_UNITS[unique_index])
+    categories = [TRAFFIC_MISSING[key] for key in unique_keys[~finite].tolist()] + labels.tolist()
+
+    return pd.Series(pd.Categorical.from_codes(codes.reshape(-1), categories=categories), index=values.index)
@@ -0,0 +1,86 @@
+import time
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+class InventoryCache:
+    """리소스 종류와 조회 범위별로 상태 조회 결과를 메모리에 보관하는 클래스입니다.
+
+    같은 키를 동시에 조회하면 처음 요청한 스레드만 loader를 실행하고,
+    나머지는 그 결과를 함께 기다립니다(single flight).
+    리소스를 변경하면 invalidate로 해당 종류의 결과를 모두 버립니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        ttls (dict[str, float]): 리소스 종류별 보관 시간(초), 예: {'ec2': 120}
+        default_ttl (float): ttls에 없는 리소스 종류의 보관 시간(초)
+    """
+    def __init__(self, logger: logging.Logger, ttls: dict[str, float] = None, default_ttl: float = 300):
+        self.logger = logger
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        # (resource_type, scope) -> (loaded_at, value)
+        self._entries = {}
+        # (resource_type, scope) -> 조회 중인 Future
+        self._in_flight = {}
+        # resource_type -> invalidate 횟수, 조회 도중 변경된 결과를 저장하지 않기 위해 사용합니다.
+        self._generations = {}
+
+    def get(self, resource_type: str, scope: tuple, loader: Callable[[], object], refresh: bool = False):
+        """
+        캐시된 값을 반환하고, 없거나 만료되었으면 loader로 새로 조회합니다.
+
+        :param resource_type: 'ec2', 'rds', 'asg'
+        :param scope: 조회 범위, 전체 조회는 빈 tuple
+        :param loader: 값을 새로 조회하는 함수. 예외가 발생하면 캐시하지 않고 그대로 전달합니다.
+        :param refresh: True이면 캐시된 값을 무시하고 새로 조회하여 저장합니다.
+        """
+        key = (resource_type, scope)
+        ttl = self.ttls.get(resource_type, self.default_ttl)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if not refresh and entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            future = self._in_flight.get(key)
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+                generation = self._generations.get(resource_type, 0)
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            self.logger.debug(f'{resource_type} {scope} 조회가 이미 진행 중이므로 결과를 기다립니다.')
+            return future.result()
+
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if self._generations.get(resource_type, 0) == generation:
+                self._entries[key] = (time.monotonic(), value)
+
+        future.set_result(value)
+        return value
+
+    def invalidate(self, resource_type: str = None):
+        """resource_type의 캐시를 모두 버립니다. 지정하지 않으면 전체를 버립니다."""
+        with self._lock:
+            for key in list(self._entries):
+                if resource_type is None or key[0] == resource_type:
+                    del self._entries[key]
+
+            resource_types = [resource_type] if resource_type else {key[0] for key in self._in_flight} | set(self._generations)
+            for name in resource_types:
+                self._generations[name] = self._generations.get(name, 0) + 1
@@ -0,0 +1,111 @@
+import time
+import pytz
+from datetime import datetime, time as dt_time
+
+def parse_quiet_time(value: str) -> dt_time | None:
+    """'HH:MM' 형식의 문자열을 시각으로 바꿉니다. 값이 없으면 None을 반환합니다."""
+    if not value:
+        return None
+
+    hour, minute = value.split(':')
+    return dt_time(int(hour), int(minute))
+
+class AdaptivePollingPolicy:
+    """모니터링 결과에 따라 다음 조회까지의 간격을 정하는 클래스입니다.
+
+    - 전환 중인 리소스가 있거나 최근에 리소스를 변경했으면 fast_interval로 자주 조회합니다.
+    - 실행 중인 EC2나 사용 가능한 RDS가 있으면 CPU/RAM 지표와 상태 기록이 끊기지 않도록 base_interval을 유지합니다.
+    - 실행 중인 리소스가 없으면 변경이 있을 때 base_interval로 돌아가고, 변경이 없으면 backoff_factor배씩 늘려 idle_interval까지 늦춥니다.
+    - QUIET_HOURS에는 빠르게 조회해야 하는 경우가 아니면 idle_interval로 조회합니다.
+
+    Parameters:
+        quiet_hours_start (str): QUIET_HOURS 시작하는 시간 ('HH:MM')
+        quiet_hours_end (str): QUIET_HOURS 끝나는 시간 ('HH:MM')
+        fast_interval (float): 전환 중이거나 변경 직후의 조회 간격(초)
+        base_interval (float): 기본 조회 간격(초)
+        idle_interval (float): 실행 중인 리소스와 변경이 없을 때의 최대 조회 간격(초)
+        backoff_factor (float): 변경이 없을 때 간격을 늘리는 배수
+        mutation_window (float): 리소스를 변경한 뒤 fast_interval을 유지하는 시간(초)
+        timezone (str): QUIET_HOURS 기준 시간대
+    """
+    # 목표 상태로 바뀌는 중인 상태
+    EC2_TRANSITIONAL_STATES = {'pending', 'stopping', 'shutting-down'}
+    # 지표를 계속 수집해야 하는 상태
+    EC2_ACTIVE_STATES = {'running'}
+    RDS_ACTIVE_STATES = {'available'}
+    RDS_STABLE_STATES = {'available', 'stopped', 'failed', 'storage-full', 'incompatible-parameters', 'inaccessible-encryption-credentials'}
+
+    def __init__(
+            self,
+            quiet_hours_start: str = None,
+            quiet_hours_end: str = None,
+            fast_interval: float = 30,
+            base_interval: float = 300,
+            idle_interval: float = 1800,
+            backoff_factor: float = 2,
+            mutation_window: float = 600,
+            timezone: str = 'Asia/Seoul'
+        ):
+        self.quiet_start = parse_quiet_time(quiet_hours_start)
+        self.quiet_end = parse_quiet_time(quiet_hours_end)
+        self.fast_interval = fast_interval
+        self.base_interval = base_interval
+        self.idle_interval = idle_interval
+        self.backoff_factor = backoff_factor
+        self.mutation_window = mutation_window
+        self.timezone = pytz.timezone(timezone)
+        # 변경이 없을 때 늘려가는 간격, None이면 다음 간격은 base_interval입니다.
+        self.idle_backoff = None
+
+    def is_quiet_hours(self, now: datetime = None) -> bool:
+        if self.quiet_start is None or self.quiet_end is None or self.quiet_start == self.quiet_end:
+            return False
+
+        current = (now or datetime.now(self.timezone)).time()
+        if self.quiet_start < self.quiet_end:
+            return self.quiet_start <= current < self.quiet_end
+        # 22:00 ~ 07:00처럼 자정을 넘기는 경우
+        return current >= self.quiet_start or current < self.quiet_end
+
+    def is_transitional(self, ec2_status: list, rds_status: list, asg_status: list) -> bool:
+        """목표 상태로 바뀌는 중인 리소스가 있는지 확인합니다."""
+        return (
+            any(ec2.state in self.EC2_TRANSITIONAL_STATES for ec2 in ec2_status)
+            or any(rds.status not in self.RDS_STABLE_STATES for rds in rds_status)
+            or any(asg.instances != asg.desired_capacity for asg in asg_status)
+        )
+
+    def is_active(self, ec2_status: list, rds_status: list) -> bool:
+        """CPU/RAM 지표를 수집해야 하는 실행 중인 EC2나 사용 가능한 RDS가 있는지 확인합니다."""
+        return (
+            any(ec2.state in self.EC2_ACTIVE_STATES for ec2 in ec2_status)
+            or any(rds.status in self.RDS_ACTIVE_STATES for rds in rds_status)
+        )
+
+    def recently_mutated(self, last_mutation_at: float | None) -> bool:
+        return last_mutation_at is not None and time.monotonic() - last_mutation_at < self.mutation_window
+
+    def next_interval(self, transitional: bool, active: bool, changed: bool, last_mutation_at: float = None, now: datetime = None) -> float:
+        """
+        다음 조회까지의 간격(초)을 반환합니다.
+
+        :param transitional: 전환 중인 리소스가 있는지 여부
+        :param active: 실행 중인 EC2나 사용 가능한 RDS가 있는지 여부
+        :param changed: 이번 조회에서 변경 사항이 있었는지 여부
+        :param last_mutation_at: 마지막으로 리소스를 변경한 time.monotonic() 값
+        :param now: 현재 시각, 지정하지 않으면 timezone 기준 현재 시각
+        """
+        if transitional or self.recently_mutated(last_mutation_at):
+            self.idle_backoff = None
+            return self.fast_interval
+
+        if self.is_quiet_hours(now):
+            return self.idle_interval
+
+        # 변경 이벤트는 상태/IP가 바뀔 때만 생기므로, 실행 중인 리소스가 있으면 변경이 없어도 늦추지 않습니다.
+        if active or changed or self.idle_backoff is None:
+            self.idle_backoff = self.base_interval
+        else:
+            self.idle_backoff = min(self.idle_backoff * self.backoff_factor, self.idle_interval)
+
+        return self.idle_backoff
@@ -0,0 +1,80 @@
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable
+
+class ResourceLockManager:
+    """리소스 종류('ec2', 'rds', 'asg')별로 변경 작업을 직렬화하는 클래스입니다.
+
+    작업은 필요한 리소스 종류를 한 번에 모두 잡으므로 교착 상태가 생기지 않고,
+    겹치는 리소스가 없는 작업은 동시에 실행됩니다. 겹치는 작업은 거절하지 않고 요청한 순서대로 기다립니다.
+    작업 중 예외가 발생해도 잡은 리소스는 항상 해제됩니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+    """
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self._condition = threading.Condition()
+        self._held = set()
+        # 기다리는 작업 (순번, 리소스 종류), 먼저 요청한 작업이 앞에 있습니다.
+        self._waiting = []
+        self._tickets = itertools.count()
+
+    def _can_acquire(self, entry) -> bool:
+        _, resource_types = entry
+        if self._held & resource_types:
+            return False
+
+        # 같은 리소스를 먼저 기다리는 작업이 있으면 순서를 지킵니다.
+        for waiting in self._waiting:
+            if waiting is entry:
+                return True
+            if waiting[1] & resource_types:
+                return False
+        return True
+
+    @contextmanager
+    def hold(self, resource_types, on_wait: Callable[[], None] = None):
+        """
+        resource_types를 모두 잡을 때까지 기다린 뒤 with 블록을 실행하고 해제합니다.
+
+        :param resource_types: 잡을 리소스 종류, 비어 있으면 바로 실행합니다 (조회 명령).
+        :param on_wait: 바로 잡을 수 없어 기다려야 할 때 한 번 호출하는 함수
+        """
+        resource_types = frozenset(resource_types)
+        if not resource_types:
+            yield
+            return
+
+        entry = (next(self._tickets), resource_types)
+        with self._condition:
+            self._waiting.append(entry)
+            must_wait = not self._can_acquire(entry)
+
+        # on_wait는 Slack 전송처럼 느릴 수 있으므로 잠금 밖에서 호출합니다.
+        if must_wait:
+            self.logger.debug(f'{sorted(resource_types)} 작업 대기')
+            if on_wait:
+                try:
+                    on_wait()
+                except Exception as e:
+                    self.logger.error(f'대기 알림 실패: {e}')
+
+        with self._condition:
+            try:
+                while not self._can_acquire(entry):
+                    self._condition.wait()
+            finally:
+                self._waiting.remove(entry)
+                # 대기열이 바뀌었으므로 뒤에서 기다리던 작업도 다시 확인합니다.
+                self._condition.notify_all()
+            self._held |= resource_types
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._held -= resource_types
+                self._condition.notify_all()
@@ -0,0 +1,122 @@
+import os
+import fcntl
+import asyncio
+import logging
+import threading
+import concurrent.futures
+
+class LeaderLock:
+    """여러 작업 프로세스 중 하나만 스케줄러를 실행하도록 파일 잠금으로 리더를 정하는 클래스입니다.
+
+    잠금은 프로세스가 종료되면 운영체제가 자동으로 해제하므로, 리더가 비정상 종료해도 다음에 시작하는 프로세스가 리더가 됩니다.
+    같은 호스트(Pod)의 프로세스끼리만 조정하며, 잠금 파일에는 리더의 PID를 기록합니다.
+
+    Parameters:
+        path (str): 잠금 파일 경로
+        logger (logging.Logger): 로깅을 위한 Logger
+    """
+    def __init__(self, path: str, logger: logging.Logger):
+        self.path = path
+        self.logger = logger
+        self._file = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """잠금을 기다리지 않고 시도하여 리더가 되면 True를 반환합니다."""
+        if self.is_leader:
+            return True
+
+        file = open(self.path, 'a+')
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return False
+
+        file.seek(0)
+        file.truncate()
+        file.write(str(os.getpid()))
+        file.flush()
+        self._file = file
+        self.logger.info(f'PID {os.getpid()} 프로세스가 스케줄러 리더가 되었습니다.')
+        return True
+
+    def release(self):
+        if not self.is_leader:
+            return
+
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+class EventLoopThread:
+    """asyncio 이벤트 루프를 전용 스레드에서 실행하는 클래스입니다.
+
+    WSGI 서버의 작업 프로세스에는 실행 중인 이벤트 루프가 없으므로 AsyncIOScheduler를 이 루프에 연결하여 실행합니다.
+
+    Parameters:
+        name (str): 스레드 이름
+    """
+    def __init__(self, name: str = 'event-loop'):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+        # 멈춘 뒤 남은 작업을 취소하고 루프를 닫습니다.
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """이미 예약된 콜백을 실행한 뒤 루프를 멈추고 스레드가 끝날 때까지 기다립니다."""
+        if not self._thread.is_alive():
+            return
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+class DrainableExecutor(concurrent.futures.ThreadPoolExecutor):
+    """종료할 때 실행 중인 작업을 정해진 시간까지만 기다릴 수 있는 ThreadPoolExecutor입니다.
+
+    shutdown(wait=True)는 멈춘 AWS 호출 하나 때문에 끝없이 기다릴 수 있으므로, 제출한 작업 중 끝나지 않은 것을 보관했다가
+    drain에서 대기 중인 작업은 취소하고 실행 중인 작업만 timeout까지 기다립니다.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        future = super().submit(fn, *args, **kwargs)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: concurrent.futures.Future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        새 작업을 받지 않고 대기 중인 작업은 취소한 뒤, 실행 중인 작업이 끝나기를 기다립니다. 모두 끝나면 True를 반환합니다.
+
+        :param timeout: 최대 대기 시간(초), None이면 끝날 때까지 기다립니다.
+        """
+        self.shutdown(wait=False, cancel_futures=True)
+        with self._pending_lock:
+            pending = list(self._pending)
+
+        _, not_done = concurrent.futures.wait(pending, timeout=timeout)
+        return not not_done
@@ -0,0 +1,100 @@
+import time
+import logging
+import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+class SlackDelivery:
+    """Slack response_url로 메시지를 보내는 클래스입니다.
+
+    하나의 requests.Session을 재사용하여 keep-alive 연결을 유지하므로 메시지마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    post()는 작업 스레드에서 전송하고 바로 반환하므로 Flask 핸들러가 Slack의 3초 응답 제한 안에 200을 반환할 수 있습니다.
+    429 응답은 Retry-After만큼 기다린 뒤, 연결 오류와 5xx 응답은 retry_delay부터 2배씩 늘려 기다린 뒤 다시 보냅니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        workers (int): 메시지를 보낼 스레드 수
+        pool_size (int): 유지할 HTTP 연결 수
+        timeout (float): 요청 한 번의 제한 시간(초)
+        max_attempts (int): 재시도를 포함한 최대 전송 횟수
+        retry_delay (float): 첫 재시도까지 기다리는 시간(초)
+        max_retry_after (float): 429 응답의 Retry-After를 따를 최대 시간(초)
+    """
+    def __init__(
+            self,
+            logger: logging.Logger,
+            workers: int = 4,
+            pool_size: int = 10,
+            timeout: float = 5,
+            max_attempts: int = 3,
+            retry_delay: float = 1,
+            max_retry_after: float = 30
+        ):
+        self.logger = logger
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_after = max_retry_after
+
+        # urllib3 연결 풀은 스레드 간에 공유해도 안전하므로 모든 작업 스레드가 같은 Session을 사용합니다.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='slack-delivery')
+
+    def post(self, url: str, payload: dict) -> Future:
+        """
+        작업 스레드에서 메시지를 보내도록 넘기고 바로 반환합니다. Future의 결과는 send()의 반환값입니다.
+
+        :param url: Slack response_url
+        :param payload: 보낼 메시지 (예: {'text': '...'})
+        """
+        return self.executor.submit(self.send, url, payload)
+
+    def send(self, url: str, payload: dict) -> bool:
+        """
+        메시지를 보내고 결과를 기다립니다. 재시도 후에도 실패하면 False를 반환합니다.
+
+        :param url: Slack response_url
+        :param payload: 보낼 메시지 (예: {'text': '...'})
+        """
+        delay = self.retry_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = self.session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                reason = str(e)
+                wait = delay
+            else:
+                if response.status_code < 400:
+                    return True
+
+                reason = f'{response.status_code} {response.text}'
+                if response.status_code == 429:
+                    wait = self.retry_after(response, delay)
+                elif response.status_code >= 500:
+                    wait = delay
+                else:
+                    # 잘못된 요청이나 만료된 response_url은 다시 보내도 실패합니다.
+                    break
+
+            if attempt < self.max_attempts:
+                self.logger.warning(f'Slack 메시지 전송 실패 ({attempt}/{self.max_attempts}), {wait:.1f}초 후 재시도: {reason}')
+                time.sleep(wait)
+                delay *= 2
+
+        self.logger.error(f'Slack 메시지 전송 실패: {reason}')
+        return False
+
+    def retry_after(self, response: requests.Response, default: float) -> float:
+        try:
+            wait = float(response.headers.get('Retry-After', default))
+        except ValueError:
+            wait = default
+        return min(max(wait, 0), self.max_retry_after)
+
+    def shutdown(self, wait: bool = True):
+        """남은 메시지를 보낸 뒤 작업 스레드와 연결을 정리합니다."""
+        self.executor.shutdown(wait=wait)
+        self.session.close()
@@ -0,0 +1,130 @@
+import logging
+from typing import Iterable, Iterator
+from slack_sdk import WebClient
+
+# Slack은 메시지 text를 4000자 이내로 권장하고, section 블록의 text는 3000자로 제한합니다.
+MAX_TEXT_LENGTH = 3900
+MAX_SECTION_LENGTH = 3000
+
+def iter_chunks(lines: Iterable[str], limit: int = MAX_TEXT_LENGTH) -> Iterator[str]:
+    """
+    줄 단위로 이어 붙여 limit을 넘지 않는 메시지를 차례로 만듭니다. limit보다 긴 줄은 limit 단위로 자릅니다.
+
+    :param lines: 메시지에 넣을 줄, 생성기이면 필요한 만큼만 읽습니다.
+    :param limit: 메시지 하나의 최대 길이
+    """
+    buffer = []
+    size = 0
+
+    for line in lines:
+        while len(line) > limit:
+            if buffer:
+                yield '\n'.join(buffer)
+                buffer, size = [], 0
+            yield line[:limit]
+            line = line[limit:]
+
+        # 줄바꿈 문자를 포함한 길이
+        if buffer and size + 1 + len(line) > limit:
+            yield '\n'.join(buffer)
+            buffer, size = [], 0
+
+        size += len(line) + (1 if buffer else 0)
+        buffer.append(line)
+
+    if buffer:
+        yield '\n'.join(buffer)
+
+class SlackOutput:
+    """긴 결과를 Slack 제한에 맞게 나누어 보내는 클래스입니다.
+
+    결과는 줄 단위로 읽으면서 메시지를 만들고, 전체 길이가 file_threshold를 넘으면 여러 메시지 대신 파일 하나로 올립니다.
+    stream()은 결과를 구역(리소스 종류)마다 받는 대로 보내므로 느린 조회를 기다리지 않고 먼저 끝난 결과부터 보여 줍니다.
+
+    Parameters:
+        client (WebClient): Slack WebClient
+        logger (logging.Logger): 로깅을 위한 Logger
+        text_limit (int): 메시지 하나의 최대 길이
+        file_threshold (int): 이 길이를 넘으면 파일로 올립니다.
+        use_blocks (bool): 메시지를 Block Kit section 블록(고정폭 글꼴)으로 보낼지 여부
+        filename (str): 파일로 올릴 때의 파일 이름
+    """
+    def __init__(
+            self,
+            client: WebClient,
+            logger: logging.Logger,
+            text_limit: int = MAX_TEXT_LENGTH,
+            file_threshold: int = 12000,
+            use_blocks: bool = False,
+            filename: str = 'status.txt'
+        ):
+        self.client = client
+        self.logger = logger
+        self.use_blocks = use_blocks
+        # 블록은 ``` 로 감싸므로 그만큼 짧게 나눕니다.
+        self.text_limit = min(text_limit, MAX_SECTION_LENGTH - 6) if use_blocks else text_limit
+        self.file_threshold = file_threshold
+        self.filename = filename
+
+    def send(self, channel: str, content: str | Iterable[str]) -> int:
+        """
+        결과를 나누어 보내고 보낸 메시지(또는 파일) 수를 반환합니다.
+
+        :param channel: Slack 채널 ID
+        :param content: 보낼 문자열 또는 줄 목록
+        """
+        if isinstance(content, str):
+            if not content:
+                return 0
+            lines = content.split('\n')
+        else:
+            lines = content
+
+        # file_threshold까지만 모아 두고, 넘으면 나머지를 이어 붙여 파일로 올립니다.
+        chunks = []
+        size = 0
+        iterator = iter_chunks(lines, self.text_limit)
+        for chunk in iterator:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.file_threshold:
+                chunks.extend(iterator)
+                self.upload(channel, '\n'.join(chunks))
+                return 1
+
+        for chunk in chunks:
+            self.post(channel, chunk)
+        return len(chunks)
+
+    def stream(self, channel: str, sections: Iterable[str]) -> int:
+        """
+        sections에서 구역을 받는 대로 보내고 보낸 메시지 수를 반환합니다.
+
+        :param channel: Slack 채널 ID
+        :param sections: 구역별 결과를 차례로 반환하는 생성기
+        """
+        count = 0
+        for section in sections:
+            if section:
+                count += self.send(channel, section)
+        return count
+
+    def post(self, channel: str, text: str):
+        if not self.use_blocks:
+            self.client.chat_postMessage(channel=channel, text=text)
+            return
+
+        # 알림에는 text가, 채널에는 블록이 표시됩니다.
+        blocks = [{'type': 'section', 'text': {'type': 'mrkdwn', 'text': f'```{text}```'}}]
+        self.client.chat_postMessage(channel=channel, text=text.split('\n', 1)[0], blocks=blocks)
+
+    def upload(self, channel: str, content: str):
+        line_count = content.count('\n') + 1
+        self.logger.debug(f'결과가 길어 파일로 올립니다: {len(content)}자, {line_count}줄')
+        self.client.files_upload_v2(
+            channel=channel,
+            content=content,
+            filename=self.filename,
+            title=self.filename,
+            initial_comment=f'결과가 길어 파일로 첨부합니다. ({line_count}줄)'
+        )
@@ -0,0 +1,119 @@
+from operator import attrgetter
+from dataclasses import dataclass, fields
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """두 상태 스냅샷 사이의 변경 사항 한 건입니다.
+
+    Attributes:
+        kind (str): 'added', 'removed', 'field_changed', 'threshold_crossed'
+        resource_type (str): 리소스 종류 ('EC2', 'RDS', 'ASG')
+        record: 현재 레코드, 제거된 경우 이전 레코드
+        field (str): 변경된 필드 이름
+        old_value: 이전 값
+        new_value: 현재 값
+    """
+    ADDED = 'added'
+    REMOVED = 'removed'
+    FIELD_CHANGED = 'field_changed'
+    THRESHOLD_CROSSED = 'threshold_crossed'
+
+    kind: str
+    resource_type: str
+    record: object
+    field: str | None = None
+    old_value: object = None
+    new_value: object = None
+
+    @property
+    def resource_id(self) -> str:
+        return self.record.key
+
+class SnapshotDiffer:
+    """key로 구분되는 상태 레코드 목록 두 개를 비교하여 ChangeEvent를 만드는 클래스입니다.
+
+    지표 필드(metric_fields)는 값이 바뀔 때마다 알리지 않고, alert_fields의 데이터가 없어졌을 때와
+    thresholds를 넘었을 때만 알립니다. 한 번 임계값을 넘어 알린 필드는 값이
+    threshold - hysteresis 아래로 내려가야 다시 알릴 수 있으므로 임계값 근처에서 반복 알림이 생기지 않습니다.
+
+    Parameters:
+        resource_type (str): 리소스 종류 ('EC2', 'RDS', 'ASG')
+        metric_fields (tuple[str, ...]): 지표 필드 이름
+        alert_fields (tuple[str, ...]): 데이터가 없어지면 알릴 지표 필드, 지정하지 않으면 metric_fields 전체
+        thresholds (dict[str, float]): 임계값을 확인할 지표 필드와 값
+        hysteresis (float): 알림을 해제하기 위해 임계값 아래로 내려가야 하는 폭
+    """
+    def __init__(
+            self,
+            resource_type: str,
+            metric_fields: tuple[str, ...] = (),
+            alert_fields: tuple[str, ...] = None,
+            thresholds: dict[str, float] = None,
+            hysteresis: float = 0
+        ):
+        self.resource_type = resource_type
+        self.metric_fields = metric_fields
+        self.alert_fields = metric_fields if alert_fields is None else alert_fields
+        self.thresholds = thresholds or {}
+        self.hysteresis = hysteresis
+        # 임계값을 넘어 알림을 보낸 (key, field)
+        self.alerted = set()
+
+    def diff(self, old_records: list, new_records: list) -> list[ChangeEvent]:
+        """
+        이전 스냅샷과 현재 스냅샷을 비교하여 변경 사항을 현재 스냅샷 순서대로 반환합니다.
+        한 리소스 안에서는 속성 필드, 데이터가 없어진 지표, 임계값 순서이며 제거된 리소스는 마지막에 이전 스냅샷 순서대로 반환합니다.
+        """
+        records = new_records or old_records
+        if not records:
+            return []
+
+        attribute_fields = [field.name for field in fields(records[0]) if field.name not in self.metric_fields]
+        # 속성 필드 값을 한 번에 튜플로 읽어 비교하고, 다를 때만 필드별로 확인합니다.
+        get_attributes = attrgetter(*attribute_fields) if len(attribute_fields) > 1 else (lambda record: (getattr(record, attribute_fields[0]),))
+        # 지표 필드는 매 조회마다 바뀌므로 알림 대상 필드만 확인합니다.
+        alert_fields = [field for field in self.metric_fields if field in self.alert_fields]
+        # 임계값 필드마다 (이름, 임계값, 알림 해제 기준)
+        threshold_checks = [(field, threshold, threshold - self.hysteresis) for field, threshold in self.thresholds.items()]
+        alerted = self.alerted
+        old_by_key = {record.key: record for record in old_records}
+        new_keys = set()
+
+        events = []
+        for record in new_records:
+            key = record.key
+            new_keys.add(key)
+            old_record = old_by_key.get(key)
+            if old_record is None:
+                events.append(ChangeEvent(ChangeEvent.ADDED, self.resource_type, record))
+            else:
+                old_values = get_attributes(old_record)
+                new_values = get_attributes(record)
+                if old_values != new_values:
+                    for field, old_value, new_value in zip(attribute_fields, old_values, new_values):
+                        if old_value != new_value:
+                            events.append(ChangeEvent(ChangeEvent.FIELD_CHANGED, self.resource_type, record, field, old_value, new_value))
+
+                # 지표 필드는 값이 바뀔 때마다 알리지 않고 데이터가 없어진 경우만 알립니다.
+                for field in alert_fields:
+                    old_value = getattr(old_record, field)
+                    if old_value is not None and getattr(record, field) is None:
+                        events.append(ChangeEvent(ChangeEvent.FIELD_CHANGED, self.resource_type, record, field, old_value, None))
+
+            for field, threshold, release in threshold_checks:
+                value = getattr(record, field)
+                # 데이터가 없어졌거나 해제 기준 아래로 내려가면 다시 알릴 수 있게 합니다.
+                if value is None or value < release:
+                    if alerted:
+                        alerted.discard((key, field))
+                elif value >= threshold and (key, field) not in alerted:
+                    alerted.add((key, field))
+                    events.append(ChangeEvent(ChangeEvent.THRESHOLD_CROSSED, self.resource_type, record, field, None, value))
+
+        events += [
+            ChangeEvent(ChangeEvent.REMOVED, self.resource_type, record)
+            for record in old_records if record.key not in new_keys
+        ]
+        self.alerted = {(key, field) for key, field in alerted if key in new_keys}
+
+        return events
@@ -0,0 +1,282 @@
+import math
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+def floor_time(value: datetime, seconds: int) -> datetime:
+    """value를 seconds 단위 구간의 시작 시각으로 내립니다."""
+    epoch = datetime(1970, 1, 1, tzinfo=value.tzinfo)
+    return epoch + timedelta(seconds=(value - epoch) // timedelta(seconds=seconds) * seconds)
+
+def percentile(sorted_values: list[float], rank: float) -> float:
+    """정렬된 값 목록에서 nearest-rank 방식으로 백분위 값을 구합니다."""
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+def utc_now() -> datetime:
+    # 원본 timestamp는 UTC이며 시간대 정보가 없는 값으로 읽힙니다.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def to_datetime(value) -> datetime:
+    # sqlite3는 TIMESTAMP 컬럼을 문자열로 반환합니다.
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+class StatusRollup:
+    """EC2 지표 원본 행을 1시간, 1일 단위로 집계하고 오래된 원본 행을 지우는 클래스입니다.
+
+    집계는 끝난 구간만 대상으로 하며, 마지막으로 집계한 구간의 끝(watermark)을 rollup_watermark에 저장합니다.
+    구간마다 기존 집계 행을 지우고 다시 넣은 뒤 watermark와 함께 커밋하므로 재시작하거나 같은 구간을 다시 집계해도 결과가 같습니다.
+    원본 행은 (ec2_id, timestamp) 순서로 fetch_size개씩 나누어 읽고, 메모리에는 집계 중인 구간 하나의 값만 보관합니다.
+    원본 행은 raw_retention_days가 지났고 모든 집계가 끝난 행만 delete_slice 단위로 나누어 지웁니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        connection_factory (Callable): DB-API 연결을 반환하는 함수
+        placeholder (str): 쿼리 파라미터 표시 ('%s', sqlite3는 '?')
+        source_table (str): 원본 지표 테이블 ('ec2_status' 또는 delta 저장 방식의 'ec2_metrics')
+        raw_retention_days (int): 원본 행을 보관할 기간(일)
+        delete_slice (timedelta): 한 번의 DELETE로 지울 원본 행의 시간 범위
+        max_windows_per_run (int): 한 번 실행할 때 집계할 최대 조회 구간 수 (밀린 집계를 여러 번에 나누어 처리)
+        fetch_size (int): 원본 행을 한 번에 읽어 오는 행 수
+    """
+    # 집계 이름 -> (테이블 이름, 구간 길이(초))
+    BUCKETS = {
+        '1h': ('ec2_status_1h', 3600),
+        '1d': ('ec2_status_1d', 86400)
+    }
+    # (집계 컬럼 접두사, 원본 컬럼)
+    METRICS = (
+        ('cpu', 'cpu_utilization'),
+        ('ram', 'ram_utilization'),
+        ('network_in', 'network_in_utilization'),
+        ('network_out', 'network_out_utilization')
+    )
+    AGGREGATES = ('min', 'avg', 'max', 'p95')
+    # 원본 행을 한 번에 읽어 오는 최대 시간 범위(초)
+    WINDOW_SECONDS = 86400
+
+    def __init__(
+            self,
+            logger: logging.Logger,
+            connection_factory: Callable,
+            placeholder: str = '%s',
+            source_table: str = 'ec2_status',
+            raw_retention_days: int = 30,
+            delete_slice: timedelta = timedelta(hours=1),
+            max_windows_per_run: int = 48,
+            fetch_size: int = 5000
+        ):
+        self.logger = logger
+        self.connection_factory = connection_factory
+        self.placeholder = placeholder
+        self.source_table = source_table
+        self.raw_retention_days = raw_retention_days
+        self.delete_slice = delete_slice
+        self.max_windows_per_run = max_windows_per_run
+        self.fetch_size = fetch_size
+        self.schema_ready = False
+
+    @property
+    def aggregate_columns(self) -> list[str]:
+        return [f'{prefix}_{aggregate}' for prefix, _ in self.METRICS for aggregate in self.AGGREGATES]
+
+    def schema(self) -> list[str]:
+        """집계 테이블과 watermark 테이블을 만드는 MySQL DDL 목록을 반환합니다."""
+        metric_columns = ',\n'.join(f'            {column} DOUBLE' for column in self.aggregate_columns)
+        statements = [
+            f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            ec2_id VARCHAR(32) NOT NULL,
+            bucket_start DATETIME NOT NULL,
+            samples INT NOT NULL,
+{metric_columns},
+            PRIMARY KEY (ec2_id, bucket_start),
+            INDEX idx_{table}_bucket (bucket_start)
+        )
+        """
+            for table, _ in self.BUCKETS.values()
+        ]
+        statements.append("""
+        CREATE TABLE IF NOT EXISTS rollup_watermark (
+            name VARCHAR(64) NOT NULL PRIMARY KEY,
+            bucket_end DATETIME NOT NULL
+        )
+        """)
+        return statements
+
+    def run(self):
+        """모든 집계를 진행한 뒤 보관 기간이 지난 원본 행을 지웁니다. 스케줄 작업으로 호출합니다."""
+        try:
+            if not self.schema_ready:
+                self.execute_statements(self.schema())
+                self.schema_ready = True
+
+            for name in self.BUCKETS:
+                self.rollup(name)
+            self.apply_retention()
+        except Exception as e:
+            self.logger.error(f'지표 집계 실패: {e}')
+
+    def execute_statements(self, statements: list[str]):
+        connection = self.connection_factory()
+        try:
+            cursor = connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            connection.commit()
+            cursor.close()
+        finally:
+            connection.close()
+
+    def watermark_name(self, name: str) -> str:
+        return f'{self.source_table}:{name}'
+
+    def read_watermark(self, cursor, name: str) -> datetime | None:
+        cursor.execute(f'SELECT bucket_end FROM rollup_watermark WHERE name = {self.placeholder}', (self.watermark_name(name),))
+        row = cursor.fetchone()
+        return to_datetime(row[0]) if row else None
+
+    def rollup(self, name: str, now: datetime = None) -> int:
+        """
+        name 집계의 끝난 구간을 watermark부터 차례로 집계하고 저장한 집계 행 수를 반환합니다.
+
+        :param name: '1h' 또는 '1d'
+        :param now: 기준 시각, 지정하지 않으면 현재 UTC 시각 (원본 timestamp와 같은 기준)
+        """
+        table, bucket_seconds = self.BUCKETS[name]
+        end = floor_time(now or utc_now(), bucket_seconds)
+        window = timedelta(seconds=max(self.WINDOW_SECONDS, bucket_seconds))
+        count = 0
+
+        connection = self.connection_factory()
+        try:
+            cursor = connection.cursor()
+            start = self.read_watermark(cursor, name)
+            if start is None:
+                cursor.execute(f'SELECT MIN(timestamp) FROM {self.source_table}')
+                oldest = cursor.fetchone()[0]
+                if oldest is None:
+                    return 0
+                start = floor_time(to_datetime(oldest), bucket_seconds)
+
+            for _ in range(self.max_windows_per_run):
+                if start >= end:
+                    break
+
+                window_end = min(start + window, end)
+                count += self.rollup_window(cursor, name, start, window_end)
+                connection.commit()
+                start = window_end
+
+            cursor.close()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        if count:
+            self.logger.debug(f'{table} 집계 {count}건 저장, watermark: {start}')
+        return count
+
+    def rollup_window(self, cursor, name: str, start: datetime, end: datetime) -> int:
+        """start ~ end 사이의 원본 행을 집계하여 기존 집계 행을 바꾸고 watermark를 end로 옮깁니다. 커밋은 호출한 쪽에서 합니다."""
+        table, bucket_seconds = self.BUCKETS[name]
+        p = self.placeholder
+        source_columns = ', '.join(column for _, column in self.METRICS)
+
+        # 인스턴스별 시간 순서로 읽으면 같은 (ec2_id, 구간 시작)의 행이 연속하므로 구간이 바뀔 때마다 집계합니다.
+        cursor.execute(
+            f'SELECT ec2_id, timestamp, {source_columns} FROM {self.source_table} '
+            f'WHERE timestamp >= {p} AND timestamp < {p} ORDER BY ec2_id, timestamp',
+            (start, end)
+        )
+
+        rows = []
+        key = None
+        samples = None
+        while batch := cursor.fetchmany(self.fetch_size):
+            for ec2_id, timestamp, *values in batch:
+                row_key = (ec2_id, floor_time(to_datetime(timestamp), bucket_seconds))
+                if row_key != key:
+                    if key is not None:
+                        rows.append(self.aggregate_row(key, samples))
+                    key = row_key
+                    samples = [[] for _ in self.METRICS]
+
+                for index, value in enumerate(values):
+                    if value is not None:
+                        samples[index].append(float(value))
+
+        if key is not None:
+            rows.append(self.aggregate_row(key, samples))
+
+        # 같은 구간을 다시 집계해도 결과가 같도록 기존 행을 지우고 넣습니다.
+        cursor.execute(f'DELETE FROM {table} WHERE bucket_start >= {p} AND bucket_start < {p}', (start, end))
+        if rows:
+            columns = ['ec2_id', 'bucket_start', 'samples'] + self.aggregate_columns
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([p] * len(columns))})",
+                rows
+            )
+
+        cursor.execute(f'DELETE FROM rollup_watermark WHERE name = {p}', (self.watermark_name(name),))
+        cursor.execute(f'INSERT INTO rollup_watermark (name, bucket_end) VALUES ({p}, {p})', (self.watermark_name(name), end))
+        return len(rows)
+
+    def aggregate_row(self, key: tuple[str, datetime], samples: list[list[float]]) -> tuple:
+        """(ec2_id, 구간 시작)과 지표별 값 목록으로 집계 테이블의 행을 만듭니다."""
+        ec2_id, bucket_start = key
+        row = [ec2_id, bucket_start, max(len(values) for values in samples)]
+        for values in samples:
+            if values:
+                values.sort()
+                row += [values[0], sum(values) / len(values), values[-1], percentile(values, 95)]
+            else:
+                row += [None] * len(self.AGGREGATES)
+        return tuple(row)
+
+    def apply_retention(self, now: datetime = None) -> int:
+        """
+        보관 기간이 지났고 모든 집계가 끝난 원본 행을 delete_slice 단위로 나누어 지우고, 지운 행 수를 반환합니다.
+
+        :param now: 기준 시각, 지정하지 않으면 현재 UTC 시각
+        """
+        cutoff = (now or utc_now()) - timedelta(days=self.raw_retention_days)
+        p = self.placeholder
+        deleted = 0
+
+        connection = self.connection_factory()
+        try:
+            cursor = connection.cursor()
+            # 아직 집계하지 않은 원본 행은 지우지 않습니다.
+            for name in self.BUCKETS:
+                watermark = self.read_watermark(cursor, name)
+                if watermark is None:
+                    return 0
+                cutoff = min(cutoff, watermark)
+
+            cursor.execute(f'SELECT MIN(timestamp) FROM {self.source_table}')
+            oldest = cursor.fetchone()[0]
+            if oldest is None:
+                return 0
+
+            # 한 번에 지우는 범위를 제한하여 잠금 시간을 짧게 유지하고, 범위마다 커밋합니다.
+            start = to_datetime(oldest)
+            while start < cutoff:
+                slice_end = min(start + self.delete_slice, cutoff)
+                cursor.execute(f'DELETE FROM {self.source_table} WHERE timestamp < {p}', (slice_end,))
+                deleted += max(cursor.rowcount, 0)
+                connection.commit()
+                start = slice_end
+
+            cursor.close()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        if deleted:
+            self.logger.info(f'{self.source_table} 원본 행 {deleted}건 삭제 (기준: {cutoff})')
+        return deleted
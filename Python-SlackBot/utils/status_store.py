@@ -0,0 +1,340 @@
+import time
+import logging
+import threading
+from typing import Callable
+from mysql.connector import errors
+from mysql.connector.pooling import MySQLConnectionPool
+from utils.aws_status import to_sql_rows
+from utils.snapshot_diff import ChangeEvent
+
+def mysql_pool_factory(mysql_config: dict, pool_name: str = 'status_store', pool_size: int = 3) -> Callable:
+    """
+    MySQLConnectionPool에서 연결을 꺼내는 함수를 만듭니다.
+
+    풀은 처음 연결할 때 만들기 때문에 봇을 시작할 때 DB가 없어도 오류가 나지 않고,
+    만들기에 실패하면 다음 호출에서 다시 시도합니다.
+
+    :param mysql_config: mysql.connector.connect에 전달하는 접속 정보
+    :param pool_name: 풀 이름
+    :param pool_size: 풀에 보관할 연결 수
+    """
+    pool = None
+    lock = threading.Lock()
+
+    def connect():
+        nonlocal pool
+        with lock:
+            if pool is None:
+                pool = MySQLConnectionPool(pool_name=pool_name, pool_size=pool_size, pool_reset_session=True, **mysql_config)
+        # 풀에서 꺼낸 연결은 close()하면 풀로 돌아갑니다.
+        return pool.get_connection()
+
+    return connect
+
+class StatusStore:
+    """EC2, RDS, ASG 상태 레코드를 한 트랜잭션으로 저장하는 클래스입니다.
+
+    테이블마다 executemany 한 번으로 여러 행을 넣고(mysql.connector는 multi-row INSERT로 바꿔 보냅니다),
+    연결이 끊기거나 교착 상태처럼 다시 시도하면 성공할 수 있는 오류는 트랜잭션 전체를 다시 실행합니다.
+    connection_factory와 placeholder를 바꾸면 sqlite3 같은 다른 DB-API 연결로도 사용할 수 있습니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        connection_factory (Callable): DB-API 연결을 반환하는 함수
+        placeholder (str): 쿼리 파라미터 표시 ('%s', sqlite3는 '?')
+        transient_errors (tuple): 다시 시도할 예외 종류
+        max_attempts (int): 최대 시도 횟수
+        retry_delay (float): 첫 재시도 전 대기 시간(초), 시도할 때마다 두 배로 늘어납니다.
+    """
+    # 리소스 종류 -> (테이블 이름, 컬럼 목록)
+    TABLES = {
+        'ec2': ('ec2_status', ('ec2_id', 'state', 'launch_time', 'instance_type', 'private_ip', 'public_ip', 'cpu_utilization', 'ram_utilization', 'network_in_utilization', 'network_out_utilization', 'name')),
+        'rds': ('rds_status', ('rds_identifier', 'status', 'class', 'engine_version')),
+        'asg': ('asg_status', ('asg_name', 'instances', 'desired_capacity', 'min_size', 'max_size', 'default_cooldown'))
+    }
+
+    # 연결 끊김, 풀 고갈, 교착 상태(1213), 잠금 대기 시간 초과(1205) 등
+    MYSQL_TRANSIENT_ERRORS = (errors.OperationalError, errors.InterfaceError, errors.InternalError, errors.PoolError)
+
+    def __init__(
+            self,
+            logger: logging.Logger,
+            connection_factory: Callable,
+            placeholder: str = '%s',
+            transient_errors: tuple = MYSQL_TRANSIENT_ERRORS,
+            max_attempts: int = 3,
+            retry_delay: float = 1
+        ):
+        self.logger = logger
+        self.connection_factory = connection_factory
+        self.placeholder = placeholder
+        self.transient_errors = transient_errors
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def insert_query(self, table: str, columns: tuple[str, ...]) -> str:
+        values = ', '.join([self.placeholder] * len(columns))
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({values})"
+
+    def build_batches(self, snapshots: dict[str, list], events: list[ChangeEvent] = None) -> list[tuple[str, list[tuple]]]:
+        """테이블별 (INSERT 쿼리, 행 목록)을 만듭니다. 전체 저장 방식은 events를 사용하지 않습니다."""
+        batches = []
+        for resource_type, (table, columns) in self.TABLES.items():
+            rows = to_sql_rows(snapshots.get(resource_type, []))
+            if rows:
+                batches.append((self.insert_query(table, columns), rows))
+
+        return batches
+
+    def write(self, snapshots: dict[str, list], events: list[ChangeEvent] = None) -> int:
+        """
+        상태 레코드를 모두 저장하고 저장한 행 수를 반환합니다. 끝내 실패하면 로그를 남기고 0을 반환합니다.
+
+        :param snapshots: {'ec2': [EC2Status], 'rds': [RDSStatus], 'asg': [ASGStatus]}
+        :param events: 이전 스냅샷과 비교한 변경 이벤트 (DeltaStatusStore에서 사용)
+        """
+        batches = self.build_batches(snapshots, events)
+        if not batches:
+            return 0
+
+        delay = self.retry_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return self.write_batches(batches)
+            except self.transient_errors as e:
+                if attempt == self.max_attempts:
+                    self.logger.error(f'상태 저장 실패({attempt}회 시도): {e}')
+                    return 0
+
+                self.logger.warning(f'상태 저장 재시도 {attempt}/{self.max_attempts - 1}: {e}')
+                time.sleep(delay)
+                delay *= 2
+            except Exception as e:
+                self.logger.error(f'상태 저장 실패: {e}')
+                return 0
+
+    def write_batches(self, batches: list[tuple[str, list[tuple]]]) -> int:
+        """모든 배치를 한 트랜잭션으로 저장합니다. 실패하면 롤백하고 예외를 그대로 전달합니다."""
+        connection = None
+        cursor = None
+        try:
+            connection = self.connection_factory()
+            cursor = connection.cursor()
+
+            count = 0
+            for query, rows in batches:
+                cursor.executemany(query, rows)
+                count += len(rows)
+
+            connection.commit()
+            return count
+        except Exception:
+            if connection is not None:
+                try:
+                    connection.rollback()
+                except Exception as e:
+                    self.logger.debug(f'롤백 실패: {e}')
+            raise
+        finally:
+            # 끊어진 연결을 닫을 때 나는 오류가 원래 오류를 가리지 않도록 합니다.
+            try:
+                if cursor is not None:
+                    cursor.close()
+                if connection is not None:
+                    connection.close()
+            except Exception as e:
+                self.logger.debug(f'연결 종료 실패: {e}')
+
+class DeltaStatusStore(StatusStore):
+    """지표만 매번 저장하고, 변하지 않는 속성은 바뀌었을 때만 저장하는 클래스입니다.
+
+    EC2 지표는 ec2_metrics에 시계열로 저장하고, EC2 속성(상태, 타입, IP, 이름)과 RDS, ASG는
+    monitor_instances_status에서 계산한 변경 이벤트로 추가, 변경, 제거(removed = 1)된 리소스만 저장합니다.
+    처음 저장할 때와 저장에 실패한 다음에는 빠진 변경이 없도록 모든 속성을 다시 저장합니다.
+    테이블과 뷰는 처음 저장할 때 create_schema로 만들고, 실패하면 다음 저장에서 다시 시도합니다.
+    특정 시점의 스냅샷은 ec2_status_snapshot 뷰나 point_in_time_query로 다시 만듭니다.
+    ec2_status_snapshot 뷰는 ec2_attributes의 (ec2_id, timestamp) 인덱스가 있어야 지표 행마다 한 번의 인덱스 탐색으로 속성을 찾습니다.
+
+    Parameters:
+        logger (logging.Logger): 로깅을 위한 Logger
+        connection_factory (Callable): DB-API 연결을 반환하는 함수
+        **kwargs: StatusStore의 나머지 인자
+    """
+    METRIC_TABLE = ('ec2_metrics', ('ec2_id', 'cpu_utilization', 'ram_utilization', 'network_in_utilization', 'network_out_utilization'))
+
+    # 리소스 종류 -> (테이블 이름, (컬럼 이름, 레코드 필드 이름) 목록), 모든 테이블에 removed 컬럼이 추가됩니다.
+    CHANGE_TABLES = {
+        'ec2': ('ec2_attributes', (('ec2_id', 'ec2_id'), ('state', 'state'), ('launch_time', 'launch_time'), ('instance_type', 'instance_type'), ('private_ip', 'private_ip'), ('public_ip', 'public_ip'), ('name', 'name'))),
+        'rds': ('rds_changes', (('rds_identifier', 'rds_identifier'), ('status', 'status'), ('class', 'instance_class'), ('engine_version', 'engine_version'))),
+        'asg': ('asg_changes', (('asg_name', 'asg_name'), ('instances', 'instances'), ('desired_capacity', 'desired_capacity'), ('min_size', 'min_size'), ('max_size', 'max_size'), ('default_cooldown', 'default_cooldown')))
+    }
+
+    # MySQL 테이블과 뷰, 처음 저장할 때 create_schema로 생성합니다.
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS ec2_metrics (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            ec2_id VARCHAR(32) NOT NULL,
+            cpu_utilization DOUBLE,
+            ram_utilization DOUBLE,
+            network_in_utilization DOUBLE,
+            network_out_utilization DOUBLE,
+            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_ec2_metrics_id_time (ec2_id, timestamp),
+            INDEX idx_ec2_metrics_time (timestamp)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS ec2_attributes (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            ec2_id VARCHAR(32) NOT NULL,
+            state VARCHAR(32),
+            launch_time VARCHAR(64),
+            instance_type VARCHAR(64),
+            private_ip VARCHAR(64),
+            public_ip VARCHAR(64),
+            name VARCHAR(255),
+            removed TINYINT(1) NOT NULL DEFAULT 0,
+            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_ec2_attributes_id_time (ec2_id, timestamp)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rds_changes (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            rds_identifier VARCHAR(64) NOT NULL,
+            status VARCHAR(64),
+            class VARCHAR(64),
+            engine_version VARCHAR(64),
+            removed TINYINT(1) NOT NULL DEFAULT 0,
+            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_rds_changes_id_time (rds_identifier, timestamp)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS asg_changes (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            asg_name VARCHAR(255) NOT NULL,
+            instances INT,
+            desired_capacity INT,
+            min_size INT,
+            max_size INT,
+            default_cooldown INT,
+            removed TINYINT(1) NOT NULL DEFAULT 0,
+            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_asg_changes_id_time (asg_name, timestamp)
+        )
+        """,
+        # 지표 행마다 그 시점의 최신 속성을 붙여 기존 ec2_status와 같은 컬럼으로 보여줍니다.
+        # 속성은 idx_ec2_attributes_id_time을 역순으로 한 행만 읽어 찾습니다. 이 인덱스가 없으면 지표 행마다
+        # ec2_attributes 전체를 읽으므로 지우거나 바꾸면 안 됩니다. (InnoDB 보조 인덱스는 id를 포함하므로 id 정렬도 인덱스로 처리됩니다.)
+        """
+        CREATE OR REPLACE VIEW ec2_status_snapshot AS
+        SELECT m.ec2_id, a.state, a.launch_time, a.instance_type, a.private_ip, a.public_ip,
+            m.cpu_utilization, m.ram_utilization, m.network_in_utilization, m.network_out_utilization,
+            a.name, m.timestamp
+        FROM ec2_metrics m
+        JOIN ec2_attributes a ON a.id = (
+            SELECT a2.id FROM ec2_attributes a2 FORCE INDEX (idx_ec2_attributes_id_time)
+            WHERE a2.ec2_id = m.ec2_id AND a2.timestamp <= m.timestamp
+            ORDER BY a2.timestamp DESC, a2.id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+    def __init__(self, logger: logging.Logger, connection_factory: Callable, **kwargs):
+        super().__init__(logger, connection_factory, **kwargs)
+        # 모든 속성을 저장한 뒤로 변경 이벤트를 빠짐없이 저장했는지 여부
+        self.seeded = False
+        self.schema_ready = False
+
+    def create_schema(self):
+        """delta 저장 방식의 테이블과 뷰를 만듭니다."""
+        connection = self.connection_factory()
+        try:
+            cursor = connection.cursor()
+            for statement in self.SCHEMA:
+                cursor.execute(statement)
+            connection.commit()
+            cursor.close()
+        finally:
+            connection.close()
+
+    def change_row(self, resource_type: str, record, removed: bool = False) -> tuple:
+        _, columns = self.CHANGE_TABLES[resource_type]
+        return tuple(getattr(record, field) for _, field in columns) + (int(removed),)
+
+    def build_batches(self, snapshots: dict[str, list], events: list[ChangeEvent] = None) -> list[tuple[str, list[tuple]]]:
+        batches = []
+
+        table, columns = self.METRIC_TABLE
+        metric_rows = [
+            (ec2.ec2_id, ec2.cpu or 0, ec2.ram or 0, ec2.network_in or 0, ec2.network_out or 0)
+            for ec2 in snapshots.get('ec2', [])
+        ]
+        if metric_rows:
+            batches.append((self.insert_query(table, columns), metric_rows))
+
+        change_rows = {resource_type: {} for resource_type in self.CHANGE_TABLES}
+        if not self.seeded or events is None:
+            for resource_type in self.CHANGE_TABLES:
+                for record in snapshots.get(resource_type, []):
+                    change_rows[resource_type][record.key] = self.change_row(resource_type, record)
+
+        for event in events or []:
+            resource_type = event.resource_type.lower()
+            record = event.record
+            if event.kind == ChangeEvent.REMOVED:
+                change_rows[resource_type][record.key] = self.change_row(resource_type, record, removed=True)
+            elif event.kind == ChangeEvent.ADDED or (event.kind == ChangeEvent.FIELD_CHANGED and event.field not in record.METRIC_FIELDS):
+                # 한 리소스에서 여러 필드가 바뀌어도 현재 속성 전체를 한 행으로 저장합니다.
+                change_rows[resource_type][record.key] = self.change_row(resource_type, record)
+
+        for resource_type, rows in change_rows.items():
+            if rows:
+                table, columns = self.CHANGE_TABLES[resource_type]
+                names = tuple(column for column, _ in columns) + ('removed',)
+                batches.append((self.insert_query(table, names), list(rows.values())))
+
+        return batches
+
+    def write(self, snapshots: dict[str, list], events: list[ChangeEvent] = None) -> int:
+        if not self.schema_ready:
+            try:
+                self.create_schema()
+                self.schema_ready = True
+            except Exception as e:
+                self.logger.error(f'delta 저장 테이블 생성 실패: {e}')
+                self.seeded = False
+                return 0
+
+        count = super().write(snapshots, events)
+        # 저장에 실패하면 이번 변경이 빠지므로 다음에 모든 속성을 다시 저장합니다.
+        self.seeded = count > 0
+        return count
+
+def point_in_time_query(resource_type: str, placeholder: str = '%s') -> str:
+    """
+    delta 저장 방식에서 특정 시점의 리소스 목록을 다시 만드는 쿼리를 반환합니다.
+
+    각 리소스의 그 시점 이전 마지막 변경 행을 가져오며, 제거된 리소스는 제외합니다.
+    쿼리 파라미터는 기준 시각 하나입니다.
+
+    :param resource_type: 'ec2', 'rds', 'asg'
+    :param placeholder: 쿼리 파라미터 표시 ('%s', sqlite3는 '?')
+    """
+    table, columns = DeltaStatusStore.CHANGE_TABLES[resource_type]
+    key_column = columns[0][0]
+    names = ', '.join(f'c.{column}' for column, _ in columns)
+
+    return f"""
+    SELECT {names}, c.timestamp
+    FROM {table} c
+    WHERE c.id = (
+        SELECT c2.id FROM {table} c2
+        WHERE c2.{key_column} = c.{key_column} AND c2.timestamp <= {placeholder}
+        ORDER BY c2.timestamp DESC, c2.id DESC
+        LIMIT 1
+    ) AND c.removed = 0
+    """
@@ -0,0 +1,11 @@
+import os
+import sys
+import importlib.util
+
+# slack-bot.py는 파일 이름에 '-'가 있어 import 문으로 불러올 수 없으므로 경로로 불러옵니다.
+spec = importlib.util.spec_from_file_location('slack_bot', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slack-bot.py'))
+bot = importlib.util.module_from_spec(spec)
+sys.modules['slack_bot'] = bot
+spec.loader.exec_module(bot)
+
+app = bot.app